@@ -1,7 +1,10 @@
 """In-memory cache module for DevOps MCP Server."""
 
+import functools
+import hashlib
 import logging
-from typing import Any, Optional, Dict
+from concurrent.futures import Future
+from typing import Any, Callable, Optional, Dict
 from datetime import datetime, timedelta
 import threading
 
@@ -23,10 +26,21 @@ class CacheManager:
     with self._lock:
       item = self._cache.get(key)
       if item:
-        if datetime.now() < item["expires"]:
+        now = datetime.now()
+        if now < item["expires"]:
           return item["value"]
-        # Auto cleanup expired item
-        del self._cache[key]
+        adaptive_ttl = item.get("adaptive_ttl")
+        if adaptive_ttl and now < item["expires"] + timedelta(seconds=adaptive_ttl):
+          # Drop the value but remember the TTL for one more period, so a
+          # re-fetch right after expiry (the usual case) still adapts
+          self._cache[key] = {
+            "value": None,
+            "expires": item["expires"],
+            "adaptive_ttl": adaptive_ttl,
+          }
+        else:
+          # Auto cleanup expired item
+          del self._cache[key]
       return None
 
   def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
@@ -39,6 +53,38 @@ class CacheManager:
       }
       return True
 
+  def set_adaptive(
+    self, key: str, value: Any, changed: bool, min_ttl: int, max_ttl: int
+  ) -> int:
+    """Set cached value with a TTL that adapts to how often it changes.
+
+    The first TTL for a key is ``min_ttl``. It doubles (up to ``max_ttl``) each
+    time the value is stored unchanged and halves (down to ``min_ttl``) when it
+    changed. The current TTL is kept in the entry itself; once the entry has
+    been expired for longer than that TTL, the key starts over at ``min_ttl``.
+
+    Returns:
+      The TTL in seconds that was applied.
+    """
+    with self._lock:
+      now = datetime.now()
+      item = self._cache.get(key)
+      ttl = item.get("adaptive_ttl") if item else None
+      if ttl is not None and now >= item["expires"] + timedelta(seconds=ttl):
+        ttl = None  # Expired too long ago to carry the TTL over
+      if ttl is None:
+        ttl = min_ttl
+      elif changed:
+        ttl = max(ttl // 2, min_ttl)
+      else:
+        ttl = min(ttl * 2, max_ttl)
+      self._cache[key] = {
+        "value": value,
+        "expires": now + timedelta(seconds=ttl),
+        "adaptive_ttl": ttl,
+      }
+      return ttl
+
   def delete(self, key: str) -> bool:
     """Delete cached value."""
     with self._lock:
@@ -47,6 +93,18 @@ class CacheManager:
         return True
       return False
 
+  def delete_prefix(self, prefix: str) -> int:
+    """Delete every cached value whose key starts with prefix.
+
+    Returns:
+      The number of entries removed.
+    """
+    with self._lock:
+      keys = [key for key in self._cache if key.startswith(prefix)]
+      for key in keys:
+        del self._cache[key]
+      return len(keys)
+
   def clear(self) -> None:
     """Clear all cached values."""
     with self._lock:
@@ -55,3 +113,53 @@ class CacheManager:
 
 # Global cache instance
 cache = CacheManager()
+
+
+def key_digest(value: str) -> str:
+  """Return a short fixed-length digest of a free-form cache key component.
+
+  Used for unbounded parts such as search queries or label lists so cache keys
+  stay short no matter how long the input is.
+  """
+  return hashlib.blake2b(value.encode("utf-8"), digest_size=8).hexdigest()
+
+
+# Calls currently being executed by singleflight, keyed by function and args
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def singleflight(func: Callable) -> Callable:
+  """Collapse concurrent identical calls into a single execution.
+
+  While a call is running, other threads calling the same function with the
+  same arguments wait for it and share its result (or exception) instead of
+  issuing a duplicate request.
+  """
+
+  @functools.wraps(func)
+  def wrapper(*args, **kwargs):
+    key = f"{func.__module__}.{func.__qualname__}:{args!r}:{sorted(kwargs.items())!r}"
+    with _inflight_lock:
+      future = _inflight.get(key)
+      leader = future is None
+      if leader:
+        future = Future()
+        _inflight[key] = future
+    if not leader:
+      logger.debug(f"Waiting for in-flight call {key}")
+      return future.result()
+
+    try:
+      result = func(*args, **kwargs)
+    except BaseException as e:
+      future.set_exception(e)
+      raise
+    else:
+      future.set_result(result)
+      return result
+    finally:
+      with _inflight_lock:
+        _inflight.pop(key, None)
+
+  return wrapper
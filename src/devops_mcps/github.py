@@ -14,6 +14,7 @@ from .utils.github.github_api import (
   gh_search_code,
   gh_get_issue_details,
   gh_get_issue_content,
+  gh_get_issues_content,
 )
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,7 @@ __all__ = [
   "gh_search_code",
   "gh_get_issue_details",
   "gh_get_issue_content",
+  "gh_get_issues_content",
   # Legacy aliases
   "search_repositories",
   "get_current_user_info",
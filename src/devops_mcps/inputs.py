@@ -60,11 +60,6 @@ class SearchCodeInput(BaseModel):
   sort: str = "indexed"
   order: str = "desc"
 
-  @field_validator("sort")
-  @classmethod
-  def sort_must_be_valid(cls, v: str) -> str:
-    return v
-
   @field_validator("order")
   @classmethod
   def order_must_be_valid(cls, v: str) -> str:
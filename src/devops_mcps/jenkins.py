@@ -8,23 +8,18 @@ from .utils.jenkins import (
   set_jenkins_client_for_testing,
   jenkins_get_jobs,
   jenkins_get_build_log,
+  jenkins_get_build_log_tail,
   jenkins_get_all_views,
   jenkins_get_build_parameters,
   jenkins_get_queue,
   jenkins_get_recent_failed_builds,
+  jenkins_get_recent_failed_builds_with_details,
   _to_dict,
 )
 
-# Also re-export the Jenkins client and configuration constants so importing
-# `devops_mcps.jenkins` provides the client object `j` expected elsewhere in
-# the package (for example in `server_setup.initialize_clients`).
-from .utils.jenkins import (
-  j,
-  JENKINS_URL,
-  JENKINS_USER,
-  JENKINS_TOKEN,
-  LOG_LENGTH,
-)
+# The Jenkins client `j` and configuration constants are re-exported through
+# __getattr__ below, so they are only resolved (and the client created) on use.
+from .utils.jenkins.jenkins_client import _CLIENT_ATTRIBUTES, get_client_attribute
 
 logger = logging.getLogger(__name__)
 
@@ -34,15 +29,24 @@ __all__ = [
   "set_jenkins_client_for_testing",
   "jenkins_get_jobs",
   "jenkins_get_build_log",
+  "jenkins_get_build_log_tail",
   "jenkins_get_all_views",
   "jenkins_get_build_parameters",
   "jenkins_get_queue",
   "jenkins_get_recent_failed_builds",
+  "jenkins_get_recent_failed_builds_with_details",
   "_to_dict",
   # Re-exported client and config
-  "j",
-  "JENKINS_URL",
-  "JENKINS_USER",
-  "JENKINS_TOKEN",
-  "LOG_LENGTH",
+  "j",  # noqa: F822 - resolved by __getattr__
+  "JENKINS_URL",  # noqa: F822 - resolved by __getattr__
+  "JENKINS_USER",  # noqa: F822 - resolved by __getattr__
+  "JENKINS_TOKEN",  # noqa: F822 - resolved by __getattr__
+  "LOG_LENGTH",  # noqa: F822 - resolved by __getattr__
 ]
+
+
+def __getattr__(name):
+  """Resolve the client and constants lazily so importing never connects."""
+  if name in _CLIENT_ATTRIBUTES:
+    return get_client_attribute(name)
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,6 +4,7 @@ This module defines all the tool functions that can be registered with the FastM
 Each function is defined separately and then registered via the register_tools function.
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional, Union
 
@@ -186,7 +187,7 @@ async def search_repositories(
   if not query:
     logger.error("Parameter 'query' cannot be empty")
     return {"error": "Parameter 'query' cannot be empty"}
-  return github.gh_search_repositories(query=query)
+  return await asyncio.to_thread(github.gh_search_repositories, query=query)
 
 
 async def github_get_current_user_info() -> Union[Dict[str, Any], Dict[str, str]]:
@@ -196,7 +197,7 @@ async def github_get_current_user_info() -> Union[Dict[str, Any], Dict[str, str]
       User information dictionary or an error dictionary.
   """
   logger.debug("Executing github_get_current_user_info")
-  return github.gh_get_current_user_info()
+  return await asyncio.to_thread(github.gh_get_current_user_info)
 
 
 async def get_file_contents(
@@ -226,7 +227,9 @@ async def get_file_contents(
   if not path:
     logger.error("Parameter 'path' cannot be empty")
     return {"error": "Parameter 'path' cannot be empty"}
-  return github.gh_get_file_contents(owner=owner, repo=repo, path=path, branch=branch)
+  return await asyncio.to_thread(
+    github.gh_get_file_contents, owner=owner, repo=repo, path=path, branch=branch
+  )
 
 
 async def list_commits(
@@ -263,7 +266,8 @@ async def list_commits(
   if not repo:
     logger.error("Parameter 'repo' cannot be empty")
     return {"error": "Parameter 'repo' cannot be empty"}
-  return github.gh_list_commits(
+  return await asyncio.to_thread(
+    github.gh_list_commits,
     owner=owner,
     repo=repo,
     branch=branch,
@@ -310,7 +314,8 @@ async def list_issues(
   if not repo:
     logger.error("Parameter 'repo' cannot be empty")
     return {"error": "Parameter 'repo' cannot be empty"}
-  return github.gh_list_issues(
+  return await asyncio.to_thread(
+    github.gh_list_issues,
     owner=owner,
     repo=repo,
     state=state,
@@ -342,7 +347,7 @@ async def get_repository(
   if not repo:
     logger.error("Parameter 'repo' cannot be empty")
     return {"error": "Parameter 'repo' cannot be empty"}
-  return github.gh_get_repository(owner=owner, repo=repo)
+  return await asyncio.to_thread(github.gh_get_repository, owner=owner, repo=repo)
 
 
 async def search_code(query: str) -> Union[List[Dict[str, Any]], Dict[str, str]]:
@@ -358,7 +363,7 @@ async def search_code(query: str) -> Union[List[Dict[str, Any]], Dict[str, str]]
   if not query:
     logger.error("Parameter 'query' cannot be empty")
     return {"error": "Parameter 'query' cannot be empty"}
-  return github.gh_search_code(query=query)
+  return await asyncio.to_thread(github.gh_search_code, query=query)
 
 
 async def get_github_issue_content(owner: str, repo: str, issue_number: int) -> dict:
@@ -373,7 +378,31 @@ async def get_github_issue_content(owner: str, repo: str, issue_number: int) ->
       Issue content dictionary.
   """
   logger.debug(f"Executing get_github_issue_content for {owner}/{repo}#{issue_number}")
-  return github.gh_get_issue_content(owner, repo, issue_number)
+  return await asyncio.to_thread(github.gh_get_issue_content, owner, repo, issue_number)
+
+
+async def get_github_issues_content(
+  owner: str, repo: str, issue_numbers: List[int]
+) -> Dict[str, Any]:
+  """Get the content of several GitHub issues from one repository in one batch.
+
+  Args:
+      owner: Repository owner.
+      repo: Repository name.
+      issue_numbers: Issue numbers to fetch.
+
+  Returns:
+      Dictionary mapping each issue number to its content, or an error dictionary.
+  """
+  logger.debug(
+    f"Executing get_github_issues_content for {owner}/{repo}#{issue_numbers}"
+  )
+  if not issue_numbers:
+    logger.error("Parameter 'issue_numbers' cannot be empty")
+    return {"error": "Parameter 'issue_numbers' cannot be empty"}
+  return await asyncio.to_thread(
+    github.gh_get_issues_content, owner, repo, issue_numbers
+  )
 
 
 # --- Jenkins Tools ---
@@ -434,6 +463,30 @@ async def get_recent_failed_jenkins_builds(
   return jenkins.jenkins_get_recent_failed_builds(hours=hours)
 
 
+async def get_recent_failed_jenkins_builds_with_details(
+  hours: int = 24, log_lines: int = 50, job_prefix: str = ""
+) -> Union[List[Dict[str, Any]], Dict[str, str]]:
+  """Get recent failed Jenkins builds with their parameters and console log.
+
+  Args:
+      hours: Number of hours to look back (default: 24).
+      log_lines: Number of lines from the end of each console log (default: 50).
+      job_prefix: Only include jobs whose name starts with this prefix (default: all jobs).
+
+  Returns:
+      List of failed build dictionaries or an error dictionary.
+  """
+  logger.debug(
+    f"Executing get_recent_failed_jenkins_builds_with_details for last {hours} hours"
+  )
+  return await asyncio.to_thread(
+    jenkins.jenkins_get_recent_failed_builds_with_details,
+    hours,
+    log_lines,
+    job_prefix,
+  )
+
+
 # --- Artifactory Tools ---
 async def list_artifactory_items(
   repository: str, path: str = "/"
@@ -496,16 +549,28 @@ async def get_artifactory_item_info(
 
 
 # --- Cache Management Tool ---
-async def clear_cache() -> Dict[str, str]:
-  """Clear all cached data from the in-memory cache.
+async def clear_cache(prefix: str = "") -> Dict[str, str]:
+  """Clear cached data from the in-memory cache.
+
+  Args:
+      prefix: Only clear entries whose key starts with this prefix, e.g.
+          "jenkins:recent_failed_builds:" after a build was fixed (default:
+          clear everything).
 
   Returns:
       A dictionary indicating the success status of the cache clearing operation.
   """
-  logger.debug("Executing clear_cache")
+  logger.debug(f"Executing clear_cache with prefix: {prefix!r}")
   try:
     from .cache import cache
 
+    if prefix:
+      removed = cache.delete_prefix(prefix)
+      logger.info(f"Cleared {removed} cache entries with prefix {prefix}")
+      return {
+        "status": "success",
+        "message": f"Cleared {removed} cache entries with prefix {prefix}",
+      }
     cache.clear()
     logger.info("Cache cleared successfully")
     return {"status": "success", "message": "Cache cleared successfully"}
@@ -539,12 +604,14 @@ def register_tools(mcp):
   mcp.tool()(get_repository)
   mcp.tool()(search_code)
   mcp.tool()(get_github_issue_content)
+  mcp.tool()(get_github_issues_content)
 
   # Register Jenkins tools
   mcp.tool()(get_jenkins_jobs)
   mcp.tool()(get_jenkins_build_log)
   mcp.tool()(get_all_jenkins_views)
   mcp.tool()(get_recent_failed_jenkins_builds)
+  mcp.tool()(get_recent_failed_jenkins_builds_with_details)
 
   # Register Artifactory tools
   mcp.tool()(list_artifactory_items)
@@ -78,6 +78,10 @@ def initialize_clients():
         "Running without GitHub authentication. GitHub tools will fail if used."
       )
 
+  # Initialize the Jenkins client now that the environment is loaded, so bad
+  # credentials fail at startup rather than on the first tool call
+  jenkins.initialize_jenkins_client()
+
   # Check if the Jenkins client initialized successfully
   if jenkins.j is None:
     if jenkins.JENKINS_URL and jenkins.JENKINS_USER and jenkins.JENKINS_TOKEN:
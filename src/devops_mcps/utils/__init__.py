@@ -23,50 +23,63 @@ Azure utilities:
 - azure.azure_subscriptions: Subscription management
 """
 
-# Import utility functions from GitHub modules
-from .github.github_client import initialize_github_client
-from .github.github_converters import _to_dict, _handle_paginated_list
-from .github.github_api import (
-  gh_get_current_user_info,
-  gh_search_repositories,
-  gh_get_file_contents,
-  gh_list_commits,
-  gh_list_issues,
-  gh_get_repository,
-  gh_search_code,
-  gh_get_issue_details,
-  gh_get_issue_content,
-)
-
-# Import utility functions from Jenkins modules
-from .jenkins import (
-  initialize_jenkins_client,
-  jenkins_get_jobs,
-  jenkins_get_build_log,
-  jenkins_get_all_views,
-  jenkins_get_build_parameters,
-  jenkins_get_queue,
-  jenkins_get_recent_failed_builds,
-  set_jenkins_client_for_testing,
-)
+import importlib
 
-# Import utility functions from Artifactory modules
-from .artifactory import (
-  artifactory_list_items,
-  artifactory_search_items,
-  artifactory_get_item_info,
-)
+# Lazily resolved attributes (PEP 562): maps each exported name to the module
+# that provides it. Submodules are only imported on first attribute access, so
+# importing this package does not pull in PyGithub, jenkinsapi, Azure SDKs, etc.
+_LAZY_ATTRS = {
+  # GitHub client utilities
+  "initialize_github_client": ".github.github_client",
+  # GitHub converter utilities
+  "_to_dict": ".github.github_converters",
+  "_handle_paginated_list": ".github.github_converters",
+  # GitHub API functions
+  "gh_get_current_user_info": ".github.github_api",
+  "gh_search_repositories": ".github.github_api",
+  "gh_get_file_contents": ".github.github_api",
+  "gh_list_commits": ".github.github_api",
+  "gh_list_issues": ".github.github_api",
+  "gh_get_repository": ".github.github_api",
+  "gh_search_code": ".github.github_api",
+  "gh_get_issue_details": ".github.github_api",
+  "gh_get_issue_content": ".github.github_api",
+  "gh_get_issues_content": ".github.github_api",
+  # Jenkins API functions
+  "initialize_jenkins_client": ".jenkins",
+  "jenkins_get_jobs": ".jenkins",
+  "jenkins_get_build_log": ".jenkins",
+  "jenkins_get_build_log_tail": ".jenkins",
+  "jenkins_get_all_views": ".jenkins",
+  "jenkins_get_build_parameters": ".jenkins",
+  "jenkins_get_queue": ".jenkins",
+  "jenkins_get_recent_failed_builds": ".jenkins",
+  "jenkins_get_recent_failed_builds_with_details": ".jenkins",
+  "set_jenkins_client_for_testing": ".jenkins",
+  # Artifactory API functions
+  "artifactory_list_items": ".artifactory",
+  "artifactory_search_items": ".artifactory",
+  "artifactory_get_item_info": ".artifactory",
+  # Azure API functions
+  "get_azure_credential": ".azure",
+  "get_subscriptions": ".azure",
+  "list_virtual_machines": ".azure",
+  "list_aks_clusters": ".azure",
+}
 
-# Import utility functions from Azure modules
-from .azure import (
-  get_azure_credential,
-  get_subscriptions,
-  list_virtual_machines,
-  list_aks_clusters,
-)
+# Utility modules reachable as attributes (e.g. ``utils.github_client``) but not
+# star-exported; they are only imported and bound when first accessed.
+_LAZY_MODULES = {
+  "github_client": ".github.github_client",
+  "github_converters": ".github.github_converters",
+  "github_api": ".github.github_api",
+  "jenkins": ".jenkins",
+  "artifactory": ".artifactory",
+  "azure": ".azure",
+}
 
-# Export all utility functions
-__all__ = [
+# Export all utility functions (immutable; extended only by editing this tuple)
+__all__ = (
   # GitHub client utilities
   "initialize_github_client",
   # GitHub converter utilities
@@ -82,14 +95,17 @@ __all__ = [
   "gh_search_code",
   "gh_get_issue_details",
   "gh_get_issue_content",
+  "gh_get_issues_content",
   # Jenkins API functions
   "initialize_jenkins_client",
   "jenkins_get_jobs",
   "jenkins_get_build_log",
+  "jenkins_get_build_log_tail",
   "jenkins_get_all_views",
   "jenkins_get_build_parameters",
   "jenkins_get_queue",
   "jenkins_get_recent_failed_builds",
+  "jenkins_get_recent_failed_builds_with_details",
   "set_jenkins_client_for_testing",
   # Artifactory API functions
   "artifactory_list_items",
@@ -100,22 +116,22 @@ __all__ = [
   "get_subscriptions",
   "list_virtual_machines",
   "list_aks_clusters",
-  # GitHub utility modules (for direct access)
-  "github_client",
-  "github_converters",
-  "github_api",
-  # Jenkins utility modules (for direct access)
-  "jenkins",
-  # Artifactory utility modules (for direct access)
-  "artifactory",
-  # Azure utility modules (for direct access)
-  "azure",
-]
+)
+
+
+def __getattr__(name):
+  """Import the providing submodule on first access and cache the result."""
+  if name in _LAZY_MODULES:
+    value = importlib.import_module(_LAZY_MODULES[name], __name__)
+  elif name in _LAZY_ATTRS:
+    module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+    value = getattr(module, name)
+  else:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+  globals()[name] = value
+  return value
+
 
-# Also import the modules themselves for direct access
-from .github import github_client
-from .github import github_converters
-from .github import github_api
-from . import jenkins
-from . import artifactory
-from . import azure
+def __dir__():
+  """List exported names, including those not yet imported."""
+  return sorted(set(globals()).union(__all__))
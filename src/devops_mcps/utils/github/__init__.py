@@ -11,6 +11,7 @@ from .github_api import (
   gh_search_code,
   gh_get_issue_details,
   gh_get_issue_content,
+  gh_get_issues_content,
 )
 
 # Import utility functions
@@ -27,6 +28,7 @@ __all__ = [
   "gh_search_code",
   "gh_get_issue_details",
   "gh_get_issue_content",
+  "gh_get_issues_content",
   "initialize_github_client",
   "_to_dict",
   "_handle_paginated_list",
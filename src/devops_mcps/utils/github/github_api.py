@@ -8,7 +8,12 @@ re-exporting functions from specialized modules for different GitHub operations.
 from .github_user_api import gh_get_current_user_info
 from .github_repository_api import gh_get_file_contents, gh_get_repository
 from .github_search_api import gh_search_repositories, gh_search_code
-from .github_issue_api import gh_list_issues, gh_get_issue_details, gh_get_issue_content
+from .github_issue_api import (
+  gh_list_issues,
+  gh_get_issue_details,
+  gh_get_issue_content,
+  gh_get_issues_content,
+)
 from .github_commit_api import gh_list_commits
 from .github_client import initialize_github_client
 from .github_converters import _to_dict, _handle_paginated_list
@@ -24,6 +29,7 @@ __all__ = [
   "gh_search_code",
   "gh_get_issue_details",
   "gh_get_issue_content",
+  "gh_get_issues_content",
   "initialize_github_client",
   "_to_dict",
   "_handle_paginated_list",
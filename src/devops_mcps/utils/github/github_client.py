@@ -2,6 +2,7 @@
 
 import logging
 import os
+import threading
 from typing import Optional
 
 from github import Github, Auth, GithubException
@@ -13,6 +14,13 @@ g: Optional[Github] = None
 GITHUB_TOKEN = os.environ.get("GITHUB_PERSONAL_ACCESS_TOKEN")
 GITHUB_API_URL = os.environ.get("GITHUB_API_URL")
 
+# Size of the client's HTTP connection pool; concurrent tool calls and comment
+# page fetches share the one client, so keep more than requests' default of 10
+GITHUB_POOL_SIZE = 32
+
+# Serializes client construction so concurrent first calls build one client
+_client_lock = threading.Lock()
+
 
 def initialize_github_client(force: bool = False) -> Optional[Github]:
   """Initialize and return a GitHub client.
@@ -29,6 +37,32 @@ def initialize_github_client(force: bool = False) -> Optional[Github]:
     logger.debug("GitHub client already initialized, returning existing instance.")
     return g
 
+  with _client_lock:
+    # Another thread may have finished initializing while we waited
+    if g is not None and not force:
+      return g
+    return _create_github_client()
+
+
+def github_token_available() -> bool:
+  """Return True if a client is already built or a token is configured to build one.
+
+  Once the shared client exists the environment does not need to be consulted.
+  """
+  return g is not None or bool(os.environ.get("GITHUB_PERSONAL_ACCESS_TOKEN"))
+
+
+def reset_github_client() -> None:
+  """Discard the cached GitHub client, e.g. after its credentials were rejected."""
+  global g
+  with _client_lock:
+    g = None
+
+
+def _create_github_client() -> Optional[Github]:
+  """Build, verify and store the global GitHub client. Caller holds _client_lock."""
+  global g
+
   github_token = os.environ.get("GITHUB_PERSONAL_ACCESS_TOKEN")
   if not github_token:
     logger.error(
@@ -42,10 +76,22 @@ def initialize_github_client(force: bool = False) -> Optional[Github]:
 
     if github_api_url:
       logger.debug(f"Initializing GitHub client with custom API URL: {github_api_url}")
-      g = Github(auth=auth, base_url=github_api_url, timeout=60, per_page=10)
+      g = Github(
+        auth=auth,
+        base_url=github_api_url,
+        timeout=60,
+        per_page=10,
+        pool_size=GITHUB_POOL_SIZE,
+      )
     else:
       logger.debug("Initializing GitHub client with default API URL.")
-      g = Github(auth=auth, base_url="https://api.github.com", timeout=60, per_page=10)
+      g = Github(
+        auth=auth,
+        base_url="https://api.github.com",
+        timeout=60,
+        per_page=10,
+        pool_size=GITHUB_POOL_SIZE,
+      )
 
     # Test the connection
     try:
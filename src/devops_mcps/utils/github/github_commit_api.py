@@ -13,7 +13,7 @@ from github import (
 )
 from github.PaginatedList import PaginatedList
 
-from ...cache import cache
+from ...cache import cache, singleflight
 from ...inputs import ListCommitsInput
 from .github_client import initialize_github_client
 from .github_converters import _handle_paginated_list
@@ -21,6 +21,7 @@ from .github_converters import _handle_paginated_list
 logger = logging.getLogger(__name__)
 
 
+@singleflight
 def gh_list_commits(
   owner: str, repo: str, branch: Optional[str] = None
 ) -> Union[List[Dict[str, Any]], Dict[str, str]]:
@@ -35,7 +36,7 @@ def gh_list_commits(
     logger.debug(f"Returning cached result for {cache_key}")
     return cached
 
-  github_client = initialize_github_client(force=True)
+  github_client = initialize_github_client()
   if not github_client:
     logger.error("gh_list_commits: GitHub client not initialized.")
     return {
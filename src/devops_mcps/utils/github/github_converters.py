@@ -1,6 +1,7 @@
 """GitHub object conversion utilities."""
 
 import logging
+import sys
 from typing import Any, Dict, List
 
 from github.PaginatedList import PaginatedList
@@ -16,6 +17,35 @@ from github.Milestone import Milestone
 
 logger = logging.getLogger(__name__)
 
+# ContentFile fields copied straight from the raw API payload
+_CONTENT_FIELDS = ("type", "name", "path", "size", "html_url")
+
+
+def _content_file_from_raw(raw: Dict[str, Any]) -> Dict[str, Any]:
+  """Builds the ContentFile summary from its raw payload.
+
+  Going through PyGithub properties is slower, and ``obj.repository`` on a
+  directory-listing entry builds a lazy Repository whose ``full_name`` costs
+  an extra GET per item. The repository name is read from the embedded
+  ``repository`` object (search results) or parsed from the API url.
+  """
+  result = {field: raw.get(field) for field in _CONTENT_FIELDS}
+  repo_name = (raw.get("repository") or {}).get("full_name")
+  if not repo_name and "/repos/" in (raw.get("url") or ""):
+    repo_name = "/".join(raw["url"].split("/repos/", 1)[1].split("/")[:2])
+  result["repository_full_name"] = repo_name
+  return result
+
+
+def _loaded_mock_class() -> Any:
+  """Returns unittest.mock.Mock if that module is already loaded, else None.
+
+  An object can only be a Mock once unittest.mock has been imported, so the
+  server never needs to import it just to rule mocks out.
+  """
+  mock_module = sys.modules.get("unittest.mock")
+  return getattr(mock_module, "Mock", None)
+
 
 def _to_dict(obj: Any) -> Any:
   """Converts common PyGithub objects to dictionaries. Handles basic types and lists."""
@@ -105,6 +135,9 @@ def _to_dict(obj: Any) -> Any:
     }
   if isinstance(obj, ContentFile):
     # Basic info suitable for listings and search results
+    raw = getattr(obj, "_rawData", None)
+    if isinstance(raw, dict):
+      return _content_file_from_raw(raw)
     repo_name = None
     if hasattr(obj, "repository") and obj.repository:
       repo_name = obj.repository.full_name
@@ -150,25 +183,22 @@ def _to_dict(obj: Any) -> Any:
   # Fallback
   try:
     # Prioritize compatibility with mock objects
-    try:
-      import unittest.mock
-
-      is_mock = isinstance(obj, unittest.mock.Mock)
-    except Exception:
-      is_mock = False
+    mock_class = _loaded_mock_class()
+    is_mock = mock_class is not None and isinstance(obj, mock_class)
 
     if hasattr(obj, "_rawData"):
       logger.debug(f"Using rawData fallback for type {type(obj).__name__}")
       raw = obj._rawData
       if isinstance(raw, dict):
+        if mock_class is None:
+          return raw
         try:
-          import unittest.mock
 
           def extract_value(v):
-            if isinstance(v, unittest.mock.Mock):
+            if isinstance(v, mock_class):
               # If mock has return_value and return_value is not a mock, recursively get it
               rv = getattr(v, "return_value", v)
-              if isinstance(rv, unittest.mock.Mock):
+              if isinstance(rv, mock_class):
                 return extract_value(rv)
               return rv
             return v
@@ -184,7 +214,7 @@ def _to_dict(obj: Any) -> Any:
         if hasattr(obj, attr):
           value = getattr(obj, attr)
           # Get mock attribute's return_value or actual value
-          if isinstance(value, unittest.mock.Mock):
+          if isinstance(value, mock_class):
             value = value.return_value if hasattr(value, "return_value") else str(value)
           attrs[attr] = value
       if attrs:
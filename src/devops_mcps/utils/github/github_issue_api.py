@@ -5,22 +5,63 @@ including listing issues and getting issue details.
 """
 
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from typing import List, Optional, Dict, Any, Union
 
 from github import (
   GithubException,
   UnknownObjectException,
 )
+from github.Issue import Issue
 from github.PaginatedList import PaginatedList
 
-from ...cache import cache
+from ...cache import cache, key_digest, singleflight
 from ...inputs import ListIssuesInput
 from .github_client import initialize_github_client
 from .github_converters import _handle_paginated_list
 
 logger = logging.getLogger(__name__)
 
+# Issues fetched per GraphQL query; each issue is an aliased field on one
+# repository node, so a batch costs a single request.
+ISSUE_BATCH_SIZE = 50
+# Comments returned per issue by the batched query. Issues with more comments
+# are returned truncated and not cached, since gh_get_issue_content reads the
+# same cache key and must see every comment.
+ISSUE_GRAPHQL_COMMENT_LIMIT = 100
+# Upper bound on comment pages fetched at once for a single issue
+ISSUE_COMMENT_PAGE_CONCURRENCY = 4
+ISSUE_GRAPHQL_FIELDS = (
+  "title createdAt body labels(first: 50) { nodes { name } } "
+  f"comments(first: {ISSUE_GRAPHQL_COMMENT_LIMIT}) {{ totalCount nodes {{ body }} }}"
+)
+
+
+def _get_comment_bodies(issue: Issue) -> List[str]:
+  """Collects the body of every comment on an issue.
+
+  The issue's ``comments`` count tells how many pages there are once the first
+  page is in, so the remaining pages are fetched concurrently instead of being
+  walked one request at a time.
+  """
+  comments = issue.get_comments()
+  first_page = comments.get_page(0)
+  bodies = [comment.body for comment in first_page]
+  per_page = len(first_page)
+  if not per_page or issue.comments <= per_page:
+    return bodies
+
+  pages = range(1, math.ceil(issue.comments / per_page))
+  workers = min(ISSUE_COMMENT_PAGE_CONCURRENCY, len(pages))
+  with ThreadPoolExecutor(max_workers=workers) as executor:
+    for page in executor.map(comments.get_page, pages):
+      bodies.extend(comment.body for comment in page)
+  return bodies
 
+
+@singleflight
 def gh_list_issues(
   owner: str,
   repo: str,
@@ -35,7 +76,7 @@ def gh_list_issues(
   )
 
   # Check cache first
-  labels_str = ",".join(sorted(labels)) if labels else "none"
+  labels_str = key_digest(",".join(sorted(labels))) if labels else "none"
   cache_key = (
     f"github:list_issues:{owner}/{repo}:{state}:{labels_str}:{sort}:{direction}"
   )
@@ -44,7 +85,7 @@ def gh_list_issues(
     logger.debug(f"Returning cached result for {cache_key}")
     return cached
 
-  github_client = initialize_github_client(force=True)
+  github_client = initialize_github_client()
   if not github_client:
     logger.error("gh_list_issues: GitHub client not initialized.")
     return {
@@ -65,8 +106,8 @@ def gh_list_issues(
       logger.debug(f"Filtering issues by labels: {input_data.labels}")
 
     issues_paginated: PaginatedList = repo_obj.get_issues(**issue_kwargs)
-    logger.debug(f"Found {issues_paginated.totalCount} issues matching criteria.")
     result = _handle_paginated_list(issues_paginated)
+    logger.debug(f"Found {len(result)} issues matching criteria.")
     cache.set(cache_key, result, ttl=1800)  # Cache for 30 minutes
     return result
   except UnknownObjectException:
@@ -83,9 +124,14 @@ def gh_list_issues(
     return {"error": f"An unexpected error occurred: {e}"}
 
 
+@singleflight
 def gh_get_issue_details(owner: str, repo: str, issue_number: int) -> Dict[str, Any]:
   """Fetches issue details including title, labels, timestamp, description, and comments.
 
+  Uses the same GraphQL query as gh_get_issues_content with a batch of one, so
+  the issue and its first ISSUE_GRAPHQL_COMMENT_LIMIT comments cost a single
+  request; only longer threads page the remaining comments over REST.
+
   Args:
       owner: The owner of the repository.
       repo: The name of the repository.
@@ -103,7 +149,7 @@ def gh_get_issue_details(owner: str, repo: str, issue_number: int) -> Dict[str,
     logger.debug(f"Returning cached result for {cache_key}")
     return cached
 
-  github_client = initialize_github_client(force=True)
+  github_client = initialize_github_client()
   if not github_client:
     logger.error("gh_get_issue_details: GitHub client not initialized.")
     return {
@@ -111,20 +157,26 @@ def gh_get_issue_details(owner: str, repo: str, issue_number: int) -> Dict[str,
     }
 
   try:
-    issue = github_client.get_issue(owner, repo, issue_number)
-    comments = issue.get_comments()
-    issue_details = {
-      "title": issue.title,
-      "labels": [label.name for label in issue.labels],
-      "timestamp": issue.created_at.isoformat(),
-      "description": issue.body,
-      "comments": [comment.body for comment in comments],
-    }
+    repository = _query_issues(github_client, owner, repo, [issue_number])
+    node = repository.get(f"i{issue_number}")
+    if node is None:
+      logger.warning(
+        f"gh_get_issue_details: Issue #{issue_number} not found in '{owner}/{repo}'."
+      )
+      return {"error": f"Issue #{issue_number} not found in '{owner}/{repo}'."}
+    issue_details = _issue_content_from_graphql(node)
+    if node["comments"]["totalCount"] > ISSUE_GRAPHQL_COMMENT_LIMIT:
+      # The query only returns the first comments; page through the rest
+      issue = github_client.get_repo(f"{owner}/{repo}").get_issue(issue_number)
+      issue_details["comments"] = _get_comment_bodies(issue)
     logger.debug(
       f"Successfully retrieved issue details for {owner}/{repo} issue #{issue_number}"
     )
     cache.set(cache_key, issue_details, ttl=300)  # Cache for 5 minutes
     return issue_details
+  except UnknownObjectException:
+    logger.warning(f"gh_get_issue_details: Repository '{owner}/{repo}' not found.")
+    return {"error": f"Repository '{owner}/{repo}' not found."}
   except GithubException as e:
     logger.error(
       f"gh_get_issue_details GitHub Error: {e.status} - {e.data}", exc_info=True
@@ -137,6 +189,7 @@ def gh_get_issue_details(owner: str, repo: str, issue_number: int) -> Dict[str,
     return {"error": f"An unexpected error occurred: {e}"}
 
 
+@singleflight
 def gh_get_issue_content(owner: str, repo: str, issue_number: int) -> dict:
   """Fetches issue content including title, labels, timestamp, description, and comments.
 
@@ -157,7 +210,7 @@ def gh_get_issue_content(owner: str, repo: str, issue_number: int) -> dict:
     logger.debug(f"Returning cached result for {cache_key}")
     return cached
 
-  github_client = initialize_github_client(force=True)
+  github_client = initialize_github_client()
   if not github_client:
     logger.error("gh_get_issue_content: GitHub client not initialized.")
     return {
@@ -167,13 +220,12 @@ def gh_get_issue_content(owner: str, repo: str, issue_number: int) -> dict:
   try:
     repo_obj = github_client.get_repo(f"{owner}/{repo}")
     issue = repo_obj.get_issue(issue_number)
-    comments = issue.get_comments()
     issue_content = {
       "title": issue.title,
       "labels": [label.name for label in issue.labels],
       "timestamp": issue.created_at.isoformat(),
       "description": issue.body,
-      "comments": [comment.body for comment in comments],
+      "comments": _get_comment_bodies(issue),
     }
     logger.debug(
       f"Successfully retrieved issue content for {owner}/{repo} issue #{issue_number}"
@@ -195,3 +247,128 @@ def gh_get_issue_content(owner: str, repo: str, issue_number: int) -> dict:
   except Exception as e:
     logger.error(f"Unexpected error in gh_get_issue_content: {e}", exc_info=True)
     return {"error": f"An unexpected error occurred: {e}"}
+
+
+def _issue_content_from_graphql(node: Dict[str, Any]) -> Dict[str, Any]:
+  """Shape a GraphQL issue node like the gh_get_issue_content result."""
+  return {
+    "title": node["title"],
+    "labels": [label["name"] for label in node["labels"]["nodes"]],
+    "timestamp": datetime.fromisoformat(node["createdAt"]).isoformat(),
+    "description": node["body"],
+    "comments": [comment["body"] for comment in node["comments"]["nodes"]],
+  }
+
+
+def _query_issues(
+  github_client: Any, owner: str, repo: str, issue_numbers: List[int]
+) -> Dict[str, Any]:
+  """Fetch issues in one aliased GraphQL query.
+
+  Returns:
+      The repository node, mapping ``i<number>`` to each issue node, or to None
+      for an issue that does not exist.
+  """
+  aliases = " ".join(
+    f"i{number}: issue(number: {number}) {{ {ISSUE_GRAPHQL_FIELDS} }}"
+    for number in issue_numbers
+  )
+  query = (
+    "query($owner: String!, $name: String!) "
+    f"{{ repository(owner: $owner, name: $name) {{ {aliases} }} }}"
+  )
+  try:
+    _, data = github_client.requester.graphql_query(
+      query, {"owner": owner, "name": repo}
+    )
+  except GithubException as e:
+    # A missing issue fails the query but still returns the other issues,
+    # with null for the missing alias
+    data = e.data if isinstance(e.data, dict) else {}
+    if not (data.get("data") or {}).get("repository"):
+      raise
+  return data["data"]["repository"]
+
+
+def gh_get_issues_content(
+  owner: str, repo: str, issue_numbers: List[int]
+) -> Dict[str, Any]:
+  """Fetches content for several issues of one repository in batched GraphQL queries.
+
+  Uncached issues are requested ISSUE_BATCH_SIZE at a time, one round-trip per
+  batch, and each complete result is cached under the same key
+  gh_get_issue_content uses. Only the first ISSUE_GRAPHQL_COMMENT_LIMIT
+  comments of each issue are returned; such truncated results are not cached.
+  An issue that does not exist gets its own error entry without failing the
+  rest of the batch.
+
+  Args:
+      owner: The owner of the repository.
+      repo: The name of the repository.
+      issue_numbers: The issue numbers to fetch.
+
+  Returns:
+      A dictionary mapping each issue number (as a string) to its content,
+      or an error message.
+  """
+  logger.debug(
+    f"gh_get_issues_content called for {owner}/{repo} issues {issue_numbers}"
+  )
+
+  results: Dict[str, Any] = {}
+  missing: List[int] = []
+  for number in dict.fromkeys(issue_numbers):
+    cached = cache.get(f"github:issue_content:{owner}:{repo}:{number}")
+    if cached:
+      results[str(number)] = cached
+    else:
+      missing.append(number)
+  if not missing:
+    logger.debug(f"Returning cached content for all {len(results)} issues")
+    return results
+
+  github_client = initialize_github_client()
+  if not github_client:
+    logger.error("gh_get_issues_content: GitHub client not initialized.")
+    return {
+      "error": "GitHub client not initialized. Please set the GITHUB_PERSONAL_ACCESS_TOKEN environment variable."
+    }
+
+  try:
+    for start in range(0, len(missing), ISSUE_BATCH_SIZE):
+      batch = missing[start : start + ISSUE_BATCH_SIZE]
+      repository = _query_issues(github_client, owner, repo, batch)
+      for number in batch:
+        node = repository.get(f"i{number}")
+        if node is None:
+          results[str(number)] = {
+            "error": f"Issue #{number} not found in '{owner}/{repo}'."
+          }
+          continue
+        issue_content = _issue_content_from_graphql(node)
+        if node["comments"]["totalCount"] <= ISSUE_GRAPHQL_COMMENT_LIMIT:
+          cache.set(
+            f"github:issue_content:{owner}:{repo}:{number}", issue_content, ttl=300
+          )
+        results[str(number)] = issue_content
+    logger.debug(
+      f"Successfully retrieved {len(missing)} issues for {owner}/{repo} via GraphQL"
+    )
+    return results
+  except UnknownObjectException:
+    logger.warning(
+      f"gh_get_issues_content: Repository '{owner}/{repo}' or one of issues {missing} not found."
+    )
+    return {
+      "error": f"Repository '{owner}/{repo}' or one of issues {missing} not found."
+    }
+  except GithubException as e:
+    logger.error(
+      f"gh_get_issues_content GitHub Error: {e.status} - {e.data}", exc_info=True
+    )
+    return {
+      "error": f"GitHub API Error: {e.status} - {e.data.get('message', 'Unknown GitHub error')}"
+    }
+  except Exception as e:
+    logger.error(f"Unexpected error in gh_get_issues_content: {e}", exc_info=True)
+    return {"error": f"An unexpected error occurred: {e}"}
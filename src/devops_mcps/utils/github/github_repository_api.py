@@ -5,14 +5,18 @@ including getting repository information and file contents.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Union
+import os
+import zlib
+from typing import List, Optional, Dict, Any, Tuple, Union
 
 from github import (
+  Consts,
   GithubException,
   UnknownObjectException,
 )
+from github.ContentFile import ContentFile
 
-from ...cache import cache
+from ...cache import cache, singleflight
 from ...inputs import (
   GetFileContentsInput,
   GetRepositoryInput,
@@ -22,6 +26,129 @@ from .github_converters import _to_dict
 
 logger = logging.getLogger(__name__)
 
+# Previously fetched PyGithub objects (for files, just their URL and
+# validators) are kept this long so an expired result can be revalidated with a
+# conditional request instead of a full GET.
+GITHUB_VALIDATOR_TTL = 86400
+# Results that keep revalidating as unchanged have their TTL doubled up to this.
+GITHUB_MAX_RESULT_TTL = 21600
+# Extensions that are never UTF-8 text; decoding them is skipped entirely
+_BINARY_EXTENSIONS = frozenset(
+  {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".ico",
+    ".pdf",
+    ".zip",
+    ".gz",
+    ".tgz",
+    ".jar",
+    ".class",
+    ".woff",
+    ".woff2",
+  }
+)
+
+# Decoded files at least this large are kept zlib-compressed in the cache
+_COMPRESS_MIN_SIZE = 64 * 1024
+
+
+def _pack_text(text: str) -> Union[str, bytes]:
+  """Compress large decoded file content for storage in the cache."""
+  if len(text) < _COMPRESS_MIN_SIZE:
+    return text
+  return zlib.compress(text.encode("utf-8"), 3)
+
+
+def _unpack_text(value: Any) -> Any:
+  """Reverse _pack_text; file results are never bytes otherwise."""
+  if isinstance(value, bytes):
+    return zlib.decompress(value).decode("utf-8")
+  return value
+
+
+def _revalidate(validator_key: str) -> Tuple[Any, Any]:
+  """Conditionally re-fetch a previously retrieved PyGithub object.
+
+  PyGithub's ``update()`` sends the stored ETag/Last-Modified as
+  ``If-None-Match``/``If-Modified-Since``; a 304 reply carries no body and
+  does not count against the rate limit.
+
+  Args:
+    validator_key: Cache key holding ``{"object": ..., "result": ...}``.
+
+  Returns:
+    ``(obj, result)``: ``result`` is the previous result if GitHub reports the
+    object unchanged, else None. ``obj`` is the refreshed object, or None if
+    nothing was stored.
+  """
+  entry = cache.get(validator_key)
+  if not entry:
+    return None, None
+  if not entry["object"].update():
+    logger.debug(f"Not modified, reusing previous result for {validator_key}")
+    return entry["object"], entry["result"]
+  return entry["object"], None
+
+
+def _file_validator(contents: ContentFile, result: Any) -> Dict[str, Any]:
+  """Builds the validator entry for a file from what revalidation needs.
+
+  The ContentFile itself is not kept: its raw data holds the whole
+  base64-encoded body, which would outlive the (compressed) result.
+  """
+  return {
+    "url": contents.url,
+    "etag": contents.etag,
+    "last_modified": contents.last_modified,
+    "result": result,
+  }
+
+
+def _revalidate_file(github_client: Any, validator_key: str) -> Tuple[Any, Any]:
+  """Like _revalidate, for a file stored as a _file_validator entry.
+
+  A body-less ContentFile carrying only the stored URL, ETag and Last-Modified
+  is rebuilt, so ``update()`` sends the same conditional request.
+  """
+  entry = cache.get(validator_key)
+  if not entry:
+    return None, None
+  headers = {}
+  if entry["etag"]:
+    headers[Consts.RES_ETAG] = entry["etag"]
+  if entry["last_modified"]:
+    headers[Consts.RES_LAST_MODIFIED] = entry["last_modified"]
+  contents = ContentFile(
+    github_client.requester, headers, {"url": entry["url"]}, completed=False
+  )
+  if not contents.update():
+    logger.debug(f"Not modified, reusing previous result for {validator_key}")
+    return contents, entry["result"]
+  return contents, None
+
+
+@singleflight
+def _cache_file_result(
+  cache_key: str, validator_key: str, contents: ContentFile, result: Any
+) -> None:
+  """Cache a fetched file result along with the validators to revalidate it."""
+  packed = _pack_text(result) if isinstance(result, str) else result
+  cache.set_adaptive(
+    cache_key,
+    packed,
+    changed=True,
+    min_ttl=1800,
+    max_ttl=GITHUB_MAX_RESULT_TTL,
+  )
+  cache.set(
+    validator_key,
+    _file_validator(contents, packed),
+    ttl=GITHUB_VALIDATOR_TTL,
+  )
+
 
 def gh_get_file_contents(
   owner: str, repo: str, path: str, branch: Optional[str] = None
@@ -37,9 +164,9 @@ def gh_get_file_contents(
   cached = cache.get(cache_key)
   if cached:
     logger.debug(f"Returning cached result for {cache_key}")
-    return cached
+    return _unpack_text(cached)
 
-  github_client = initialize_github_client(force=True)
+  github_client = initialize_github_client()
   if not github_client:
     logger.error("gh_get_file_contents: GitHub client not initialized.")
     return {
@@ -47,24 +174,43 @@ def gh_get_file_contents(
     }
   try:
     input_data = GetFileContentsInput(owner=owner, repo=repo, path=path, branch=branch)
-    repo_obj = github_client.get_repo(f"{input_data.owner}/{input_data.repo}")
-    ref_kwarg = {"ref": input_data.branch} if input_data.branch else {}
-    contents = repo_obj.get_contents(input_data.path, **ref_kwarg)
+    validator_key = f"{cache_key}:validator"
+    contents, previous = _revalidate_file(github_client, validator_key)
+    if previous is not None:
+      cache.set_adaptive(
+        cache_key,
+        previous,
+        changed=False,
+        min_ttl=1800,
+        max_ttl=GITHUB_MAX_RESULT_TTL,
+      )
+      return _unpack_text(previous)
+    if contents is None:
+      repo_obj = github_client.get_repo(f"{input_data.owner}/{input_data.repo}")
+      ref_kwarg = {"ref": input_data.branch} if input_data.branch else {}
+      contents = repo_obj.get_contents(input_data.path, **ref_kwarg)
 
     if isinstance(contents, list):  # Directory
       logger.debug(f"Path '{path}' is a directory with {len(contents)} items.")
       result = [_to_dict(item) for item in contents]
+      # A listing has no single validator to revalidate, so it keeps a fixed TTL
       cache.set(cache_key, result, ttl=1800)
       return result
     else:  # File
       logger.debug(
         f"Path '{path}' is a file (size: {contents.size}, encoding: {contents.encoding})."
       )
+      if os.path.splitext(path)[1].lower() in _BINARY_EXTENSIONS:
+        logger.debug(f"Skipping decode for '{path}' (binary file extension).")
+        return {
+          "error": "Could not decode content (likely binary file).",
+          **_to_dict(contents),  # Include metadata
+        }
       if contents.encoding == "base64" and contents.content:
         try:
           decoded = contents.decoded_content.decode("utf-8")
           logger.debug(f"Successfully decoded base64 content for '{path}'.")
-          cache.set(cache_key, decoded, ttl=1800)
+          _cache_file_result(cache_key, validator_key, contents, decoded)
           return decoded
         except UnicodeDecodeError:
           logger.warning(
@@ -85,7 +231,7 @@ def gh_get_file_contents(
       elif contents.content is not None:
         logger.debug(f"Returning raw (non-base64) content for '{path}'.")
         result = contents.content  # Return raw if not base64
-        cache.set(cache_key, result, ttl=1800)  # Cache for 30 minutes
+        _cache_file_result(cache_key, validator_key, contents, result)
         return result
       else:
         logger.debug(f"Content for '{path}' is None or empty.")
@@ -93,7 +239,7 @@ def gh_get_file_contents(
           "message": "File appears to be empty or content is inaccessible.",
           **_to_dict(contents),  # Include metadata
         }
-        cache.set(cache_key, result, ttl=1800)  # Cache for 30 minutes
+        _cache_file_result(cache_key, validator_key, contents, result)
         return result
   except UnknownObjectException:
     logger.warning(
@@ -113,6 +259,7 @@ def gh_get_file_contents(
     return {"error": f"An unexpected error occurred: {e}"}
 
 
+@singleflight
 def gh_get_repository(owner: str, repo: str) -> Union[Dict[str, Any], Dict[str, str]]:
   """Internal logic for getting repository info."""
   logger.debug(f"gh_get_repository called for {owner}/{repo}")
@@ -124,7 +271,7 @@ def gh_get_repository(owner: str, repo: str) -> Union[Dict[str, Any], Dict[str,
     logger.debug(f"Returning cached result for {cache_key}")
     return cached
 
-  github_client = initialize_github_client(force=True)
+  github_client = initialize_github_client()
   if not github_client:
     logger.error("gh_get_repository: GitHub client not initialized.")
     return {
@@ -132,10 +279,24 @@ def gh_get_repository(owner: str, repo: str) -> Union[Dict[str, Any], Dict[str,
     }
   try:
     input_data = GetRepositoryInput(owner=owner, repo=repo)
-    repo_obj = github_client.get_repo(f"{input_data.owner}/{input_data.repo}")
-    logger.debug(f"Successfully retrieved repository object for {owner}/{repo}.")
-    result = _to_dict(repo_obj)
-    cache.set(cache_key, result, ttl=3600)  # Cache for 1 hour
+    validator_key = f"{cache_key}:validator"
+    repo_obj, result = _revalidate(validator_key)
+    changed = result is None
+    if changed:
+      if repo_obj is None:
+        repo_obj = github_client.get_repo(f"{input_data.owner}/{input_data.repo}")
+      logger.debug(f"Successfully retrieved repository object for {owner}/{repo}.")
+      result = _to_dict(repo_obj)
+    cache.set_adaptive(
+      cache_key,
+      result,
+      changed=changed,
+      min_ttl=3600,
+      max_ttl=GITHUB_MAX_RESULT_TTL,
+    )
+    cache.set(
+      validator_key, {"object": repo_obj, "result": result}, ttl=GITHUB_VALIDATOR_TTL
+    )
     return result
   except UnknownObjectException:
     logger.warning(f"gh_get_repository: Repository '{owner}/{repo}' not found.")
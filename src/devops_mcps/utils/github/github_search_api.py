@@ -9,7 +9,7 @@ from typing import List, Dict, Any, Union
 from github import GithubException
 from github.PaginatedList import PaginatedList
 
-from ...cache import cache
+from ...cache import cache, key_digest, singleflight
 from ...inputs import (
   SearchRepositoriesInput,
   SearchCodeInput,
@@ -20,6 +20,7 @@ from .github_converters import _handle_paginated_list
 logger = logging.getLogger(__name__)
 
 
+@singleflight
 def gh_search_repositories(
   query: str,
 ) -> Union[List[Dict[str, Any]], Dict[str, str]]:
@@ -27,13 +28,13 @@ def gh_search_repositories(
   logger.debug(f"gh_search_repositories called with query: '{query}'")
 
   # Check cache first
-  cache_key = f"github:search_repos:{query}"
+  cache_key = f"github:search_repos:{key_digest(query)}"
   cached = cache.get(cache_key)
   if cached:
     logger.debug(f"Returning cached result for {cache_key}")
     return cached
 
-  github_client = initialize_github_client(force=True)
+  github_client = initialize_github_client()
   if not github_client:
     logger.error("gh_search_repositories: GitHub client not initialized.")
     return {
@@ -44,8 +45,8 @@ def gh_search_repositories(
     repositories: PaginatedList = github_client.search_repositories(
       query=input_data.query
     )
-    logger.debug(f"Found {repositories.totalCount} repositories matching query.")
     result = _handle_paginated_list(repositories)
+    logger.debug(f"Found {len(result)} repositories matching query.")
     cache.set(cache_key, result, ttl=300)  # Cache for 5 minutes
     return result
   except GithubException as e:
@@ -60,6 +61,7 @@ def gh_search_repositories(
     return {"error": f"An unexpected error occurred: {e}"}
 
 
+@singleflight
 def gh_search_code(
   q: str, sort: str = "indexed", order: str = "desc"
 ) -> Union[List[Dict[str, Any]], Dict[str, str]]:
@@ -67,13 +69,13 @@ def gh_search_code(
   logger.debug(f"gh_search_code called with query: '{q}', sort: {sort}, order: {order}")
 
   # Check cache first
-  cache_key = f"github:search_code:{q}:{sort}:{order}"
+  cache_key = f"github:search_code:{key_digest(q)}:{sort}:{order}"
   cached = cache.get(cache_key)
   if cached:
     logger.debug(f"Returning cached result for {cache_key}")
     return cached
 
-  github_client = initialize_github_client(force=True)
+  github_client = initialize_github_client()
   if not github_client:
     logger.error("gh_search_code: GitHub client not initialized.")
     return {
@@ -85,8 +87,8 @@ def gh_search_code(
     code_results: PaginatedList = github_client.search_code(
       query=input_data.q, **search_kwargs
     )
-    logger.debug(f"Found {code_results.totalCount} code results matching query.")
     result = _handle_paginated_list(code_results)
+    logger.debug(f"Found {len(result)} code results matching query.")
     cache.set(cache_key, result, ttl=300)  # Cache for 5 minutes
     return result
   except GithubException as e:
@@ -1,7 +1,6 @@
 """GitHub User API functions."""
 
 import logging
-import os
 from typing import Dict, Any
 
 from github import (
@@ -11,7 +10,11 @@ from github import (
 )
 
 from ...cache import cache
-from .github_client import initialize_github_client
+from .github_client import (
+  github_token_available,
+  initialize_github_client,
+  reset_github_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +24,7 @@ def gh_get_current_user_info() -> Dict[str, Any]:
   logger.debug("gh_get_current_user_info called")
 
   # Check if token is available first, since this is an authenticated-only endpoint
-  github_token = os.environ.get("GITHUB_PERSONAL_ACCESS_TOKEN")
-  if not github_token:
+  if not github_token_available():
     logger.error("gh_get_current_user_info: No GitHub token provided.")
     return {
       "error": "GitHub client not initialized. Please set the GITHUB_PERSONAL_ACCESS_TOKEN environment variable."
@@ -35,7 +37,7 @@ def gh_get_current_user_info() -> Dict[str, Any]:
     logger.debug(f"Returning cached result for {cache_key}")
     return cached
 
-  github_client = initialize_github_client(force=True)  # Ensure client is initialized
+  github_client = initialize_github_client()
   if not github_client:
     logger.error("gh_get_current_user_info: GitHub client not initialized.")
     return {
@@ -58,6 +60,7 @@ def gh_get_current_user_info() -> Dict[str, Any]:
     return user_info
   except BadCredentialsException:
     logger.error("gh_get_current_user_info: Invalid credentials.")
+    reset_github_client()  # Rebuild with fresh credentials on the next call
     return {"error": "Authentication failed. Check your GitHub token."}
   except RateLimitExceededException:
     logger.error("gh_get_current_user_info: GitHub API rate limit exceeded.")
@@ -7,13 +7,10 @@ This package contains utility modules for Jenkins operations:
 """
 
 from .jenkins_client import (
+  _CLIENT_ATTRIBUTES,
+  get_client_attribute,
   initialize_jenkins_client,
   set_jenkins_client_for_testing,
-  JENKINS_URL,
-  JENKINS_USER,
-  JENKINS_TOKEN,
-  LOG_LENGTH,
-  j,
 )
 
 from .jenkins_converters import _to_dict
@@ -21,10 +18,12 @@ from .jenkins_converters import _to_dict
 from .jenkins_api import (
   jenkins_get_jobs,
   jenkins_get_build_log,
+  jenkins_get_build_log_tail,
   jenkins_get_all_views,
   jenkins_get_build_parameters,
   jenkins_get_queue,
   jenkins_get_recent_failed_builds,
+  jenkins_get_recent_failed_builds_with_details,
 )
 
 __all__ = [
@@ -41,8 +40,17 @@ __all__ = [
   # API functions
   "jenkins_get_jobs",
   "jenkins_get_build_log",
+  "jenkins_get_build_log_tail",
   "jenkins_get_all_views",
   "jenkins_get_build_parameters",
   "jenkins_get_queue",
   "jenkins_get_recent_failed_builds",
+  "jenkins_get_recent_failed_builds_with_details",
 ]
+
+
+def __getattr__(name):
+  """Resolve the client and constants lazily so importing never connects."""
+  if name in _CLIENT_ATTRIBUTES:
+    return get_client_attribute(name)
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,32 +6,30 @@ Functions are organized into separate modules but re-exported here for backward
 
 # Import all functions from specialized modules
 from .jenkins_job_api import jenkins_get_jobs
-from .jenkins_logs import jenkins_get_build_log
+from .jenkins_logs import jenkins_get_build_log, jenkins_get_build_log_tail
 from .jenkins_parameters import jenkins_get_build_parameters
-from .jenkins_builds import jenkins_get_recent_failed_builds
+from .jenkins_builds import (
+  jenkins_get_recent_failed_builds,
+  jenkins_get_recent_failed_builds_with_details,
+)
 from .jenkins_view_api import jenkins_get_all_views
 from .jenkins_queue_api import jenkins_get_queue
 
-# Import constants from jenkins_client for backward compatibility
-from .jenkins_client import (
-  JENKINS_URL as _JENKINS_URL,
-  JENKINS_USER as _JENKINS_USER,
-  JENKINS_TOKEN as _JENKINS_TOKEN,
-  LOG_LENGTH as _LOG_LENGTH,
-  j as _j,
-)
+# Client and constants are resolved on access, see __getattr__ below
+from .jenkins_client import _CLIENT_ATTRIBUTES, get_client_attribute
 
 # Import cache and helpers for backward compatibility (moved to top to satisfy Ruff E402)
 from ...cache import cache
 import requests
 from .jenkins_converters import _to_dict
 
-# Make constants available at module level for patching
-JENKINS_URL = _JENKINS_URL
-JENKINS_USER = _JENKINS_USER
-JENKINS_TOKEN = _JENKINS_TOKEN
-LOG_LENGTH = _LOG_LENGTH
-j = _j
+
+def __getattr__(name):
+  """Resolve the client and constants lazily; patching them here still works."""
+  if name in _CLIENT_ATTRIBUTES:
+    return get_client_attribute(name)
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # (imports were moved above to satisfy E402)
 
@@ -40,16 +38,18 @@ __all__ = [
   # API functions
   "jenkins_get_jobs",
   "jenkins_get_build_log",
+  "jenkins_get_build_log_tail",
   "jenkins_get_build_parameters",
   "jenkins_get_recent_failed_builds",
+  "jenkins_get_recent_failed_builds_with_details",
   "jenkins_get_all_views",
   "jenkins_get_queue",
   # Constants and client
-  "JENKINS_URL",
-  "JENKINS_USER",
-  "JENKINS_TOKEN",
-  "LOG_LENGTH",
-  "j",
+  "JENKINS_URL",  # noqa: F822 - resolved by __getattr__
+  "JENKINS_USER",  # noqa: F822 - resolved by __getattr__
+  "JENKINS_TOKEN",  # noqa: F822 - resolved by __getattr__
+  "LOG_LENGTH",  # noqa: F822 - resolved by __getattr__
+  "j",  # noqa: F822 - resolved by __getattr__
   "cache",
   "requests",
   "_to_dict",
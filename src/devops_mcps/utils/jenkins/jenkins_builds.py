@@ -2,19 +2,84 @@
 
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Union, Any
 
 # Internal imports
+from ...cache import singleflight
 from .jenkins_helpers import (
   _get_jenkins_constants,
+  _cache_key,
   _get_cache,
   check_jenkins_credentials,
 )
+from .jenkins_client import jenkins_session
+from .jenkins_logs import jenkins_get_build_log_tail
+from .jenkins_parameters import jenkins_get_build_parameters
 
 logger = logging.getLogger(__name__)
 
+# Only the fields read below are requested, and the job list is fetched in
+# fixed-size slices with Jenkins' tree range syntax ({start,end}) so large
+# instances never return one unbounded payload. Slices are requested until one
+# comes back short, so every job is scanned. A server (or proxy) that ignores
+# the range returns the whole list every time; paging stops as soon as a slice
+# is larger than requested or starts with the same job as the previous one.
+RECENT_BUILDS_TREE = "jobs[name,url,lastBuild[number,timestamp,result,url]]"
+RECENT_BUILDS_CHUNK_SIZE = 200
+
+# The raw jobs payload is kept with its HTTP validators (ETag/Last-Modified)
+# for longer than the filtered result, so a refresh can be answered with a
+# 304 Not Modified and re-filtered locally instead of re-downloaded.
+RECENT_BUILDS_VALIDATOR_KEY = _cache_key("recent_failed_builds", "validator")
+RECENT_BUILDS_VALIDATOR_TTL = 3600
+
+# Upper bound on failed builds whose details are fetched at once. Kept below
+# the shared session's pool_maxsize so workers never wait for a connection.
+FAILED_BUILD_DETAIL_CONCURRENCY = 8
+
+
+def _fetch_jobs_chunk(
+  cache: Any, constants: Dict[str, Any], start: int, end: int
+) -> List[Dict[str, Any]]:
+  """Fetch the jobs in the range [start, end), revalidating any stored copy."""
+  jobs_url = (
+    f"{constants['JENKINS_URL']}/api/json?tree={RECENT_BUILDS_TREE}{{{start},{end}}}"
+  )
+  validator_key = f"{RECENT_BUILDS_VALIDATOR_KEY}:{start}"
+  validator = cache.get(validator_key)
+  request_headers = {}
+  if validator:
+    if validator.get("etag"):
+      request_headers["If-None-Match"] = validator["etag"]
+    if validator.get("last_modified"):
+      request_headers["If-Modified-Since"] = validator["last_modified"]
+
+  response = jenkins_session.get(
+    jobs_url,
+    auth=(constants["JENKINS_USER"], constants["JENKINS_TOKEN"]),
+    headers=request_headers,
+    timeout=30,
+  )
+  if validator and response.status_code == 304:
+    logger.debug(f"Jenkins jobs {start}-{end} not modified, reusing stored copy")
+    return validator["jobs_data"].get("jobs", [])
+
+  response.raise_for_status()
+  jobs_data = response.json()
+  etag = response.headers.get("ETag")
+  last_modified = response.headers.get("Last-Modified")
+  if etag or last_modified:
+    cache.set(
+      validator_key,
+      {"etag": etag, "last_modified": last_modified, "jobs_data": jobs_data},
+      ttl=RECENT_BUILDS_VALIDATOR_TTL,
+    )
+  return jobs_data.get("jobs", [])
+
 
+@singleflight
 def jenkins_get_recent_failed_builds(
   hours_ago: int = 24,
 ) -> Union[List[Dict[str, Any]], Dict[str, str]]:
@@ -29,7 +94,7 @@ def jenkins_get_recent_failed_builds(
   logger.debug(f"jenkins_get_recent_failed_builds called with hours_ago: {hours_ago}")
 
   # Check cache first
-  cache_key = f"jenkins:recent_failed_builds:{hours_ago}"
+  cache_key = _cache_key("recent_failed_builds", hours_ago)
   cache = _get_cache()
   cached_builds = cache.get(cache_key)
   if cached_builds:
@@ -49,19 +114,29 @@ def jenkins_get_recent_failed_builds(
       (datetime.now() - timedelta(hours=hours_ago)).timestamp() * 1000
     )
 
-    # Get all jobs
-    jobs_url = f"{constants['JENKINS_URL']}/api/json?tree=jobs[name,url,lastBuild[number,timestamp,result,url]]"
-    response = requests.get(
-      jobs_url,
-      auth=(constants["JENKINS_USER"], constants["JENKINS_TOKEN"]),
-      timeout=30,
-    )
-    response.raise_for_status()
-    jobs_data = response.json()
+    # Get all jobs, one chunk at a time
+    jobs = []
+    chunk_start = 0
+    previous_first = None
+    while True:
+      chunk = _fetch_jobs_chunk(
+        cache, constants, chunk_start, chunk_start + RECENT_BUILDS_CHUNK_SIZE
+      )
+      first = chunk[0].get("name") if chunk else None
+      if chunk_start and first is not None and first == previous_first:
+        logger.warning("Jenkins ignored the job range; stopping after one full list")
+        break
+      jobs.extend(chunk)
+      if len(chunk) != RECENT_BUILDS_CHUNK_SIZE:
+        if len(chunk) > RECENT_BUILDS_CHUNK_SIZE:
+          logger.warning("Jenkins ignored the job range; using the full list")
+        break
+      previous_first = first
+      chunk_start += RECENT_BUILDS_CHUNK_SIZE
 
     # Process jobs to find recent failed builds
     failed_builds = []
-    for job in jobs_data.get("jobs", []):
+    for job in jobs:
       last_build = job.get("lastBuild")
       if not last_build:
         continue
@@ -105,3 +180,50 @@ def jenkins_get_recent_failed_builds(
   except Exception as e:
     logger.error(f"jenkins_get_recent_failed_builds error: {e}")
     return {"error": f"An unexpected error occurred: {e}"}
+
+
+def jenkins_get_recent_failed_builds_with_details(
+  hours_ago: int = 24, log_lines: int = 50, job_prefix: str = ""
+) -> Union[List[Dict[str, Any]], Dict[str, str]]:
+  """Get recent failed builds together with their parameters and console log.
+
+  The follow-up requests for each failed build run concurrently over the
+  shared Jenkins session instead of one after another. Builds of jobs outside
+  job_prefix are dropped before any follow-up request is made.
+
+  Args:
+      hours_ago: Number of hours to look back for failed builds
+      log_lines: Number of lines from the end of each build's console log
+      job_prefix: Only include jobs whose name starts with this prefix
+
+  Returns:
+      List of failed build dictionaries, each with "parameters" and "log"
+      keys, or error dictionary
+  """
+  logger.debug(
+    f"jenkins_get_recent_failed_builds_with_details called with hours_ago: {hours_ago}"
+  )
+  failed_builds = jenkins_get_recent_failed_builds(hours_ago)
+  if not isinstance(failed_builds, list):
+    return failed_builds
+  if job_prefix:
+    failed_builds = [
+      build
+      for build in failed_builds
+      if (build.get("job_name") or "").startswith(job_prefix)
+    ]
+  if not failed_builds:
+    return failed_builds
+
+  def add_details(build: Dict[str, Any]) -> Dict[str, Any]:
+    job_name = build["job_name"]
+    build_number = build["build_number"]
+    return {
+      **build,
+      "parameters": jenkins_get_build_parameters(job_name, build_number),
+      "log": jenkins_get_build_log_tail(job_name, build_number, log_lines),
+    }
+
+  workers = min(FAILED_BUILD_DETAIL_CONCURRENCY, len(failed_builds))
+  with ThreadPoolExecutor(max_workers=workers) as executor:
+    return list(executor.map(add_details, failed_builds))
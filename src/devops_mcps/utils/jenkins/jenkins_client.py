@@ -2,12 +2,16 @@
 
 import logging
 import os
-import sys
+import threading
 from typing import Optional
 
 # Third-party imports
+import requests
 from jenkinsapi.jenkins import Jenkins, JenkinsAPIException
+from jenkinsapi.utils.crumb_requester import CrumbRequester
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +24,43 @@ JENKINS_TOKEN = None
 LOG_LENGTH = None
 j: Optional[Jenkins] = None
 
+# Serializes client construction so concurrent first calls build one client
+_client_lock = threading.Lock()
+
+# Set once a client has been built (or building it failed), so first use only
+# tries to connect once; initialize_jenkins_client() can still retry explicitly
+_initialized = False
+
+# Module attributes that re-exporting modules resolve on access, see
+# get_client_attribute()
+_CLIENT_ATTRIBUTES = ("JENKINS_URL", "JENKINS_USER", "JENKINS_TOKEN", "LOG_LENGTH", "j")
+
+
+def _create_session() -> requests.Session:
+  """Create the pooled HTTP session used for direct Jenkins REST calls."""
+  session = requests.Session()
+  adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2),
+  )
+  session.mount("http://", adapter)
+  session.mount("https://", adapter)
+  return session
+
+
+# Shared across all Jenkins REST calls so connections are kept alive and reused
+jenkins_session = _create_session()
+
+
+def _create_requester(url: str, username: str, password: str) -> CrumbRequester:
+  """Create a jenkinsapi requester that sends its calls through jenkins_session."""
+  requester = CrumbRequester(username, password, baseurl=url)
+  # jenkinsapi passes auth per request, so the pooled session can be shared
+  requester.session = jenkins_session
+  return requester
+
+
 # Export constants and functions
 __all__ = [
   "JENKINS_URL",
@@ -27,17 +68,42 @@ __all__ = [
   "JENKINS_TOKEN",
   "LOG_LENGTH",
   "j",
+  "jenkins_session",
   "initialize_jenkins_client",
+  "get_client_attribute",
   "set_jenkins_client_for_testing",
 ]
 
 
 def initialize_jenkins_client():
   """Initializes the global Jenkins client 'j'."""
-  global j, JENKINS_URL, JENKINS_USER, JENKINS_TOKEN, LOG_LENGTH
-  if j:  # Already initialized
+  # Compare against None: truth-testing a Jenkins object calls __len__, which
+  # polls the server for the whole job list.
+  if j is not None:  # Already initialized
     return j
 
+  with _client_lock:
+    # Another thread may have finished initializing while we waited
+    if j is not None:
+      return j
+    return _create_jenkins_client()
+
+
+def get_client_attribute(name: str):
+  """Return the client or a configuration value, creating the client on first use.
+
+  Importing the package never contacts Jenkins; the first tool call that needs
+  the client reads the environment and connects.
+  """
+  if not _initialized:
+    initialize_jenkins_client()
+  return globals()[name]
+
+
+def _create_jenkins_client():
+  """Read configuration, then build and verify the global client. Caller holds _client_lock."""
+  global j, JENKINS_URL, JENKINS_USER, JENKINS_TOKEN, LOG_LENGTH, _initialized
+
   # Read environment variables (after load_dotenv() has been called)
   JENKINS_URL = os.environ.get("JENKINS_URL")
   JENKINS_USER = os.environ.get("JENKINS_USER")
@@ -46,7 +112,15 @@ def initialize_jenkins_client():
 
   if JENKINS_URL and JENKINS_USER and JENKINS_TOKEN:
     try:
-      j = Jenkins(JENKINS_URL, username=JENKINS_USER, password=JENKINS_TOKEN)
+      j = Jenkins(
+        JENKINS_URL,
+        username=JENKINS_USER,
+        password=JENKINS_TOKEN,
+        requester=_create_requester(JENKINS_URL, JENKINS_USER, JENKINS_TOKEN),
+        # Skip the eager poll of the root api/json (the full job list); the
+        # get_master_data() call below is enough to verify the connection.
+        lazy=True,
+      )
       # Basic connection test
       _ = j.get_master_data()
       logger.info(
@@ -67,6 +141,7 @@ def initialize_jenkins_client():
     )
     logger.warning("Jenkins related tools will have limited functionality.")
     j = None
+  _initialized = True
   return j
 
 
@@ -74,8 +149,3 @@ def set_jenkins_client_for_testing(client):
   """Set Jenkins client for testing purposes."""
   global j
   j = client
-
-
-# Call initialization when the module is loaded
-if not any("pytest" in arg or "unittest" in arg for arg in sys.argv):
-  initialize_jenkins_client()
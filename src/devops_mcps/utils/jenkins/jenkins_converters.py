@@ -1,7 +1,7 @@
 """Jenkins object conversion utilities."""
 
 import logging
-from typing import Any
+from typing import Any, Callable, Dict
 
 # Third-party imports
 from jenkinsapi.job import Job
@@ -10,29 +10,44 @@ from jenkinsapi.view import View
 logger = logging.getLogger(__name__)
 
 
-def _to_dict(obj: Any) -> Any:
-  """Converts common Jenkins objects to dictionaries. Handles basic types and lists."""
-  if isinstance(obj, (str, int, float, bool, type(None))):
-    return obj
-  if isinstance(obj, list):
-    return [_to_dict(item) for item in obj]
-  if isinstance(obj, dict):
-    return {k: _to_dict(v) for k, v in obj.items()}
-
-  if isinstance(obj, Job):
-    return {
-      "name": obj.name,
-      "url": obj.baseurl,
-      "is_enabled": obj.is_enabled(),
-      "is_queued": obj.is_queued(),
-      "in_queue": obj.is_queued(),  # corrected typo: in_queue
-      "last_build_number": obj.get_last_buildnumber(),
-      "last_build_url": obj.get_last_buildurl(),
-    }
-  if isinstance(obj, View):
-    return {"name": obj.name, "url": obj.baseurl, "description": obj.get_description()}
-
-  # Fallback
+def _job_json_to_dict(job: Dict[str, Any]) -> Dict[str, Any]:
+  """Converts a job's JSON (name, url, color, inQueue, lastBuild) to a summary dict."""
+  last_build = job.get("lastBuild") or {}
+  in_queue = job.get("inQueue", False)
+  return {
+    "name": job.get("name"),
+    "url": (job.get("url") or "").rstrip("/"),
+    "is_enabled": "disabled" not in (job.get("color") or ""),
+    "is_queued": in_queue,
+    "in_queue": in_queue,
+    "last_build_number": last_build.get("number"),
+    "last_build_url": last_build.get("url"),
+  }
+
+
+def _job_to_dict(job: Job) -> Dict[str, Any]:
+  """Converts a jenkinsapi Job to a summary dict."""
+  # Read the JSON the Job already holds; its is_enabled()/is_queued()/
+  # get_last_buildnumber() helpers each poll the server again.
+  return _job_json_to_dict({**(job._data or {}), "name": job.name, "url": job.baseurl})
+
+
+def _view_to_dict(view: View) -> Dict[str, Any]:
+  """Converts a jenkinsapi View to a dict."""
+  data = view._data or {}
+  return {
+    "name": view.name,
+    "url": view.baseurl,
+    "description": data.get("description"),
+  }
+
+
+def _identity(obj: Any) -> Any:
+  return obj
+
+
+def _fallback_to_dict(obj: Any) -> Any:
+  """Returns the string representation of an object without a handler."""
   try:
     logger.warning(
       f"No specific _to_dict handler for type {type(obj).__name__}, returning string representation."
@@ -43,3 +58,28 @@ def _to_dict(obj: Any) -> Any:
       f"Error during fallback _to_dict for {type(obj).__name__}: {fallback_err}"
     )
     return f"<Error serializing object of type {type(obj).__name__}>"
+
+
+# Handlers keyed by exact type, so the common case is a single dict lookup.
+# Subclasses (and spec'd mocks) fall back to an isinstance scan in this order.
+_DISPATCH: Dict[type, Callable[[Any], Any]] = {
+  str: _identity,
+  int: _identity,
+  float: _identity,
+  bool: _identity,
+  type(None): _identity,
+  list: lambda obj: [_to_dict(item) for item in obj],
+  dict: lambda obj: {k: _to_dict(v) for k, v in obj.items()},
+  Job: _job_to_dict,
+  View: _view_to_dict,
+}
+
+
+def _to_dict(obj: Any) -> Any:
+  """Converts common Jenkins objects to dictionaries. Handles basic types and lists."""
+  handler = _DISPATCH.get(type(obj))
+  if handler is None:
+    handler = next(
+      (h for cls, h in _DISPATCH.items() if isinstance(obj, cls)), _fallback_to_dict
+    )
+  return handler(obj)
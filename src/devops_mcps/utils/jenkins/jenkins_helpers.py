@@ -2,16 +2,17 @@
 
 import logging
 import sys
-from typing import Dict
+from typing import Any, Dict
 
 # Internal imports
-from ...cache import cache as _cache
+from ...cache import cache as _cache, key_digest
 from .jenkins_client import (
   j as _j,
   JENKINS_URL as _JENKINS_URL,
   JENKINS_USER as _JENKINS_USER,
   JENKINS_TOKEN as _JENKINS_TOKEN,
   LOG_LENGTH as _LOG_LENGTH,
+  jenkins_session,
 )
 from .jenkins_converters import _to_dict as _original_to_dict
 
@@ -25,6 +26,11 @@ cache = _cache
 
 logger = logging.getLogger(__name__)
 
+# _jenkins_api_json keeps each response with its ETag/Last-Modified for this
+# long, so a refetch after the caller's own cache entry expired can be answered
+# with 304 Not Modified instead of a full body.
+API_JSON_VALIDATOR_TTL = 3600
+
 
 def _get_jenkins_client():
   """Get the current Jenkins client, checking for patches in jenkins_api."""
@@ -68,6 +74,15 @@ def _get_cache():
   return _cache
 
 
+def _cache_key(domain: str, *ids: Any) -> str:
+  """Build a Jenkins cache key as ``jenkins:<domain>:<id>:<id>...``.
+
+  Keys for one domain share the ``jenkins:<domain>:`` prefix, so they can be
+  invalidated together with ``cache.delete_prefix``.
+  """
+  return ":".join(["jenkins", domain, *map(str, ids)])
+
+
 def check_jenkins_credentials() -> Dict[str, str]:
   """Check if Jenkins credentials are configured and return error message if not."""
   constants = _get_jenkins_constants()
@@ -82,3 +97,55 @@ def check_jenkins_credentials() -> Dict[str, str]:
       "error": "Jenkins client not initialized. Please set the JENKINS_URL, JENKINS_USER, and JENKINS_TOKEN environment variables."
     }
   return {}
+
+
+def _jenkins_api_json(url: str, tree: str) -> Dict[str, Any]:
+  """Fetch ``{url}/api/json`` limited to the ``tree`` fields in a single request.
+
+  The request is conditional when an earlier response carried validators; on
+  304 Not Modified the stored body is returned.
+
+  Args:
+      url: Jenkins object URL (server root, job, folder or view).
+      tree: Jenkins tree expression selecting the fields to return.
+
+  Returns:
+      The decoded JSON response.
+
+  Raises:
+      requests.exceptions.RequestException: If the request fails.
+  """
+  constants = _get_jenkins_constants()
+  cache = _get_cache()
+  api_url = f"{url.rstrip('/')}/api/json"
+  validator_key = _cache_key("api_json", key_digest(f"{api_url}?tree={tree}"))
+  validator = cache.get(validator_key)
+  request_headers = {}
+  if validator:
+    if validator.get("etag"):
+      request_headers["If-None-Match"] = validator["etag"]
+    if validator.get("last_modified"):
+      request_headers["If-Modified-Since"] = validator["last_modified"]
+
+  response = jenkins_session.get(
+    api_url,
+    params={"tree": tree, "depth": 0},
+    auth=(constants["JENKINS_USER"], constants["JENKINS_TOKEN"]),
+    headers=request_headers,
+    timeout=30,
+  )
+  if validator and response.status_code == 304:
+    logger.debug(f"{api_url} not modified, reusing stored copy")
+    return validator["data"]
+
+  response.raise_for_status()
+  data = response.json()
+  etag = response.headers.get("ETag")
+  last_modified = response.headers.get("Last-Modified")
+  if etag or last_modified:
+    cache.set(
+      validator_key,
+      {"etag": etag, "last_modified": last_modified, "data": data},
+      ttl=API_JSON_VALIDATOR_TTL,
+    )
+  return data
@@ -4,17 +4,18 @@ import logging
 from typing import List, Dict, Any, Union
 
 # Third-party imports
-from jenkinsapi.jenkins import JenkinsAPIException
+import requests
 
 # Internal imports
-from ...cache import cache as _cache
+from ...cache import cache as _cache, key_digest, singleflight
 from .jenkins_client import (
   j as _j,
   JENKINS_URL as _JENKINS_URL,
   JENKINS_USER as _JENKINS_USER,
   JENKINS_TOKEN as _JENKINS_TOKEN,
 )
-from .jenkins_converters import _to_dict as _original_to_dict
+from .jenkins_converters import _job_json_to_dict, _to_dict as _original_to_dict
+from .jenkins_helpers import _cache_key, _jenkins_api_json
 
 # Expose constants at module level for testing
 JENKINS_URL = _JENKINS_URL
@@ -75,13 +76,38 @@ def _get_cache():
 
 logger = logging.getLogger(__name__)
 
+# Everything the job summary needs comes back in one response; going through
+# jenkinsapi's Job objects instead costs one request per job plus one per
+# is_enabled()/is_queued() call.
+JOBS_TREE = "jobs[name,url,color,inQueue,lastBuild[number,url]]"
 
+# The job list TTL starts at JOBS_MIN_TTL and doubles up to JOBS_MAX_TTL while
+# consecutive fetches return the same jobs. A digest of the last list is kept
+# to tell whether it changed.
+JOBS_MIN_TTL = 30
+JOBS_MAX_TTL = 600
+JOBS_DIGEST_TTL = 3600
+
+
+def _fetch_jobs(url: str) -> List[Dict[str, Any]]:
+  """Fetch job summaries under ``url``, descending into folders."""
+  result = []
+  for job in _jenkins_api_json(url, JOBS_TREE).get("jobs", []):
+    # Folders have no build status color; list their jobs as well
+    if "color" not in job:
+      result.extend(_fetch_jobs(job["url"]))
+    else:
+      result.append(_job_json_to_dict(job))
+  return result
+
+
+@singleflight
 def jenkins_get_jobs() -> Union[List[Dict[str, Any]], Dict[str, str]]:
   """Internal logic for getting all jobs."""
   logger.debug("jenkins_get_jobs called")
 
   # Check cache first
-  cache_key = "jenkins:jobs:all"
+  cache_key = _cache_key("jobs", "all")
   cache = _get_cache()
   cached = cache.get(cache_key)
   if cached:
@@ -91,7 +117,7 @@ def jenkins_get_jobs() -> Union[List[Dict[str, Any]], Dict[str, str]]:
   j = _get_jenkins_client()
   constants = _get_jenkins_constants()
 
-  if not j:
+  if j is None:
     logger.error("jenkins_get_jobs: Jenkins client not initialized.")
     if (
       not constants["JENKINS_URL"]
@@ -106,15 +132,22 @@ def jenkins_get_jobs() -> Union[List[Dict[str, Any]], Dict[str, str]]:
       "error": "Jenkins client not initialized. Please set the JENKINS_URL, JENKINS_USER, and JENKINS_TOKEN environment variables."
     }
   try:
-    jobs = j.values()
-    logger.debug(f"Found {len(jobs)} jobs.")
-    to_dict_func = _get_to_dict()
-    result = [to_dict_func(job) for job in jobs]
-    cache.set(cache_key, result, ttl=300)  # Cache for 5 minutes
+    result = _fetch_jobs(constants["JENKINS_URL"])
+    logger.debug(f"Found {len(result)} jobs.")
+    digest_key = _cache_key("jobs", "all", "digest")
+    digest = key_digest(repr(result))
+    changed = cache.get(digest_key) != digest
+    cache.set(digest_key, digest, ttl=JOBS_DIGEST_TTL)
+    cache.set_adaptive(
+      cache_key, result, changed=changed, min_ttl=JOBS_MIN_TTL, max_ttl=JOBS_MAX_TTL
+    )
     return result
-  except JenkinsAPIException as e:
-    logger.error(f"jenkins_get_jobs Jenkins Error: {e}", exc_info=True)
-    return {"error": f"Jenkins API Error: {e}"}
+  except requests.exceptions.HTTPError as e:
+    logger.error(f"jenkins_get_jobs HTTP error: {e}")
+    return {"error": f"Jenkins API HTTP Error: {e.response.status_code}"}
+  except requests.exceptions.RequestException as e:
+    logger.error(f"jenkins_get_jobs request error: {e}")
+    return {"error": "Jenkins API Request Error"}
   except Exception as e:
     logger.error(f"Unexpected error in jenkins_get_jobs: {e}", exc_info=True)
     return {"error": f"An unexpected error occurred: {e}"}
@@ -2,18 +2,53 @@
 
 import logging
 import requests
-from typing import Dict, Union
+from typing import Dict, List, Union
 
 # Internal imports
+from ...cache import singleflight
 from .jenkins_helpers import (
   _get_jenkins_constants,
+  _cache_key,
   _get_cache,
   check_jenkins_credentials,
 )
+from .jenkins_client import jenkins_session
 
 logger = logging.getLogger(__name__)
 
+# The console is streamed in chunks of this size and the download stops once
+# the requested lines have arrived, so large logs are never fetched in full.
+CONSOLE_CHUNK_SIZE = 64 * 1024
 
+# A finished build's log never changes, so it is cached for a week. Logs of a
+# running build (Jenkins sends X-More-Data: true) are only cached briefly, and
+# "latest build" requests expire sooner because the latest build moves on.
+BUILD_LOG_RUNNING_TTL = 15
+BUILD_LOG_LATEST_TTL = 300
+BUILD_LOG_COMPLETED_TTL = 7 * 86400
+
+# A tail read starts this many bytes per requested line before the end of the
+# log, and widens the window until it holds enough lines.
+LOG_TAIL_BYTES_PER_LINE = 256
+
+
+def _read_console_bytes(response: requests.Response, line_count: int) -> bytes:
+  """Read a streamed console response until it holds line_count complete lines.
+
+  The chunks are kept as raw bytes so that only the requested lines are decoded
+  later, rather than everything read before them.
+  """
+  chunks = []
+  newlines = 0
+  for chunk in response.iter_content(chunk_size=CONSOLE_CHUNK_SIZE):
+    chunks.append(chunk)
+    newlines += chunk.count(b"\n")
+    if newlines >= line_count:
+      break
+  return b"".join(chunks)
+
+
+@singleflight
 def jenkins_get_build_log(
   job_name: str, build_number: int, start: int = 0, lines: int = 50
 ) -> Union[str, Dict[str, str]]:
@@ -33,7 +68,7 @@ def jenkins_get_build_log(
   )
 
   # Check cache first
-  cache_key = f"jenkins:build_log:{job_name}:{build_number}:{start}:{lines}"
+  cache_key = _cache_key("build_log", job_name, build_number, start, lines)
   cache = _get_cache()
   cached_log = cache.get(cache_key)
   if cached_log:
@@ -47,16 +82,13 @@ def jenkins_get_build_log(
 
   constants = _get_jenkins_constants()
 
+  latest_requested = build_number <= 0
   try:
     # Use REST API to get console output
-    if build_number > 0:
-      console_url = (
-        f"{constants['JENKINS_URL']}/job/{job_name}/{build_number}/consoleText"
-      )
-    else:
+    if latest_requested:
       # Get last build number first
       job_url = f"{constants['JENKINS_URL']}/job/{job_name}/api/json"
-      response = requests.get(
+      response = jenkins_session.get(
         job_url,
         auth=(constants["JENKINS_USER"], constants["JENKINS_TOKEN"]),
         timeout=30,
@@ -67,32 +99,44 @@ def jenkins_get_build_log(
       if not last_build:
         return {"error": f"No builds found for job {job_name}"}
       build_number = last_build.get("number")
-      console_url = (
-        f"{constants['JENKINS_URL']}/job/{job_name}/{build_number}/consoleText"
-      )
 
-    # Get console output
-    response = requests.get(
+    # progressiveText returns the same plain text as consoleText and also
+    # reports whether the build is still writing to it
+    build_url = f"{constants['JENKINS_URL']}/job/{job_name}/{build_number}"
+    console_url = f"{build_url}/logText/progressiveText?start=0"
+
+    # Get console output, reading only as far as the last requested line
+    response = jenkins_session.get(
       console_url,
       auth=(constants["JENKINS_USER"], constants["JENKINS_TOKEN"]),
       timeout=30,
+      stream=True,
     )
-    response.raise_for_status()
+    try:
+      response.raise_for_status()
+      console_output = _read_console_bytes(response, start + lines)
+      running = response.headers.get("X-More-Data") == "true"
+    finally:
+      response.close()
 
-    console_output = response.text
     if not console_output:
       logger.warning(f"No console output found for build {build_number}")
       return {"error": f"No console output found for build {build_number}"}
 
     # Extract the requested portion of the log
-    log_lines = console_output.split("\n")
+    # Jenkins serves console text as UTF-8
+    log_lines = console_output.split(b"\n")
     end = min(start + lines, len(log_lines))
-    log_portion = "\n".join(log_lines[start:end])
+    log_portion = b"\n".join(log_lines[start:end]).decode("utf-8", errors="replace")
 
-    logger.debug(
-      f"Retrieved {len(log_lines)} total lines, returning lines {start} to {end}"
-    )
-    cache.set(cache_key, log_portion, ttl=300)  # Cache for 5 minutes
+    logger.debug(f"Read {len(log_lines)} lines, returning lines {start} to {end}")
+    if running:
+      ttl = BUILD_LOG_RUNNING_TTL
+    elif latest_requested:
+      ttl = BUILD_LOG_LATEST_TTL
+    else:
+      ttl = BUILD_LOG_COMPLETED_TTL
+    cache.set(cache_key, log_portion, ttl=ttl)
     return log_portion
 
   except requests.exceptions.HTTPError as e:
@@ -115,3 +159,116 @@ def jenkins_get_build_log(
   except Exception as e:
     logger.error(f"jenkins_get_build_log error: {e}")
     return {"error": f"An unexpected error occurred: {e}"}
+
+
+def _tail_lines(content: bytes, lines: int, partial_first_line: bool) -> List[bytes]:
+  """Split console bytes into lines and return at most the last ``lines``."""
+  log_lines = content.split(b"\n")
+  if partial_first_line:
+    # The read started mid-log, so the first line is incomplete
+    log_lines = log_lines[1:]
+  if log_lines and not log_lines[-1]:
+    log_lines.pop()
+  return log_lines[-lines:] if lines > 0 else []
+
+
+@singleflight
+def jenkins_get_build_log_tail(
+  job_name: str, build_number: int, lines: int = 50
+) -> Union[str, Dict[str, str]]:
+  """Get the last lines of the console log for a specific Jenkins build.
+
+  A first streamed request only reads the X-Text-Size header for the log's
+  length and is closed without reading the body. The tail is then requested
+  from an offset near the end, so the download grows with the requested lines
+  rather than with the size of the log.
+
+  Args:
+      job_name: Name of the Jenkins job
+      build_number: Build number to get the log tail for
+      lines: Number of lines to return from the end of the log
+
+  Returns:
+      String containing the last lines of the log or error dictionary
+  """
+  logger.debug(
+    f"jenkins_get_build_log_tail called with job_name: {job_name}, build_number: {build_number}, lines: {lines}"
+  )
+
+  # Check cache first
+  cache_key = _cache_key("build_log_tail", job_name, build_number, lines)
+  cache = _get_cache()
+  cached_log = cache.get(cache_key)
+  if cached_log:
+    logger.debug(f"Returning cached build log tail for {cache_key}")
+    return cached_log
+
+  # Check credentials
+  credentials_error = check_jenkins_credentials()
+  if credentials_error:
+    return credentials_error
+
+  constants = _get_jenkins_constants()
+  auth = (constants["JENKINS_USER"], constants["JENKINS_TOKEN"])
+  progressive_url = (
+    f"{constants['JENKINS_URL']}/job/{job_name}/{build_number}/logText/progressiveText"
+  )
+
+  try:
+    response = jenkins_session.get(
+      f"{progressive_url}?start=0", auth=auth, timeout=30, stream=True
+    )
+    try:
+      response.raise_for_status()
+      size = int(response.headers.get("X-Text-Size") or 0)
+    finally:
+      response.close()
+
+    window = max(lines, 1) * LOG_TAIL_BYTES_PER_LINE
+    while True:
+      # Start one byte before the window so its first line, which is always
+      # dropped, is either cut off or empty
+      start = max(size - window - 1, 0)
+      response = jenkins_session.get(
+        f"{progressive_url}?start={start}", auth=auth, timeout=30
+      )
+      response.raise_for_status()
+      tail = _tail_lines(response.content, lines, partial_first_line=start > 0)
+      if start == 0 or len(tail) >= lines:
+        break
+      window *= 4
+
+    if not tail:
+      logger.warning(f"No console output found for build {build_number}")
+      return {"error": f"No console output found for build {build_number}"}
+
+    # Jenkins serves console text as UTF-8
+    log_portion = b"\n".join(tail).decode("utf-8", errors="replace")
+    logger.debug(f"Returning last {len(tail)} lines of build {build_number}")
+    if response.headers.get("X-More-Data") == "true":
+      ttl = BUILD_LOG_RUNNING_TTL
+    else:
+      ttl = BUILD_LOG_COMPLETED_TTL
+    cache.set(cache_key, log_portion, ttl=ttl)
+    return log_portion
+
+  except requests.exceptions.HTTPError as e:
+    if e.response.status_code == 404:
+      logger.error(
+        f"jenkins_get_build_log_tail: Job '{job_name}' or build {build_number} not found."
+      )
+      return {"error": f"Job '{job_name}' or build {build_number} not found."}
+    logger.error(f"jenkins_get_build_log_tail HTTP error: {e}")
+    return {"error": f"Jenkins API HTTP Error: {e.response.status_code}"}
+  except requests.exceptions.ConnectionError as e:
+    logger.error(f"jenkins_get_build_log_tail connection error: {e}")
+    return {"error": "Could not connect to Jenkins API"}
+  except requests.exceptions.Timeout as e:
+    logger.error(f"jenkins_get_build_log_tail timeout error: {e}")
+    return {"error": "Timeout connecting to Jenkins API"}
+  except requests.exceptions.RequestException as e:
+    logger.error(f"jenkins_get_build_log_tail request error: {e}")
+    return {"error": "Jenkins API Request Error"}
+  except Exception as e:
+    logger.error(f"jenkins_get_build_log_tail error: {e}")
+    return {"error": f"An unexpected error occurred: {e}"}
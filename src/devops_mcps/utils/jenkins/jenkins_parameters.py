@@ -5,15 +5,30 @@ import requests
 from typing import Dict, List, Union, Any
 
 # Internal imports
+from ...cache import singleflight
 from .jenkins_helpers import (
   _get_jenkins_constants,
+  _cache_key,
   _get_cache,
   check_jenkins_credentials,
 )
+from .jenkins_client import jenkins_session
 
 logger = logging.getLogger(__name__)
 
+# Only the build number and parameter values are requested. For the latest
+# build the same selector is nested under lastBuild in the job query, so one
+# request returns both the build number and its parameters.
+BUILD_PARAMETERS_TREE = "number,actions[parameters[name,value]]"
 
+# A numbered build's parameters never change once it has started, so they are
+# cached for a week. "Latest build" lookups expire quickly because the latest
+# build moves on.
+BUILD_PARAMETERS_LATEST_TTL = 300
+BUILD_PARAMETERS_FIXED_TTL = 7 * 86400
+
+
+@singleflight
 def jenkins_get_build_parameters(
   job_name: str, build_number: int = 0
 ) -> Union[List[Dict[str, Any]], Dict[str, str]]:
@@ -31,7 +46,7 @@ def jenkins_get_build_parameters(
   )
 
   # Check cache first
-  cache_key = f"jenkins:build_parameters:{job_name}:{build_number}"
+  cache_key = _cache_key("build_parameters", job_name, build_number)
   cache = _get_cache()
   cached_parameters = cache.get(cache_key)
   if cached_parameters:
@@ -45,38 +60,40 @@ def jenkins_get_build_parameters(
     return credentials_error
 
   constants = _get_jenkins_constants()
+  success_ttl = (
+    BUILD_PARAMETERS_FIXED_TTL if build_number > 0 else BUILD_PARAMETERS_LATEST_TTL
+  )
 
   try:
     # Use REST API to get build parameters
     if build_number > 0:
       # Get parameters for a specific build
       build_url = f"{constants['JENKINS_URL']}/job/{job_name}/{build_number}/api/json"
+      response = jenkins_session.get(
+        build_url,
+        params={"tree": BUILD_PARAMETERS_TREE},
+        auth=(constants["JENKINS_USER"], constants["JENKINS_TOKEN"]),
+        timeout=30,
+      )
+      response.raise_for_status()
+      build_data = response.json()
     else:
-      # Get parameters for the latest build
+      # Get the latest build and its parameters in the same request
       job_url = f"{constants['JENKINS_URL']}/job/{job_name}/api/json"
-      response = requests.get(
+      response = jenkins_session.get(
         job_url,
+        params={"tree": f"lastBuild[{BUILD_PARAMETERS_TREE}]"},
         auth=(constants["JENKINS_USER"], constants["JENKINS_TOKEN"]),
         timeout=30,
       )
       response.raise_for_status()
       job_data = response.json()
-      last_build = job_data.get("lastBuild")
-      if not last_build:
+      build_data = job_data.get("lastBuild")
+      if not build_data:
         error_dict = {"error": f"No builds found for job {job_name}"}
         cache.set(cache_key, error_dict, ttl=300)  # Cache error for 5 minutes
         return error_dict
-      build_number = last_build.get("number")
-      build_url = f"{constants['JENKINS_URL']}/job/{job_name}/{build_number}/api/json"
-
-    # Get build data
-    response = requests.get(
-      build_url,
-      auth=(constants["JENKINS_USER"], constants["JENKINS_TOKEN"]),
-      timeout=30,
-    )
-    response.raise_for_status()
-    build_data = response.json()
+      build_number = build_data.get("number")
 
     # Extract parameters
     actions = build_data.get("actions", [])
@@ -99,7 +116,7 @@ def jenkins_get_build_parameters(
       param_dict = {}
 
     logger.debug(f"Retrieved {len(param_dict)} parameters for build {build_number}")
-    cache.set(cache_key, param_dict, ttl=300)  # Cache for 5 minutes
+    cache.set(cache_key, param_dict, ttl=success_ttl)
     return param_dict
 
   except requests.exceptions.HTTPError as e:
@@ -7,7 +7,7 @@ from typing import Dict, Any, Union
 from jenkinsapi.jenkins import JenkinsAPIException
 
 # Internal imports
-from ...cache import cache as _cache
+from ...cache import cache as _cache, singleflight
 from .jenkins_client import (
   j as _j,
   JENKINS_URL as _JENKINS_URL,
@@ -15,6 +15,7 @@ from .jenkins_client import (
   JENKINS_TOKEN as _JENKINS_TOKEN,
 )
 from .jenkins_converters import _to_dict as _original_to_dict
+from .jenkins_helpers import _cache_key
 
 # Expose constants at module level for testing
 JENKINS_URL = _JENKINS_URL
@@ -75,12 +76,13 @@ def _get_cache():
 logger = logging.getLogger(__name__)
 
 
+@singleflight
 def jenkins_get_queue() -> Union[Dict[str, Any], Dict[str, str]]:
   """Get the current Jenkins queue information."""
   logger.debug("jenkins_get_queue called")
 
   # Check cache first
-  cache_key = "jenkins:queue:current"
+  cache_key = _cache_key("queue", "current")
   cache = _get_cache()
   cached = cache.get(cache_key)
   if cached:
@@ -91,7 +93,7 @@ def jenkins_get_queue() -> Union[Dict[str, Any], Dict[str, str]]:
   constants = _get_jenkins_constants()
   to_dict = _get_to_dict()
 
-  if not j:
+  if j is None:
     logger.error("jenkins_get_queue: Jenkins client not initialized.")
     if (
       not constants["JENKINS_URL"]
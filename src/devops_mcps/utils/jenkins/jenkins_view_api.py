@@ -4,10 +4,10 @@ import logging
 from typing import List, Dict, Any, Union
 
 # Third-party imports
-from jenkinsapi.jenkins import JenkinsAPIException
+import requests
 
 # Internal imports
-from ...cache import cache as _cache
+from ...cache import cache as _cache, singleflight
 from .jenkins_client import (
   j as _j,
   JENKINS_URL as _JENKINS_URL,
@@ -15,6 +15,7 @@ from .jenkins_client import (
   JENKINS_TOKEN as _JENKINS_TOKEN,
 )
 from .jenkins_converters import _to_dict as _original_to_dict
+from .jenkins_helpers import _cache_key, _jenkins_api_json
 
 # Expose constants at module level for testing
 JENKINS_URL = _JENKINS_URL
@@ -74,13 +75,17 @@ def _get_cache():
 
 logger = logging.getLogger(__name__)
 
+# Only view names are returned, so nothing else is requested
+VIEWS_TREE = "views[name]"
 
+
+@singleflight
 def jenkins_get_all_views() -> Union[List[Dict[str, Any]], Dict[str, str]]:
   """Get all the views from the Jenkins."""
   logger.debug("jenkins_get_all_views called")
 
   # Check cache first
-  cache_key = "jenkins:views:all"
+  cache_key = _cache_key("views", "all")
   cache = _get_cache()
   cached = cache.get(cache_key)
   if cached:
@@ -91,7 +96,7 @@ def jenkins_get_all_views() -> Union[List[Dict[str, Any]], Dict[str, str]]:
   constants = _get_jenkins_constants()
   to_dict = _get_to_dict()
 
-  if not j:
+  if j is None:
     logger.error("jenkins_get_all_views: Jenkins client not initialized.")
     if (
       not constants["JENKINS_URL"]
@@ -106,14 +111,17 @@ def jenkins_get_all_views() -> Union[List[Dict[str, Any]], Dict[str, str]]:
       "error": "Jenkins client not initialized. Please set the JENKINS_URL, JENKINS_USER, and JENKINS_TOKEN environment variables."
     }
   try:
-    views = j.views.keys()
+    views = _jenkins_api_json(constants["JENKINS_URL"], VIEWS_TREE).get("views", [])
     logger.debug(f"Found {len(views)} views.")
-    result = [to_dict(view) for view in views]  # modified to use .values()
+    result = [to_dict(view.get("name")) for view in views]
     cache.set(cache_key, result, ttl=600)  # Cache for 10 minutes
     return result
-  except JenkinsAPIException as e:
-    logger.error(f"jenkins_get_all_views Jenkins Error: {e}", exc_info=True)
-    return {"error": f"Jenkins API Error: {e}"}
+  except requests.exceptions.HTTPError as e:
+    logger.error(f"jenkins_get_all_views HTTP error: {e}")
+    return {"error": f"Jenkins API HTTP Error: {e.response.status_code}"}
+  except requests.exceptions.RequestException as e:
+    logger.error(f"jenkins_get_all_views request error: {e}")
+    return {"error": "Jenkins API Request Error"}
   except Exception as e:
     logger.error(f"Unexpected error in jenkins_get_all_views: {e}", exc_info=True)
     return {"error": f"An unexpected error occurred: {e}"}
@@ -1,9 +1,10 @@
 """Tests for cache module."""
 
 import pytest
-import time
 import threading
-from devops_mcps.cache import CacheManager
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from devops_mcps.cache import CacheManager, key_digest, singleflight
 
 
 @pytest.fixture
@@ -22,8 +23,10 @@ def test_cache_expiration(cache):
   """Test TTL expiration."""
   cache.set("temp_key", "temp_value", ttl=1)  # 1 second TTL
   assert cache.get("temp_key") == "temp_value"
-  time.sleep(1.1)  # Wait for expiration
-  assert cache.get("temp_key") is None
+  # Advance the clock past the TTL instead of sleeping
+  with patch("devops_mcps.cache.datetime") as mock_datetime:
+    mock_datetime.now.return_value = datetime.now() + timedelta(seconds=1.1)
+    assert cache.get("temp_key") is None
 
 
 def test_cache_delete(cache):
@@ -43,6 +46,62 @@ def test_cache_clear(cache):
   assert cache.get("key2") is None
 
 
+def test_cache_delete_prefix(cache):
+  """Test deleting every key under a prefix."""
+  cache.set("jenkins:build_log:job:1", "log1")
+  cache.set("jenkins:build_log:job:2", "log2")
+  cache.set("jenkins:jobs:all", ["job"])
+  assert cache.delete_prefix("jenkins:build_log:") == 2
+  assert cache.get("jenkins:build_log:job:1") is None
+  assert cache.get("jenkins:build_log:job:2") is None
+  assert cache.get("jenkins:jobs:all") == ["job"]
+  assert cache.delete_prefix("jenkins:build_log:") == 0
+
+
+def test_cache_set_adaptive(cache):
+  """Test adaptive TTL grows while unchanged and shrinks on change."""
+  assert cache.set_adaptive("key", "v1", changed=True, min_ttl=10, max_ttl=40) == 10
+  assert cache.set_adaptive("key", "v1", changed=False, min_ttl=10, max_ttl=40) == 20
+  assert cache.set_adaptive("key", "v1", changed=False, min_ttl=10, max_ttl=40) == 40
+  assert cache.set_adaptive("key", "v1", changed=False, min_ttl=10, max_ttl=40) == 40
+  assert cache.set_adaptive("key", "v2", changed=True, min_ttl=10, max_ttl=40) == 20
+  assert cache.get("key") == "v2"
+  cache.delete("key")
+  assert cache.set_adaptive("key", "v3", changed=False, min_ttl=10, max_ttl=40) == 10
+
+
+def test_cache_set_adaptive_carries_over_expiry(cache):
+  """Test the adaptive TTL survives a re-fetch right after the entry expires."""
+  cache.set_adaptive("key", "v1", changed=True, min_ttl=10, max_ttl=40)
+  with patch("devops_mcps.cache.datetime") as mock_datetime:
+    mock_datetime.now.return_value = datetime.now() + timedelta(seconds=11)
+    assert cache.get("key") is None
+    assert cache.set_adaptive("key", "v1", changed=False, min_ttl=10, max_ttl=40) == 20
+
+
+def test_cache_expired_adaptive_key_leaves_nothing_behind(cache):
+  """Test an adaptive key that stays expired is removed entirely."""
+  cache.set_adaptive("key", "v1", changed=True, min_ttl=10, max_ttl=40)
+  with patch("devops_mcps.cache.datetime") as mock_datetime:
+    # Just expired: the value is dropped, only the TTL is remembered
+    mock_datetime.now.return_value = datetime.now() + timedelta(seconds=11)
+    assert cache.get("key") is None
+    assert cache._cache["key"]["value"] is None
+    # Expired for longer than its TTL: nothing is left for the key
+    mock_datetime.now.return_value = datetime.now() + timedelta(seconds=25)
+    assert cache.get("key") is None
+  assert "key" not in cache._cache
+  assert cache.set_adaptive("key", "v2", changed=False, min_ttl=10, max_ttl=40) == 10
+
+
+def test_key_digest_is_short_and_stable():
+  """Test key_digest yields a fixed-length, deterministic digest."""
+  long_query = "language:python " * 100
+  assert key_digest(long_query) == key_digest(long_query)
+  assert len(key_digest(long_query)) == 16
+  assert key_digest("a") != key_digest("b")
+
+
 def test_thread_safety(cache):
   """Test thread safety with concurrent access."""
   results = []
@@ -60,3 +119,54 @@ def test_thread_safety(cache):
 
   assert len(results) == 1000
   assert all(isinstance(x, int) for x in results)
+
+
+def test_singleflight_shares_inflight_result():
+  """Test concurrent identical calls run the wrapped function once."""
+  started = threading.Event()
+  release = threading.Event()
+  calls = []
+
+  @singleflight
+  def fetch(key):
+    calls.append(key)
+    started.set()
+    release.wait(5)
+    return {"key": key}
+
+  results = []
+  with patch("devops_mcps.cache.logger") as mock_logger:
+    leader = threading.Thread(target=lambda: results.append(fetch("a")))
+    leader.start()
+    started.wait(5)
+    followers = [
+      threading.Thread(target=lambda: results.append(fetch("a"))) for _ in range(3)
+    ]
+    for t in followers:
+      t.start()
+    # Each follower logs once it has committed to waiting on the leader
+    deadline = datetime.now() + timedelta(seconds=5)
+    while mock_logger.debug.call_count < 3 and datetime.now() < deadline:
+      threading.Event().wait(0.01)
+    release.set()
+    for t in [leader, *followers]:
+      t.join()
+
+  assert calls == ["a"]
+  assert results == [{"key": "a"}] * 4
+
+
+def test_singleflight_propagates_exception_and_clears():
+  """Test a failed call raises and does not block later calls."""
+  calls = []
+
+  @singleflight
+  def fetch(key):
+    calls.append(key)
+    raise ValueError("boom")
+
+  with pytest.raises(ValueError):
+    fetch("a")
+  with pytest.raises(ValueError):
+    fetch("a")
+  assert calls == ["a", "a"]
@@ -98,6 +98,22 @@ async def test_get_repository_valid(monkeypatch):
   assert result == expected_repo
 
 
+@pytest.mark.asyncio
+async def test_github_tools_run_off_event_loop_thread(monkeypatch):
+  import threading
+
+  calling_threads = []
+
+  def fake_get_repository(owner, repo):
+    calling_threads.append(threading.current_thread())
+    return {"name": repo}
+
+  monkeypatch.setattr(core.github, "gh_get_repository", fake_get_repository)
+  result = await core.get_repository("owner", "repo")
+  assert result == {"name": "repo"}
+  assert calling_threads[0] is not threading.current_thread()
+
+
 @pytest.mark.asyncio
 async def test_search_code_valid(monkeypatch):
   expected_results = [{"name": "file.py", "path": "src/file.py"}]
@@ -969,6 +985,22 @@ async def test_clear_cache_success(mock_logger):
   mock_logger.info.assert_called_with("Cache cleared successfully")
 
 
+@pytest.mark.asyncio
+@patch("devops_mcps.mcp_tools.logger")
+async def test_clear_cache_with_prefix(mock_logger):
+  """Test clearing only the cache entries under a prefix."""
+  mock_cache = MagicMock()
+  mock_cache.delete_prefix.return_value = 3
+
+  with patch("devops_mcps.cache.cache", mock_cache):
+    result = await core.clear_cache(prefix="jenkins:recent_failed_builds:")
+
+  mock_cache.delete_prefix.assert_called_once_with("jenkins:recent_failed_builds:")
+  mock_cache.clear.assert_not_called()
+  assert result["status"] == "success"
+  assert "Cleared 3 cache entries" in result["message"]
+
+
 @pytest.mark.asyncio
 @patch("devops_mcps.mcp_tools.logger")
 async def test_clear_cache_import_error(mock_logger):
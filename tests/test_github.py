@@ -4,7 +4,7 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import Mock, patch, MagicMock, PropertyMock, call
 
 from devops_mcps.github import (
   initialize_github_client,
@@ -27,6 +27,7 @@ from devops_mcps.github import (
   get_issue_details,
   get_github_issue_content,
 )
+from devops_mcps.cache import key_digest
 from devops_mcps.utils.github.github_converters import _to_dict, _handle_paginated_list
 from github import (
   UnknownObjectException,
@@ -43,6 +44,13 @@ from github.PaginatedList import PaginatedList
 # --- Test Fixtures ---
 
 
+@pytest.fixture(autouse=True)
+def reset_github_client():
+  """Start every test without a GitHub client cached by an earlier test."""
+  with patch("devops_mcps.utils.github_client.g", None):
+    yield
+
+
 @pytest.fixture
 def mock_env_vars(monkeypatch):
   """Set up mock environment variables for GitHub client."""
@@ -284,6 +292,7 @@ def test_initialize_github_client_with_custom_api_url(mock_github, mock_logger):
       auth=mock_github.call_args[1]["auth"],
       timeout=60,
       per_page=10,
+      pool_size=32,
       base_url="https://github.enterprise.com/api/v3",
     )
 
@@ -435,6 +444,52 @@ def test_to_dict_with_content_file():
   assert result["repository_full_name"] == "owner/repo"
 
 
+def test_to_dict_with_content_file_raw_data():
+  """Test _to_dict reads ContentFile fields from raw data without lazy lookups."""
+  from github.ContentFile import ContentFile
+
+  mock_content = Mock(spec=ContentFile)
+  mock_content._rawData = {
+    "type": "file",
+    "name": "test.py",
+    "path": "src/test.py",
+    "size": 1024,
+    "sha": "abc123",
+    "url": "https://api.github.com/repos/owner/repo/contents/src/test.py?ref=main",
+    "html_url": "https://github.com/owner/repo/blob/main/src/test.py",
+  }
+  # Resolving the lazy repository would cost an extra request per item
+  type(mock_content).repository = PropertyMock(side_effect=AssertionError)
+
+  result = _to_dict(mock_content)
+
+  assert result == {
+    "type": "file",
+    "name": "test.py",
+    "path": "src/test.py",
+    "size": 1024,
+    "html_url": "https://github.com/owner/repo/blob/main/src/test.py",
+    "repository_full_name": "owner/repo",
+  }
+
+
+def test_to_dict_with_content_file_raw_search_result():
+  """Test _to_dict uses the embedded repository of a code search result."""
+  from github.ContentFile import ContentFile
+
+  mock_content = Mock(spec=ContentFile)
+  mock_content._rawData = {
+    "name": "test.py",
+    "path": "src/test.py",
+    "repository": {"full_name": "owner/repo"},
+  }
+
+  result = _to_dict(mock_content)
+
+  assert result["name"] == "test.py"
+  assert result["repository_full_name"] == "owner/repo"
+
+
 def test_to_dict_with_basic_types():
   """Test _to_dict with basic Python types."""
   assert _to_dict("string") == "string"
@@ -540,6 +595,21 @@ def test_to_dict_with_raw_data_fallback():
   assert result == {"key1": "value1", "key2": 123}
 
 
+def test_to_dict_raw_data_fallback_without_unittest_mock_loaded():
+  """Test that _to_dict does not import unittest.mock when it is not loaded."""
+
+  class ObjectWithRawData:
+    def __init__(self):
+      self._rawData = {"key1": "value1"}
+
+  with patch.dict(sys.modules):
+    del sys.modules["unittest.mock"]
+    result = _to_dict(ObjectWithRawData())
+    assert "unittest.mock" not in sys.modules
+
+  assert result == {"key1": "value1"}
+
+
 def test_to_dict_with_mock_raw_data():
   """Test _to_dict with mock object containing mock values in _rawData."""
 
@@ -799,7 +869,119 @@ def test_gh_get_file_contents_file(mock_cache_patch, mock_github_api):
   result = gh_get_file_contents("owner", "repo", "path/to/file")
 
   assert result == "test content"
-  mock_cache_patch.set.assert_called_once()
+  mock_cache_patch.set_adaptive.assert_called_once_with(
+    "github:get_file:owner/repo/path/to/file:default",
+    "test content",
+    changed=True,
+    min_ttl=1800,
+    max_ttl=21600,
+  )
+  mock_cache_patch.set.assert_any_call(
+    "github:get_file:owner/repo/path/to/file:default:validator",
+    {
+      "url": mock_content.url,
+      "etag": mock_content.etag,
+      "last_modified": mock_content.last_modified,
+      "result": "test content",
+    },
+    ttl=86400,
+  )
+
+
+def test_gh_get_file_contents_large_file_cached_compressed(mock_github_api):
+  from devops_mcps.cache import CacheManager
+
+  large_text = "print('hello')\n" * 10000
+  mock_repo = Mock()
+  mock_content = Mock(spec=ContentFile)
+  mock_content.encoding = "base64"
+  mock_content.content = "cHJpbnQ="
+  mock_content.decoded_content = large_text.encode("utf-8")
+  mock_github_api.get_repo.return_value = mock_repo
+  mock_repo.get_contents.return_value = mock_content
+
+  test_cache = CacheManager()
+  with patch("devops_mcps.utils.github.github_repository_api.cache", test_cache):
+    result = gh_get_file_contents("owner", "repo", "big.py")
+    stored = test_cache.get("github:get_file:owner/repo/big.py:default")
+    cached_result = gh_get_file_contents("owner", "repo", "big.py")
+
+  assert result == large_text
+  assert isinstance(stored, bytes)
+  assert len(stored) < len(large_text)
+  assert cached_result == large_text
+  mock_repo.get_contents.assert_called_once()
+
+  # Neither the result nor the validator entry keeps an uncompressed copy
+  def stored_values(value):
+    if isinstance(value, dict):
+      for item in value.values():
+        yield from stored_values(item)
+    else:
+      yield value
+
+  for entry in test_cache._cache.values():
+    for value in stored_values(entry["value"]):
+      assert value is not mock_content
+      assert not (isinstance(value, (str, bytes)) and len(value) >= len(large_text))
+
+
+@patch("devops_mcps.utils.github.github_repository_api.cache")
+def test_gh_get_file_contents_binary_extension_skips_decode(
+  mock_cache_patch, mock_github_api
+):
+  mock_cache_patch.get.return_value = None
+  mock_repo = Mock()
+  mock_content = Mock(spec=ContentFile)
+  mock_content.encoding = "base64"
+  mock_content.content = "iVBORw0KGgo="
+  type(mock_content).decoded_content = PropertyMock(side_effect=AssertionError)
+  mock_content._rawData = {"type": "file", "name": "logo.png", "path": "img/logo.PNG"}
+  mock_github_api.get_repo.return_value = mock_repo
+  mock_repo.get_contents.return_value = mock_content
+
+  result = gh_get_file_contents("owner", "repo", "img/logo.PNG")
+
+  assert result["error"] == "Could not decode content (likely binary file)."
+  assert result["name"] == "logo.png"
+  mock_cache_patch.set_adaptive.assert_not_called()
+
+
+@patch("devops_mcps.utils.github.github_repository_api.cache")
+def test_gh_get_file_contents_not_modified(mock_cache_patch, mock_github_api):
+  url = "https://api.github.com/repos/owner/repo/contents/path/to/file"
+  mock_cache_patch.get.side_effect = lambda key: (
+    {
+      "url": url,
+      "etag": '"abc123"',
+      "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+      "result": "old content",
+    }
+    if key.endswith(":validator")
+    else None
+  )
+  mock_github_api.requester = Mock()
+  mock_github_api.requester.requestJson.return_value = (304, {}, "")
+
+  result = gh_get_file_contents("owner", "repo", "path/to/file")
+
+  assert result == "old content"
+  mock_github_api.requester.requestJson.assert_called_once_with(
+    "GET",
+    url,
+    headers={
+      "If-None-Match": '"abc123"',
+      "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    },
+  )
+  mock_github_api.get_repo.assert_not_called()
+  mock_cache_patch.set_adaptive.assert_called_once_with(
+    "github:get_file:owner/repo/path/to/file:default",
+    "old content",
+    changed=False,
+    min_ttl=1800,
+    max_ttl=21600,
+  )
 
 
 @patch("devops_mcps.utils.github.github_repository_api.cache")
@@ -819,7 +1001,44 @@ def test_gh_get_file_contents_directory(mock_cache_patch, mock_github_api):
   assert isinstance(result, list)
   assert len(result) == 2
   assert len(result) == 2
-  mock_cache_patch.set.assert_called_once()
+  mock_cache_patch.set.assert_called_once_with(
+    "github:get_file:owner/repo/path/to/dir:default", result, ttl=1800
+  )
+  mock_cache_patch.set_adaptive.assert_not_called()
+
+
+@patch("devops_mcps.utils.github.github_repository_api.cache")
+def test_gh_get_file_contents_raw_content_cached_adaptively(
+  mock_cache_patch, mock_github_api
+):
+  mock_cache_patch.get.return_value = None
+  mock_repo = Mock()
+  mock_content = Mock(spec=ContentFile)
+  mock_content.encoding = None
+  mock_content.content = "Raw file content"
+  mock_github_api.get_repo.return_value = mock_repo
+  mock_repo.get_contents.return_value = mock_content
+
+  result = gh_get_file_contents("owner", "repo", "path/to/raw.txt")
+
+  assert result == "Raw file content"
+  mock_cache_patch.set_adaptive.assert_called_once_with(
+    "github:get_file:owner/repo/path/to/raw.txt:default",
+    "Raw file content",
+    changed=True,
+    min_ttl=1800,
+    max_ttl=21600,
+  )
+  mock_cache_patch.set.assert_called_once_with(
+    "github:get_file:owner/repo/path/to/raw.txt:default:validator",
+    {
+      "url": mock_content.url,
+      "etag": mock_content.etag,
+      "last_modified": mock_content.last_modified,
+      "result": "Raw file content",
+    },
+    ttl=86400,
+  )
 
 
 @patch("devops_mcps.utils.github.github_repository_api.logger")
@@ -949,6 +1168,20 @@ def test_gh_list_issues_success(mock_cache_patch, mock_github_api):
   mock_cache_patch.set.assert_called_once()
 
 
+@patch("devops_mcps.utils.github.github_search_api.cache")
+def test_gh_search_repositories_skips_total_count(mock_cache_patch, mock_github_api):
+  """Test the search does not read totalCount, which costs an extra request."""
+  mock_cache_patch.get.return_value = None
+  mock_search = Mock(spec=PaginatedList)
+  type(mock_search).totalCount = PropertyMock(side_effect=AssertionError)
+  mock_search.get_page.return_value = []
+  mock_github_api.search_repositories.return_value = mock_search
+
+  result = gh_search_repositories("query")
+
+  assert result == []
+
+
 # --- Test gh_get_repository ---
 
 
@@ -971,7 +1204,66 @@ def test_gh_get_repository_success(mock_cache_patch, mock_init_client, mock_gith
 
   assert isinstance(result, dict)
   assert result["name"] == "test-repo"
-  mock_cache_patch.set.assert_called_once()
+  mock_cache_patch.set_adaptive.assert_called_once_with(
+    "github:get_repo:owner/repo",
+    result,
+    changed=True,
+    min_ttl=3600,
+    max_ttl=21600,
+  )
+  mock_cache_patch.set.assert_any_call(
+    "github:get_repo:owner/repo:validator",
+    {"object": mock_repo, "result": result},
+    ttl=86400,
+  )
+
+
+@patch("devops_mcps.utils.github.github_repository_api.initialize_github_client")
+@patch("devops_mcps.utils.github.github_repository_api.cache")
+def test_gh_get_repository_not_modified(mock_cache_patch, mock_init_client):
+  mock_repo = Mock(spec=Repository)
+  mock_repo.update.return_value = False
+  previous = {"name": "test-repo"}
+  mock_cache_patch.get.side_effect = lambda key: (
+    {"object": mock_repo, "result": previous} if key.endswith(":validator") else None
+  )
+  mock_client = Mock()
+  mock_init_client.return_value = mock_client
+
+  result = gh_get_repository("owner", "repo")
+
+  assert result == previous
+  mock_repo.update.assert_called_once_with()
+  mock_client.get_repo.assert_not_called()
+  mock_cache_patch.set_adaptive.assert_called_once_with(
+    "github:get_repo:owner/repo",
+    previous,
+    changed=False,
+    min_ttl=3600,
+    max_ttl=21600,
+  )
+
+
+@patch("devops_mcps.utils.github.github_repository_api.initialize_github_client")
+@patch("devops_mcps.utils.github.github_repository_api.cache")
+def test_gh_get_repository_modified_reuses_refreshed_object(
+  mock_cache_patch, mock_init_client
+):
+  mock_repo = Mock(spec=Repository)
+  mock_repo.update.return_value = True
+  mock_repo._rawData = {"name": "renamed-repo"}
+  mock_cache_patch.get.side_effect = lambda key: (
+    {"object": mock_repo, "result": {"name": "test-repo"}}
+    if key.endswith(":validator")
+    else None
+  )
+  mock_client = Mock()
+  mock_init_client.return_value = mock_client
+
+  result = gh_get_repository("owner", "repo")
+
+  assert result["name"] == "renamed-repo"
+  mock_client.get_repo.assert_not_called()
 
 
 # --- Test gh_search_code ---
@@ -1062,9 +1354,13 @@ def test_gh_get_current_user_info_invalid_credentials(mock_cache_patch, mock_log
       mock_init_client.return_value = mock_client
       from devops_mcps.github import gh_get_current_user_info
 
-      result = gh_get_current_user_info()
+      with patch(
+        "devops_mcps.utils.github.github_user_api.reset_github_client"
+      ) as mock_reset:
+        result = gh_get_current_user_info()
       assert "error" in result
       assert "Authentication failed" in result["error"]
+      mock_reset.assert_called_once_with()
 
 
 @patch("devops_mcps.utils.github.github_user_api.logger")
@@ -1160,22 +1456,22 @@ def test_gh_get_issue_details_success(mock_cache_patch, mock_logger):
     "devops_mcps.utils.github.github_issue_api.initialize_github_client"
   ) as mock_init_client:
     mock_client = Mock()
-    mock_issue = Mock()
-    mock_issue.title = "Test Issue"
-    mock_issue.body = "Issue description"
-    mock_issue.created_at.isoformat.return_value = "2023-01-01T00:00:00Z"
-
-    # Mock labels
-    mock_label = Mock()
-    mock_label.name = "bug"
-    mock_issue.labels = [mock_label]
-
-    # Mock comments
-    mock_comment = Mock()
-    mock_comment.body = "Test comment"
-    mock_issue.get_comments.return_value = [mock_comment]
-
-    mock_client.get_issue.return_value = mock_issue
+    mock_client.requester.graphql_query.return_value = (
+      {},
+      {
+        "data": {
+          "repository": {
+            "i1": {
+              "title": "Test Issue",
+              "createdAt": "2023-01-01T00:00:00Z",
+              "body": "Issue description",
+              "labels": {"nodes": [{"name": "bug"}]},
+              "comments": {"totalCount": 1, "nodes": [{"body": "Test comment"}]},
+            }
+          }
+        }
+      },
+    )
     mock_init_client.return_value = mock_client
 
     from devops_mcps.github import gh_get_issue_details
@@ -1185,7 +1481,14 @@ def test_gh_get_issue_details_success(mock_cache_patch, mock_logger):
     assert result["description"] == "Issue description"
     assert result["labels"] == ["bug"]
     assert result["comments"] == ["Test comment"]
-    assert result["timestamp"] == "2023-01-01T00:00:00Z"
+    assert result["timestamp"] == "2023-01-01T00:00:00+00:00"
+    query, variables = mock_client.requester.graphql_query.call_args[0]
+    assert "i1: issue(number: 1)" in query
+    assert variables == {"owner": "owner", "name": "repo"}
+    mock_client.get_repo.assert_not_called()
+    mock_cache_patch.set.assert_called_once_with(
+      "github:issue_details:owner:repo:1", result, ttl=300
+    )
 
 
 @patch("devops_mcps.utils.github.github_issue_api.logger")
@@ -1247,7 +1550,7 @@ def test_gh_get_issue_details_github_exception(mock_cache_patch, mock_logger):
       "devops_mcps.utils.github.github_issue_api.initialize_github_client"
     ) as mock_init_client:
       mock_client = Mock()
-      mock_client.get_issue.side_effect = GithubException(
+      mock_client.requester.graphql_query.side_effect = GithubException(
         404, {"message": "Not Found"}, {}
       )
       mock_init_client.return_value = mock_client
@@ -1271,7 +1574,7 @@ def test_gh_get_issue_details_unexpected_error(mock_cache_patch, mock_logger):
       "devops_mcps.utils.github.github_issue_api.initialize_github_client"
     ) as mock_init_client:
       mock_client = Mock()
-      mock_client.get_issue.side_effect = Exception("Unexpected error")
+      mock_client.requester.graphql_query.side_effect = Exception("Unexpected error")
       mock_init_client.return_value = mock_client
 
       from devops_mcps.github import gh_get_issue_details
@@ -1313,7 +1616,8 @@ def test_gh_get_issue_content_success(mock_github_api):
   mock_comment.body = "Test comment"
   mock_comment.user.login = "commenter1"
   mock_comment.created_at.isoformat.return_value = "2023-01-01T12:00:00Z"
-  mock_issue.get_comments.return_value = [mock_comment]
+  mock_issue.comments = 1
+  mock_issue.get_comments.return_value.get_page.return_value = [mock_comment]
 
   # Mock repository
   mock_repo = Mock()
@@ -1656,7 +1960,9 @@ def test_gh_search_code_cache_miss(mock_cache_patch, mock_github_api):
   assert result == expected_result
   mock_cache_patch.get.assert_called_once()
   mock_cache_patch.set.assert_called_once_with(
-    "github:search_code:new query:indexed:desc", expected_result, ttl=300
+    f"github:search_code:{key_digest('new query')}:indexed:desc",
+    expected_result,
+    ttl=300,
   )
 
 
@@ -1822,17 +2128,17 @@ def test_gh_search_code_cache_key_generation(mock_cache_patch, mock_github):
 
   # Verify cache keys
   expected_calls = [
-    call("github:search_code:query1:updated:asc"),
-    call("github:search_code:query2:indexed:desc"),
+    call(f"github:search_code:{key_digest('query1')}:updated:asc"),
+    call(f"github:search_code:{key_digest('query2')}:indexed:desc"),
   ]
   mock_cache_patch.get.assert_has_calls(expected_calls)
 
 
 @patch("devops_mcps.utils.github.github_search_api.cache")
-def test_gh_search_code_force_client_initialization(mock_cache_patch):
+def test_gh_search_code_reuses_client(mock_cache_patch):
   mock_cache_patch.get.return_value = None
   mock_cache_patch.set.return_value = None
-  """Test gh_search_code calls initialize_github_client with force=True."""
+  """Test gh_search_code reuses the cached client instead of forcing a new one."""
   with patch.dict(os.environ, {"GITHUB_PERSONAL_ACCESS_TOKEN": "fake_token"}):
     with patch(
       "devops_mcps.utils.github.github_search_api.initialize_github_client"
@@ -1846,7 +2152,7 @@ def test_gh_search_code_force_client_initialization(mock_cache_patch):
 
       gh_search_code("test")
 
-      mock_init.assert_called_once_with(force=True)
+      mock_init.assert_called_once_with()
 
 
 # --- Additional Tests for Missing Coverage ---
@@ -1897,6 +2203,22 @@ def test_initialize_github_client_already_initialized():
       mock_github.assert_called_once()
 
 
+def test_reset_github_client_discards_cached_client():
+  """Test that reset_github_client forces the next call to build a new client."""
+  from devops_mcps.utils.github.github_client import reset_github_client
+
+  with patch("devops_mcps.utils.github_client.Github") as mock_github:
+    with patch.dict("os.environ", {"GITHUB_PERSONAL_ACCESS_TOKEN": "test_token"}):
+      mock_github.side_effect = [MagicMock(), MagicMock()]
+
+      client1 = initialize_github_client()
+      reset_github_client()
+      client2 = initialize_github_client()
+
+      assert client1 is not client2
+      assert mock_github.call_count == 2
+
+
 def test_gh_get_current_user_info_no_token():
   """Test gh_get_current_user_info when no GitHub token is provided."""
   with patch.dict("os.environ", {}, clear=True):
@@ -1907,6 +2229,22 @@ def test_gh_get_current_user_info_no_token():
     assert "GITHUB_PERSONAL_ACCESS_TOKEN" in result["error"]
 
 
+def test_gh_get_current_user_info_existing_client_skips_env_lookup():
+  """Test the token check is satisfied by an already initialized client."""
+  mock_client = Mock()
+  mock_client.get_user.return_value = Mock(
+    login="user", name="User", email=None, id=1, html_url="url", type="User"
+  )
+  with patch("devops_mcps.utils.github.github_client.g", mock_client):
+    with patch("devops_mcps.utils.github.github_client.os.environ") as mock_environ:
+      with patch("devops_mcps.utils.github.github_user_api.cache") as mock_cache:
+        mock_cache.get.return_value = None
+        result = gh_get_current_user_info()
+
+  assert result["login"] == "user"
+  mock_environ.get.assert_not_called()
+
+
 def test_gh_get_file_contents_file_too_large(mock_github_api, mock_env_vars):
   """Test file content retrieval when file is too large."""
   mock_repo = MagicMock()
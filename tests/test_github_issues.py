@@ -1,6 +1,10 @@
 from unittest.mock import Mock, patch
 from github import UnknownObjectException, GithubException
-from devops_mcps.github import gh_get_issue_content
+from devops_mcps.github import (
+  gh_get_issue_content,
+  gh_get_issue_details,
+  gh_get_issues_content,
+)
 
 
 @patch("devops_mcps.utils.github.github_issue_api.cache")
@@ -27,7 +31,8 @@ def test_gh_get_issue_content_success(mock_init_client, mock_cache_patch):
   mock_comment.body = "Test Comment"
   mock_comment.user.login = "commenter"
   mock_comment.created_at.isoformat.return_value = "2024-01-03T00:00:00Z"
-  mock_issue.get_comments.return_value = [mock_comment]
+  mock_issue.comments = 1
+  mock_issue.get_comments.return_value.get_page.return_value = [mock_comment]
 
   mock_repo = Mock()
   mock_repo.get_issue.return_value = mock_issue
@@ -105,3 +110,287 @@ def test_gh_get_issue_content_no_client(mock_init_client, mock_cache_patch):
     result["error"]
     == "GitHub client not initialized. Please set the GITHUB_PERSONAL_ACCESS_TOKEN environment variable."
   )
+
+
+def _graphql_issue(title, labels, body, comments, total_comments=None):
+  return {
+    "title": title,
+    "createdAt": "2024-01-01T00:00:00Z",
+    "body": body,
+    "labels": {"nodes": [{"name": label} for label in labels]},
+    "comments": {
+      "totalCount": len(comments) if total_comments is None else total_comments,
+      "nodes": [{"body": comment} for comment in comments],
+    },
+  }
+
+
+@patch("devops_mcps.utils.github.github_issue_api.cache")
+@patch("devops_mcps.utils.github.github_issue_api.initialize_github_client")
+def test_gh_get_issues_content_single_graphql_query(mock_init_client, mock_cache_patch):
+  """Test that uncached issues are fetched together in one GraphQL query."""
+  mock_cache_patch.get.return_value = None
+
+  mock_client = Mock()
+  mock_client.requester.graphql_query.return_value = (
+    {},
+    {
+      "data": {
+        "repository": {
+          "i1": _graphql_issue("First", ["bug"], "Body 1", ["c1", "c2"]),
+          "i2": _graphql_issue("Second", [], "Body 2", []),
+        }
+      }
+    },
+  )
+  mock_init_client.return_value = mock_client
+
+  result = gh_get_issues_content("owner", "repo", [1, 2, 1])
+
+  assert mock_client.requester.graphql_query.call_count == 1
+  query, variables = mock_client.requester.graphql_query.call_args[0]
+  assert "i1: issue(number: 1)" in query
+  assert "i2: issue(number: 2)" in query
+  assert variables == {"owner": "owner", "name": "repo"}
+  assert result["1"] == {
+    "title": "First",
+    "labels": ["bug"],
+    "timestamp": "2024-01-01T00:00:00+00:00",
+    "description": "Body 1",
+    "comments": ["c1", "c2"],
+  }
+  assert result["2"]["title"] == "Second"
+  mock_cache_patch.set.assert_any_call(
+    "github:issue_content:owner:repo:1", result["1"], ttl=300
+  )
+
+
+@patch("devops_mcps.utils.github.github_issue_api.cache")
+@patch("devops_mcps.utils.github.github_issue_api.initialize_github_client")
+def test_gh_get_issues_content_all_cached(mock_init_client, mock_cache_patch):
+  """Test that no request is made when every issue is cached."""
+  mock_cache_patch.get.side_effect = lambda key: {"title": key}
+
+  result = gh_get_issues_content("owner", "repo", [3])
+
+  assert result == {"3": {"title": "github:issue_content:owner:repo:3"}}
+  mock_init_client.assert_not_called()
+
+
+@patch("devops_mcps.utils.github.github_issue_api.ISSUE_BATCH_SIZE", 1)
+@patch("devops_mcps.utils.github.github_issue_api.cache")
+@patch("devops_mcps.utils.github.github_issue_api.initialize_github_client")
+def test_gh_get_issues_content_batches(mock_init_client, mock_cache_patch):
+  """Test that issues beyond the batch size are split across queries."""
+  mock_cache_patch.get.return_value = None
+
+  mock_client = Mock()
+  mock_client.requester.graphql_query.side_effect = [
+    ({}, {"data": {"repository": {"i1": _graphql_issue("A", [], "", [])}}}),
+    ({}, {"data": {"repository": {"i2": _graphql_issue("B", [], "", [])}}}),
+  ]
+  mock_init_client.return_value = mock_client
+
+  result = gh_get_issues_content("owner", "repo", [1, 2])
+
+  assert mock_client.requester.graphql_query.call_count == 2
+  assert [result["1"]["title"], result["2"]["title"]] == ["A", "B"]
+
+
+@patch("devops_mcps.utils.github.github_issue_api.cache")
+@patch("devops_mcps.utils.github.github_issue_api.initialize_github_client")
+def test_gh_get_issues_content_not_found(mock_init_client, mock_cache_patch):
+  """Test handling of a missing issue in the batch."""
+  mock_cache_patch.get.return_value = None
+
+  mock_client = Mock()
+  mock_client.requester.graphql_query.side_effect = UnknownObjectException(
+    404, {"message": "Not Found"}
+  )
+  mock_init_client.return_value = mock_client
+
+  result = gh_get_issues_content("owner", "repo", [99])
+
+  assert "error" in result
+  assert "not found" in result["error"]
+
+
+@patch("devops_mcps.utils.github.github_issue_api.cache")
+@patch("devops_mcps.utils.github.github_issue_api.initialize_github_client")
+def test_gh_get_issues_content_missing_issue_in_batch(
+  mock_init_client, mock_cache_patch
+):
+  """Test that one missing issue gets an error entry and the rest still return."""
+  mock_cache_patch.get.return_value = None
+
+  partial_data = {
+    "data": {"repository": {"i1": _graphql_issue("First", [], "", []), "i99": None}},
+    "errors": [
+      {
+        "type": "NOT_FOUND",
+        "path": ["repository", "i99"],
+        "message": "Could not resolve to an Issue with the number of 99.",
+      }
+    ],
+  }
+  mock_client = Mock()
+  mock_client.requester.graphql_query.side_effect = UnknownObjectException(
+    404, partial_data
+  )
+  mock_init_client.return_value = mock_client
+
+  result = gh_get_issues_content("owner", "repo", [1, 99])
+
+  assert result["1"]["title"] == "First"
+  assert result["99"] == {"error": "Issue #99 not found in 'owner/repo'."}
+  mock_cache_patch.set.assert_called_once_with(
+    "github:issue_content:owner:repo:1", result["1"], ttl=300
+  )
+
+
+@patch("devops_mcps.utils.github.github_issue_api.cache")
+@patch("devops_mcps.utils.github.github_issue_api.initialize_github_client")
+def test_gh_get_issues_content_truncated_comments_not_cached(
+  mock_init_client, mock_cache_patch
+):
+  """Test that an issue with more comments than the query returns is not cached."""
+  mock_cache_patch.get.return_value = None
+
+  mock_client = Mock()
+  mock_client.requester.graphql_query.return_value = (
+    {},
+    {
+      "data": {
+        "repository": {
+          "i1": _graphql_issue("Busy", [], "", ["c"] * 100, total_comments=150)
+        }
+      }
+    },
+  )
+  mock_init_client.return_value = mock_client
+
+  result = gh_get_issues_content("owner", "repo", [1])
+
+  assert len(result["1"]["comments"]) == 100
+  mock_cache_patch.set.assert_not_called()
+
+
+@patch("devops_mcps.utils.github.github_issue_api.cache")
+@patch("devops_mcps.utils.github.github_issue_api.initialize_github_client")
+def test_gh_get_issues_content_no_client(mock_init_client, mock_cache_patch):
+  """Test handling when the GitHub client is not initialized."""
+  mock_cache_patch.get.return_value = None
+  mock_init_client.return_value = None
+
+  result = gh_get_issues_content("owner", "repo", [1])
+
+  assert "GitHub client not initialized" in result["error"]
+
+
+@patch("devops_mcps.utils.github.github_issue_api.cache")
+@patch("devops_mcps.utils.github.github_issue_api.initialize_github_client")
+def test_gh_get_issue_details_missing_issue(mock_init_client, mock_cache_patch):
+  """Test that a missing issue returns an error and is not cached."""
+  mock_cache_patch.get.return_value = None
+
+  mock_client = Mock()
+  mock_client.requester.graphql_query.side_effect = GithubException(
+    404,
+    {
+      "data": {"repository": {"i99": None}},
+      "errors": [{"type": "NOT_FOUND", "path": ["repository", "i99"]}],
+    },
+  )
+  mock_init_client.return_value = mock_client
+
+  result = gh_get_issue_details("owner", "repo", 99)
+
+  assert result == {"error": "Issue #99 not found in 'owner/repo'."}
+  mock_cache_patch.set.assert_not_called()
+
+
+@patch("devops_mcps.utils.github.github_issue_api.cache")
+@patch("devops_mcps.utils.github.github_issue_api.initialize_github_client")
+def test_gh_get_issue_details_long_thread_pages_comments(
+  mock_init_client, mock_cache_patch
+):
+  """Test that comments beyond the GraphQL limit are paged in over REST."""
+  mock_cache_patch.get.return_value = None
+
+  mock_client = Mock()
+  mock_client.requester.graphql_query.return_value = (
+    {},
+    {
+      "data": {
+        "repository": {
+          "i1": _graphql_issue("Busy", ["bug"], "", ["c"] * 100, total_comments=150)
+        }
+      }
+    },
+  )
+  mock_issue = mock_client.get_repo.return_value.get_issue.return_value
+  mock_issue.comments = 150
+  mock_issue.get_comments.return_value.get_page.side_effect = lambda page: (
+    [Mock(body=f"c{page}")] * (100 if page == 0 else 50)
+  )
+  mock_init_client.return_value = mock_client
+
+  result = gh_get_issue_details("owner", "repo", 1)
+
+  assert result["title"] == "Busy"
+  assert len(result["comments"]) == 150
+  mock_client.get_repo.assert_called_once_with("owner/repo")
+  mock_client.get_repo.return_value.get_issue.assert_called_once_with(1)
+  mock_cache_patch.set.assert_called_once_with(
+    "github:issue_details:owner:repo:1", result, ttl=300
+  )
+
+
+@patch("devops_mcps.utils.github.github_issue_api.cache")
+@patch("devops_mcps.utils.github.github_issue_api.initialize_github_client")
+def test_gh_get_issue_content_fetches_comment_pages(mock_init_client, mock_cache_patch):
+  """Test comment pages after the first are fetched and kept in order."""
+  mock_cache_patch.get.return_value = None
+
+  mock_issue = Mock()
+  mock_issue.title = "Test Issue"
+  mock_issue.body = "Body"
+  mock_issue.labels = []
+  mock_issue.created_at.isoformat.return_value = "2024-01-01T00:00:00"
+  mock_issue.comments = 5
+  pages = {
+    0: [Mock(body="c1"), Mock(body="c2")],
+    1: [Mock(body="c3"), Mock(body="c4")],
+    2: [Mock(body="c5")],
+  }
+  mock_issue.get_comments.return_value.get_page.side_effect = pages.__getitem__
+
+  mock_client = Mock()
+  mock_client.get_repo.return_value.get_issue.return_value = mock_issue
+  mock_init_client.return_value = mock_client
+
+  result = gh_get_issue_content("owner", "repo", 1)
+
+  assert result["comments"] == ["c1", "c2", "c3", "c4", "c5"]
+  assert mock_issue.get_comments.return_value.get_page.call_count == 3
+
+
+@patch("devops_mcps.utils.github.github_issue_api.cache")
+@patch("devops_mcps.utils.github.github_issue_api.initialize_github_client")
+def test_gh_get_issue_content_no_comments(mock_init_client, mock_cache_patch):
+  """Test an issue without comments only requests the first page."""
+  mock_cache_patch.get.return_value = None
+
+  mock_issue = Mock()
+  mock_issue.labels = []
+  mock_issue.comments = 0
+  mock_issue.get_comments.return_value.get_page.return_value = []
+
+  mock_client = Mock()
+  mock_client.get_repo.return_value.get_issue.return_value = mock_issue
+  mock_init_client.return_value = mock_client
+
+  result = gh_get_issue_content("owner", "repo", 1)
+
+  assert result["comments"] == []
+  mock_issue.get_comments.return_value.get_page.assert_called_once_with(0)
@@ -1,6 +1,7 @@
 import os
-from unittest.mock import Mock, patch
-from jenkinsapi.jenkins import JenkinsAPIException
+import requests
+from unittest.mock import ANY, MagicMock, Mock, patch
+from jenkinsapi.jenkins import Jenkins, JenkinsAPIException
 from jenkinsapi.job import Job
 from jenkinsapi.view import View
 from requests.exceptions import ConnectionError
@@ -116,8 +117,14 @@ class TestInitializeJenkinsClient:
     assert result is None
     assert devops_mcps.utils.jenkins.jenkins_client.j is None
     mock_jenkins_class.assert_called_once_with(
-      "http://test-jenkins.com", username="testuser", password="testtoken"
+      "http://test-jenkins.com",
+      username="testuser",
+      password="testtoken",
+      requester=ANY,
+      lazy=True,
     )
+    requester = mock_jenkins_class.call_args.kwargs["requester"]
+    assert requester.session is devops_mcps.utils.jenkins.jenkins_client.jenkins_session
 
   @patch("jenkinsapi.jenkins.Jenkins")
   @patch(
@@ -137,6 +144,20 @@ class TestInitializeJenkinsClient:
     assert result == existing_client
     mock_jenkins_class.assert_not_called()
 
+  @patch("devops_mcps.utils.jenkins.jenkins_client.Jenkins")
+  def test_initialize_jenkins_client_existing_client_not_truth_tested(
+    self, mock_jenkins_class
+  ):
+    """Test the cached client is returned without calling Jenkins.__len__."""
+    existing_client = MagicMock(spec=Jenkins)
+    existing_client.__len__.side_effect = AssertionError("polled job list")
+
+    with patch("devops_mcps.utils.jenkins.jenkins_client.j", existing_client):
+      result = initialize_jenkins_client()
+
+    assert result is existing_client
+    mock_jenkins_class.assert_not_called()
+
   @patch.dict(os.environ, {}, clear=True)
   def test_initialize_jenkins_client_missing_credentials(self):
     """Test initialization with missing credentials."""
@@ -265,10 +286,11 @@ class TestToDict:
     mock_job.__class__ = Job
     mock_job.name = "test-job"
     mock_job.baseurl = "http://jenkins.com/job/test-job"
-    mock_job.is_enabled.return_value = True
-    mock_job.is_queued.return_value = False
-    mock_job.get_last_buildnumber.return_value = 42
-    mock_job.get_last_buildurl.return_value = "http://jenkins.com/job/test-job/42"
+    mock_job._data = {
+      "color": "blue",
+      "inQueue": False,
+      "lastBuild": {"number": 42, "url": "http://jenkins.com/job/test-job/42"},
+    }
 
     result = _to_dict(mock_job)
 
@@ -282,6 +304,10 @@ class TestToDict:
       "last_build_url": "http://jenkins.com/job/test-job/42",
     }
     assert result == expected
+    # Everything comes from the Job's already-fetched data, not new requests
+    mock_job.is_enabled.assert_not_called()
+    mock_job.is_queued.assert_not_called()
+    mock_job.get_last_buildnumber.assert_not_called()
 
   def test_to_dict_view_object(self):
     """Test _to_dict with View object."""
@@ -289,7 +315,7 @@ class TestToDict:
     mock_view.__class__ = View
     mock_view.name = "test-view"
     mock_view.baseurl = "http://jenkins.com/view/test-view"
-    mock_view.get_description.return_value = "Test view description"
+    mock_view._data = {"description": "Test view description"}
 
     result = _to_dict(mock_view)
 
@@ -333,26 +359,23 @@ class TestJenkinsGetJobs:
   @patch("devops_mcps.utils.jenkins.jenkins_job_api.cache")
   @patch("devops_mcps.utils.jenkins.jenkins_api.j")
   @patch("devops_mcps.utils.jenkins.jenkins_job_api.j")
-  def test_jenkins_get_jobs_jenkins_api_exception(
-    self, mock_j_job_api, mock_j_api, mock_cache_job_api, mock_cache_api
+  @patch("devops_mcps.utils.jenkins.jenkins_job_api._jenkins_api_json")
+  def test_jenkins_get_jobs_http_error(
+    self, mock_api_json, mock_j_job_api, mock_j_api, mock_cache_job_api, mock_cache_api
   ):
-    """Test jenkins_get_jobs with JenkinsAPIException."""
+    """Test jenkins_get_jobs with an HTTP error from the Jenkins API."""
     mock_cache_api.get.return_value = None
     mock_cache_api.set.return_value = None
     mock_cache_job_api.get.return_value = None
     mock_cache_job_api.set.return_value = None
 
-    mock_jenkins = Mock()
-    mock_jenkins.values.side_effect = JenkinsAPIException("API error")
-    mock_j_api.return_value = mock_jenkins
-    mock_j_api.values = mock_jenkins.values
-    mock_j_job_api.return_value = mock_jenkins
-    mock_j_job_api.values = mock_jenkins.values
+    mock_response = Mock()
+    mock_response.status_code = 500
+    mock_api_json.side_effect = requests.exceptions.HTTPError(response=mock_response)
 
     result = jenkins_get_jobs()
 
-    assert "error" in result
-    assert "Jenkins API Error" in result["error"]
+    assert result == {"error": "Jenkins API HTTP Error: 500"}
 
   @patch("devops_mcps.utils.jenkins.jenkins_api.JENKINS_TOKEN", "testtoken")
   @patch("devops_mcps.utils.jenkins.jenkins_api.JENKINS_USER", "testuser")
@@ -361,8 +384,9 @@ class TestJenkinsGetJobs:
   @patch("devops_mcps.utils.jenkins.jenkins_job_api.cache")
   @patch("devops_mcps.utils.jenkins.jenkins_api.j")
   @patch("devops_mcps.utils.jenkins.jenkins_job_api.j")
+  @patch("devops_mcps.utils.jenkins.jenkins_job_api._jenkins_api_json")
   def test_jenkins_get_jobs_unexpected_exception(
-    self, mock_j_job_api, mock_j_api, mock_cache_job_api, mock_cache_api
+    self, mock_api_json, mock_j_job_api, mock_j_api, mock_cache_job_api, mock_cache_api
   ):
     """Test jenkins_get_jobs with unexpected exception."""
     mock_cache_api.get.return_value = None
@@ -370,12 +394,7 @@ class TestJenkinsGetJobs:
     mock_cache_job_api.get.return_value = None
     mock_cache_job_api.set.return_value = None
 
-    mock_jenkins = Mock()
-    mock_jenkins.values.side_effect = ValueError("Unexpected error")
-    mock_j_api.return_value = mock_jenkins
-    mock_j_api.values = mock_jenkins.values
-    mock_j_job_api.return_value = mock_jenkins
-    mock_j_job_api.values = mock_jenkins.values
+    mock_api_json.side_effect = ValueError("Unexpected error")
 
     result = jenkins_get_jobs()
 
@@ -400,18 +419,14 @@ class TestJenkinsGetJobs:
     mock_cache_job_api.get.return_value = None
     mock_cache_job_api.set.return_value = None
 
-    # Configure Jenkins client mocks (shouldn't be called due to cache hit)
-    mock_jenkins = Mock()
-    mock_j_api.return_value = mock_jenkins
-    mock_j_api.values = mock_jenkins.values
-    mock_j_job_api.return_value = mock_jenkins
-    mock_j_job_api.values = mock_jenkins.values
-
     result = jenkins_get_jobs()
 
     assert result == cached_data
     # Since _get_cache() checks jenkins_api.cache first, that's what gets called
     mock_cache_api.get.assert_called_once_with("jenkins:jobs:all")
+    # The cache hit never reaches the Jenkins client
+    mock_j_api.get_jobs.assert_not_called()
+    mock_j_job_api.get_jobs.assert_not_called()
 
   @patch("devops_mcps.utils.jenkins.jenkins_job_api.j", None)
   @patch("devops_mcps.utils.jenkins.jenkins_job_api.cache")
@@ -432,42 +447,82 @@ class TestJenkinsGetJobs:
   @patch("devops_mcps.utils.jenkins.jenkins_job_api.cache")
   @patch("devops_mcps.utils.jenkins.jenkins_api.j")
   @patch("devops_mcps.utils.jenkins.jenkins_job_api.j")
+  @patch("devops_mcps.utils.jenkins.jenkins_job_api._jenkins_api_json")
   def test_jenkins_get_jobs_success(
-    self, mock_j_job_api, mock_j_api, mock_cache_job_api, mock_cache_api
+    self, mock_api_json, mock_j_job_api, mock_j_api, mock_cache_job_api, mock_cache_api
   ):
-    """Test successful jenkins_get_jobs."""
+    """Test successful jenkins_get_jobs, including jobs inside a folder."""
     mock_cache_api.get.return_value = None
     mock_cache_api.set.return_value = None
     mock_cache_job_api.get.return_value = None
     mock_cache_job_api.set.return_value = None
 
-    mock_job1 = Mock()
-    mock_job1.name = "job1"
-    mock_job2 = Mock()
-    mock_job2.name = "job2"
-
-    mock_jenkins = Mock()
-    mock_jenkins.values.return_value = [mock_job1, mock_job2]
-    mock_j_api.return_value = mock_jenkins
-    mock_j_api.values = mock_jenkins.values
-    mock_j_job_api.return_value = mock_jenkins
-    mock_j_job_api.values = mock_jenkins.values
+    folder_url = "http://test-jenkins.com/job/folder/"
+    mock_api_json.side_effect = [
+      {
+        "jobs": [
+          {
+            "name": "job1",
+            "url": "http://test-jenkins.com/job/job1/",
+            "color": "blue",
+            "inQueue": True,
+            "lastBuild": {
+              "number": 7,
+              "url": "http://test-jenkins.com/job/job1/7/",
+            },
+          },
+          {"name": "folder", "url": folder_url},
+        ]
+      },
+      {
+        "jobs": [
+          {
+            "name": "job2",
+            "url": "http://test-jenkins.com/job/folder/job/job2/",
+            "color": "disabled",
+            "inQueue": False,
+            "lastBuild": None,
+          }
+        ]
+      },
+    ]
 
-    with patch(
-      "devops_mcps.utils.jenkins.jenkins_api._to_dict",
-      side_effect=lambda x: f"dict_{x.name}",
-    ):
-      result = jenkins_get_jobs()
+    result = jenkins_get_jobs()
 
-      assert result == ["dict_job1", "dict_job2"]
-      mock_cache_api.set.assert_called_once_with(
-        "jenkins:jobs:all", ["dict_job1", "dict_job2"], ttl=300
-      )
+    expected = [
+      {
+        "name": "job1",
+        "url": "http://test-jenkins.com/job/job1",
+        "is_enabled": True,
+        "is_queued": True,
+        "in_queue": True,
+        "last_build_number": 7,
+        "last_build_url": "http://test-jenkins.com/job/job1/7/",
+      },
+      {
+        "name": "job2",
+        "url": "http://test-jenkins.com/job/folder/job/job2",
+        "is_enabled": False,
+        "is_queued": False,
+        "in_queue": False,
+        "last_build_number": None,
+        "last_build_url": None,
+      },
+    ]
+    assert result == expected
+    assert mock_api_json.call_args_list[0].args[0] == "http://test-jenkins.com"
+    assert mock_api_json.call_args_list[1].args[0] == folder_url
+    mock_cache_api.set_adaptive.assert_called_once_with(
+      "jenkins:jobs:all", expected, changed=True, min_ttl=30, max_ttl=600
+    )
 
 
 class TestJenkinsGetBuildLog:
   """Test cases for jenkins_get_build_log function."""
 
+  @patch("devops_mcps.utils.jenkins.jenkins_api.JENKINS_URL", None)
+  @patch("devops_mcps.utils.jenkins.jenkins_api.JENKINS_USER", None)
+  @patch("devops_mcps.utils.jenkins.jenkins_api.JENKINS_TOKEN", None)
   def test_jenkins_get_build_log_no_client(self):
     """Test jenkins_get_build_log with no Jenkins client."""
     set_jenkins_client_for_testing(None)
@@ -500,17 +555,20 @@ class TestJenkinsGetAllViews:
   @patch("devops_mcps.utils.jenkins.jenkins_view_api.cache")
   @patch("devops_mcps.utils.jenkins.jenkins_api.j")
   @patch("devops_mcps.utils.jenkins.jenkins_view_api.j")
+  @patch("devops_mcps.utils.jenkins.jenkins_view_api._jenkins_api_json")
   def test_jenkins_get_all_views_success(
-    self, mock_j_view_api, mock_j_api, mock_cache_view_api, mock_cache_api
+    self,
+    mock_api_json,
+    mock_j_view_api,
+    mock_j_api,
+    mock_cache_view_api,
+    mock_cache_api,
   ):
     """Test successful jenkins_get_all_views."""
     mock_cache_api.get.return_value = None
     mock_cache_api.set.return_value = None
 
-    mock_jenkins = Mock()
-    mock_jenkins.views.keys.return_value = ["view1", "view2"]
-    mock_j_api.return_value = mock_jenkins
-    mock_j_api.views = mock_jenkins.views
+    mock_api_json.return_value = {"views": [{"name": "view1"}, {"name": "view2"}]}
 
     with patch(
       "devops_mcps.utils.jenkins.jenkins_api._to_dict",
@@ -626,32 +684,88 @@ class TestJenkinsGetAllViewsAdditional:
 class TestJenkinsModuleInitialization:
   """Test cases for module initialization logic."""
 
-  def test_module_initialization_logic_coverage(self):
-    """Test to cover the module initialization conditional logic."""
-    # This test covers line 63 - the module initialization logic
+  MODULE_NAME = "devops_mcps.utils.jenkins.jenkins_client"
 
-    # Test the condition that checks for pytest/unittest in sys.argv
-    test_argv_with_pytest = ["pytest", "tests/"]
-    test_argv_with_unittest = ["python", "-m", "unittest"]
-    test_argv_normal = ["python", "script.py"]
+  def _import_fresh(self):
+    """Re-import jenkins_client and restore the original module afterwards."""
+    import importlib
+    import sys
 
-    # Test pytest condition
-    result_pytest = any(
-      "pytest" in arg or "unittest" in arg for arg in test_argv_with_pytest
-    )
-    assert result_pytest is True
+    import devops_mcps.utils.jenkins as jenkins_pkg
 
-    # Test unittest condition
-    result_unittest = any(
-      "pytest" in arg or "unittest" in arg for arg in test_argv_with_unittest
-    )
-    assert result_unittest is True
+    original_attr = jenkins_pkg.jenkins_client
+    with patch.dict(sys.modules):
+      del sys.modules[self.MODULE_NAME]
+      try:
+        return importlib.import_module(self.MODULE_NAME)
+      finally:
+        jenkins_pkg.jenkins_client = original_attr
 
-    # Test normal execution condition
-    result_normal = any(
-      "pytest" in arg or "unittest" in arg for arg in test_argv_normal
-    )
-    assert result_normal is False
+  @patch.dict(
+    os.environ,
+    {
+      "JENKINS_URL": "http://test-jenkins.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    },
+    clear=True,
+  )
+  @patch("jenkinsapi.jenkins.Jenkins")
+  def test_module_import_does_not_connect(self, mock_jenkins_class):
+    """Test importing the client module does not create a client."""
+    module = self._import_fresh()
+
+    mock_jenkins_class.assert_not_called()
+    assert module.j is None
+    assert module.LOG_LENGTH is None
+
+  @patch.dict(
+    os.environ,
+    {
+      "JENKINS_URL": "http://test-jenkins.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    },
+    clear=True,
+  )
+  @patch("devops_mcps.utils.jenkins.jenkins_client._initialized", False)
+  @patch("devops_mcps.utils.jenkins.jenkins_client.j", None)
+  @patch("devops_mcps.utils.jenkins.jenkins_client.JENKINS_URL", None)
+  @patch("devops_mcps.utils.jenkins.jenkins_client.JENKINS_USER", None)
+  @patch("devops_mcps.utils.jenkins.jenkins_client.JENKINS_TOKEN", None)
+  @patch("devops_mcps.utils.jenkins.jenkins_client.LOG_LENGTH", None)
+  @patch("devops_mcps.utils.jenkins.jenkins_client.Jenkins")
+  def test_client_created_on_first_use(self, mock_jenkins_class):
+    """Test the client is created once, when first read through jenkins_api."""
+    from devops_mcps.utils.jenkins import jenkins_api
+
+    mock_jenkins_instance = MagicMock()
+    mock_jenkins_class.return_value = mock_jenkins_instance
+
+    assert jenkins_api.j is mock_jenkins_instance
+    assert jenkins_api.JENKINS_URL == "http://test-jenkins.com"
+    assert jenkins_api.LOG_LENGTH == 10240
+    mock_jenkins_class.assert_called_once()
+
+  @patch.dict(os.environ, {}, clear=True)
+  @patch("devops_mcps.utils.jenkins.jenkins_client._initialized", False)
+  @patch("devops_mcps.utils.jenkins.jenkins_client.j", None)
+  @patch("devops_mcps.utils.jenkins.jenkins_client.LOG_LENGTH", None)
+  @patch("devops_mcps.utils.jenkins.jenkins_client._create_jenkins_client")
+  def test_failed_first_use_is_not_retried(self, mock_create):
+    """Test a failed first-use initialization is not repeated on every access."""
+    import devops_mcps.utils.jenkins.jenkins_client as jenkins_client
+    from devops_mcps.utils.jenkins import jenkins_api
+
+    def create():
+      jenkins_client._initialized = True
+      return None
+
+    mock_create.side_effect = create
+
+    assert jenkins_api.j is None
+    assert jenkins_api.j is None
+    mock_create.assert_called_once()
 
   @patch.dict(os.environ, {}, clear=True)
   def test_module_initialization_call_coverage(self):
@@ -708,3 +822,18 @@ class TestJenkinsSpecificErrorPaths:
   """Test cases to cover specific error handling paths."""
 
   pass
+
+
+class TestJenkinsSession:
+  """Test cases for the shared Jenkins HTTP session."""
+
+  def test_jenkins_session_uses_pooled_adapter_with_retries(self):
+    """Test that http and https share a pooled adapter with a retry policy."""
+    from devops_mcps.utils.jenkins.jenkins_client import jenkins_session
+
+    http_adapter = jenkins_session.get_adapter("http://jenkins.example.com")
+    https_adapter = jenkins_session.get_adapter("https://jenkins.example.com")
+
+    assert http_adapter is https_adapter
+    assert http_adapter._pool_maxsize == 20
+    assert http_adapter.max_retries.total == 3
@@ -5,6 +5,7 @@ import requests
 from datetime import datetime
 from src.devops_mcps.utils.jenkins.jenkins_builds import (
   jenkins_get_recent_failed_builds,
+  jenkins_get_recent_failed_builds_with_details,
 )
 
 
@@ -57,7 +58,7 @@ class TestJenkinsRecentFailedBuilds:
     assert result == {"error": "Jenkins credentials not configured"}
 
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.datetime")
-  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
@@ -117,6 +118,7 @@ class TestJenkinsRecentFailedBuilds:
       ]
     }
     mock_response.raise_for_status.return_value = None
+    mock_response.headers = {}
     mock_requests_get.return_value = mock_response
 
     # Execute
@@ -134,7 +136,7 @@ class TestJenkinsRecentFailedBuilds:
     )
 
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.datetime")
-  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
@@ -172,6 +174,7 @@ class TestJenkinsRecentFailedBuilds:
       ]
     }
     mock_response.raise_for_status.return_value = None
+    mock_response.headers = {}
     mock_requests_get.return_value = mock_response
 
     # Execute
@@ -182,7 +185,7 @@ class TestJenkinsRecentFailedBuilds:
     assert len(result) == 0
 
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.datetime")
-  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
@@ -226,6 +229,7 @@ class TestJenkinsRecentFailedBuilds:
       ]
     }
     mock_response.raise_for_status.return_value = None
+    mock_response.headers = {}
     mock_requests_get.return_value = mock_response
 
     # Execute
@@ -238,7 +242,7 @@ class TestJenkinsRecentFailedBuilds:
       result[0]["build_url"] == "http://jenkins.example.com/job/failed-job-no-url/123/"
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
@@ -267,7 +271,7 @@ class TestJenkinsRecentFailedBuilds:
     # Verify
     assert result == {"error": "Could not connect to Jenkins API"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
@@ -297,7 +301,7 @@ class TestJenkinsRecentFailedBuilds:
     # Verify
     assert result == {"error": "Jenkins API HTTP Error: 500"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
@@ -324,7 +328,7 @@ class TestJenkinsRecentFailedBuilds:
     # Verify
     assert result == {"error": "Timeout connecting to Jenkins API"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
@@ -353,7 +357,7 @@ class TestJenkinsRecentFailedBuilds:
     # Verify
     assert result == {"error": "Jenkins API Request Error"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
@@ -381,7 +385,7 @@ class TestJenkinsRecentFailedBuilds:
     assert result == {"error": "An unexpected error occurred: Unexpected error"}
 
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.datetime")
-  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
@@ -411,6 +415,7 @@ class TestJenkinsRecentFailedBuilds:
     mock_response = Mock()
     mock_response.json.return_value = {"jobs": []}
     mock_response.raise_for_status.return_value = None
+    mock_response.headers = {}
     mock_requests_get.return_value = mock_response
 
     # Execute
@@ -424,7 +429,7 @@ class TestJenkinsRecentFailedBuilds:
     )
 
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.datetime")
-  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
@@ -466,6 +471,7 @@ class TestJenkinsRecentFailedBuilds:
       ]
     }
     mock_response.raise_for_status.return_value = None
+    mock_response.headers = {}
     mock_requests_get.return_value = mock_response
 
     # Execute
@@ -474,3 +480,349 @@ class TestJenkinsRecentFailedBuilds:
     # Verify - should not include this build since timestamp defaults to 0 (very old)
     assert isinstance(result, list)
     assert len(result) == 0
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
+  def test_jenkins_get_recent_failed_builds_uses_bounded_tree_query(
+    self, mock_get_cache, mock_check_credentials, mock_get_constants, mock_requests_get
+  ):
+    """Test that jobs are fetched with a tree-filtered, range-limited query."""
+    # Setup
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_get_cache.return_value = mock_cache
+    mock_check_credentials.return_value = None
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    }
+
+    mock_response = Mock()
+    mock_response.json.return_value = {"jobs": []}
+    mock_response.raise_for_status.return_value = None
+    mock_response.headers = {}
+    mock_requests_get.return_value = mock_response
+
+    # Execute
+    result = jenkins_get_recent_failed_builds(24)
+
+    # Verify
+    assert result == []
+    mock_requests_get.assert_called_once()
+    called_url = mock_requests_get.call_args[0][0]
+    assert called_url == (
+      "http://jenkins.example.com/api/json"
+      "?tree=jobs[name,url,lastBuild[number,timestamp,result,url]]{0,200}"
+    )
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
+  def test_jenkins_get_recent_failed_builds_stores_validator(
+    self, mock_get_cache, mock_check_credentials, mock_get_constants, mock_requests_get
+  ):
+    """Test that the jobs payload is stored with its ETag for conditional refresh."""
+    # Setup
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_get_cache.return_value = mock_cache
+    mock_check_credentials.return_value = None
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    }
+
+    jobs_data = {"jobs": []}
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = jobs_data
+    mock_response.raise_for_status.return_value = None
+    mock_response.headers = {"ETag": '"abc123"'}
+    mock_requests_get.return_value = mock_response
+
+    # Execute
+    result = jenkins_get_recent_failed_builds(24)
+
+    # Verify
+    assert result == []
+    assert mock_requests_get.call_args[1]["headers"] == {}
+    mock_cache.set.assert_any_call(
+      "jenkins:recent_failed_builds:validator:0",
+      {"etag": '"abc123"', "last_modified": None, "jobs_data": jobs_data},
+      ttl=3600,
+    )
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.datetime")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
+  def test_jenkins_get_recent_failed_builds_not_modified(
+    self,
+    mock_get_cache,
+    mock_check_credentials,
+    mock_get_constants,
+    mock_requests_get,
+    mock_datetime,
+  ):
+    """Test that a 304 response re-filters the stored jobs payload."""
+    # Setup
+    stored_jobs = {
+      "jobs": [
+        {
+          "name": "failed-job",
+          "url": "http://jenkins.example.com/job/failed-job/",
+          "lastBuild": {
+            "number": 7,
+            "timestamp": 1641124800000,
+            "result": "FAILURE",
+            "url": "http://jenkins.example.com/job/failed-job/7/",
+          },
+        }
+      ]
+    }
+    validator = {
+      "etag": '"abc123"',
+      "last_modified": "Sun, 02 Jan 2022 12:00:00 GMT",
+      "jobs_data": stored_jobs,
+    }
+    mock_cache = Mock()
+    mock_cache.get.side_effect = lambda key: (
+      validator if key == "jenkins:recent_failed_builds:validator:0" else None
+    )
+    mock_get_cache.return_value = mock_cache
+    mock_check_credentials.return_value = None
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    }
+
+    mock_now = datetime(2022, 1, 2, 12, 0, 0)
+    mock_datetime.now.return_value = mock_now
+    mock_datetime.fromtimestamp.side_effect = lambda ts: datetime.fromtimestamp(ts)
+
+    mock_response = Mock()
+    mock_response.status_code = 304
+    mock_requests_get.return_value = mock_response
+
+    # Execute
+    result = jenkins_get_recent_failed_builds(24)
+
+    # Verify
+    assert mock_requests_get.call_args[1]["headers"] == {
+      "If-None-Match": '"abc123"',
+      "If-Modified-Since": "Sun, 02 Jan 2022 12:00:00 GMT",
+    }
+    mock_response.json.assert_not_called()
+    assert len(result) == 1
+    assert result[0]["job_name"] == "failed-job"
+    assert result[0]["build_number"] == 7
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
+  def test_jenkins_get_recent_failed_builds_fetches_jobs_in_chunks(
+    self, mock_get_cache, mock_check_credentials, mock_get_constants, mock_requests_get
+  ):
+    """Test that a full chunk triggers a request for the next job range."""
+    # Setup
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_get_cache.return_value = mock_cache
+    mock_check_credentials.return_value = None
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    }
+
+    full_chunk = Mock(status_code=200, headers={})
+    full_chunk.json.return_value = {
+      "jobs": [{"name": f"job-{i}", "lastBuild": None} for i in range(200)]
+    }
+    last_chunk = Mock(status_code=200, headers={})
+    last_chunk.json.return_value = {"jobs": [{"name": "job-200", "lastBuild": None}]}
+    mock_requests_get.side_effect = [full_chunk, last_chunk]
+
+    # Execute
+    result = jenkins_get_recent_failed_builds(24)
+
+    # Verify
+    assert result == []
+    assert mock_requests_get.call_count == 2
+    assert mock_requests_get.call_args_list[0][0][0].endswith("{0,200}")
+    assert mock_requests_get.call_args_list[1][0][0].endswith("{200,400}")
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
+  def test_jenkins_get_recent_failed_builds_scans_past_1000_jobs(
+    self, mock_get_cache, mock_check_credentials, mock_get_constants, mock_requests_get
+  ):
+    """Test that paging continues until a short chunk, however many jobs exist."""
+    # Setup
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_get_cache.return_value = mock_cache
+    mock_check_credentials.return_value = None
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    }
+
+    recent = int(datetime.now().timestamp() * 1000)
+    full_chunks = []
+    for page in range(6):
+      full_chunk = Mock(status_code=200, headers={})
+      full_chunk.json.return_value = {
+        "jobs": [
+          {"name": f"job-{i}", "lastBuild": None}
+          for i in range(page * 200, (page + 1) * 200)
+        ]
+      }
+      full_chunks.append(full_chunk)
+    last_chunk = Mock(status_code=200, headers={})
+    last_chunk.json.return_value = {
+      "jobs": [
+        {
+          "name": "job-1200",
+          "url": "http://jenkins.example.com/job/job-1200/",
+          "lastBuild": {"number": 3, "timestamp": recent, "result": "FAILURE"},
+        }
+      ]
+    }
+    mock_requests_get.side_effect = full_chunks + [last_chunk]
+
+    # Execute
+    result = jenkins_get_recent_failed_builds(24)
+
+    # Verify
+    assert mock_requests_get.call_count == 7
+    assert mock_requests_get.call_args_list[6][0][0].endswith("{1200,1400}")
+    assert [build["job_name"] for build in result] == ["job-1200"]
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_session.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_jenkins_constants")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds._get_cache")
+  def test_jenkins_get_recent_failed_builds_server_ignores_range(
+    self, mock_get_cache, mock_check_credentials, mock_get_constants, mock_requests_get
+  ):
+    """Test that paging stops when every range returns the same full job list."""
+    # Setup
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_get_cache.return_value = mock_cache
+    mock_check_credentials.return_value = None
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    }
+
+    recent = int(datetime.now().timestamp() * 1000)
+    for job_count in (200, 250):
+      all_jobs = [{"name": f"job-{i}", "lastBuild": None} for i in range(job_count)]
+      all_jobs[-1]["lastBuild"] = {
+        "number": 1,
+        "timestamp": recent,
+        "result": "FAILURE",
+        "url": "http://jenkins.example.com/job/last/1/",
+      }
+      full_list = Mock(status_code=200, headers={})
+      full_list.json.return_value = {"jobs": all_jobs}
+      mock_requests_get.reset_mock()
+      mock_requests_get.side_effect = None
+      mock_requests_get.return_value = full_list
+
+      # Execute
+      result = jenkins_get_recent_failed_builds(24)
+
+      # Verify - each job is reported once and paging stopped
+      assert [build["job_name"] for build in result] == [f"job-{job_count - 1}"]
+      assert mock_requests_get.call_count <= 2
+
+
+class TestJenkinsRecentFailedBuildsWithDetails:
+  """Test class for recent failed builds with per-build details."""
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_get_build_log_tail")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_get_build_parameters")
+  @patch(
+    "src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_get_recent_failed_builds"
+  )
+  def test_adds_parameters_and_log_to_each_build(
+    self, mock_failed_builds, mock_get_parameters, mock_get_log
+  ):
+    """Test that every failed build gets its parameters and log, in order."""
+    mock_failed_builds.return_value = [
+      {"job_name": "job-a", "build_number": 1},
+      {"job_name": "job-b", "build_number": 2},
+    ]
+    mock_get_parameters.side_effect = lambda job, number: [{"job": job}]
+    mock_get_log.side_effect = lambda job, number, lines: f"{job}#{number}"
+
+    result = jenkins_get_recent_failed_builds_with_details(12, log_lines=20)
+
+    assert result == [
+      {
+        "job_name": "job-a",
+        "build_number": 1,
+        "parameters": [{"job": "job-a"}],
+        "log": "job-a#1",
+      },
+      {
+        "job_name": "job-b",
+        "build_number": 2,
+        "parameters": [{"job": "job-b"}],
+        "log": "job-b#2",
+      },
+    ]
+    mock_failed_builds.assert_called_once_with(12)
+    mock_get_log.assert_any_call("job-a", 1, 20)
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_get_build_parameters")
+  @patch(
+    "src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_get_recent_failed_builds"
+  )
+  def test_returns_error_without_fetching_details(
+    self, mock_failed_builds, mock_get_parameters
+  ):
+    """Test that an error from the failed builds query is passed through."""
+    mock_failed_builds.return_value = {"error": "Jenkins API Request Error"}
+
+    result = jenkins_get_recent_failed_builds_with_details()
+
+    assert result == {"error": "Jenkins API Request Error"}
+    mock_get_parameters.assert_not_called()
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_get_build_log_tail")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_get_build_parameters")
+  @patch(
+    "src.devops_mcps.utils.jenkins.jenkins_builds.jenkins_get_recent_failed_builds"
+  )
+  def test_job_prefix_skips_details_of_other_jobs(
+    self, mock_failed_builds, mock_get_parameters, mock_get_log
+  ):
+    """Test that only builds of jobs matching job_prefix get follow-up requests."""
+    mock_failed_builds.return_value = [
+      {"job_name": "team-a-build", "build_number": 1},
+      {"job_name": "team-b-build", "build_number": 2},
+    ]
+    mock_get_parameters.return_value = {}
+    mock_get_log.return_value = "log"
+
+    result = jenkins_get_recent_failed_builds_with_details(job_prefix="team-a-")
+
+    assert [build["job_name"] for build in result] == ["team-a-build"]
+    mock_get_parameters.assert_called_once_with("team-a-build", 1)
+    mock_get_log.assert_called_once_with("team-a-build", 1, 50)
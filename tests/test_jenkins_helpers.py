@@ -6,11 +6,14 @@ import sys
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from devops_mcps.cache import CacheManager
 from devops_mcps.utils.jenkins.jenkins_helpers import (
+  _cache_key,
   _get_jenkins_client,
   _get_jenkins_constants,
   _get_to_dict,
   _get_cache,
+  _jenkins_api_json,
   check_jenkins_credentials,
 )
 
@@ -20,21 +23,12 @@ class TestJenkinsHelpers(unittest.TestCase):
 
   def setUp(self):
     """Set up test fixtures"""
-    # Clear any existing environment variables
-    self.original_env = {}
+    # Clear any existing environment variables; restored automatically on cleanup
+    env_patcher = patch.dict(os.environ)
+    env_patcher.start()
+    self.addCleanup(env_patcher.stop)
     for key in ["JENKINS_URL", "JENKINS_USERNAME", "JENKINS_TOKEN"]:
-      self.original_env[key] = os.environ.get(key)
-      if key in os.environ:
-        del os.environ[key]
-
-  def tearDown(self):
-    """Clean up after tests"""
-    # Restore original environment variables
-    for key, value in self.original_env.items():
-      if value is not None:
-        os.environ[key] = value
-      elif key in os.environ:
-        del os.environ[key]
+      os.environ.pop(key, None)
 
   @patch("sys.modules")
   def test_get_jenkins_client_with_jenkins_api_module(self, mock_modules):
@@ -226,6 +220,43 @@ class TestJenkinsHelpers(unittest.TestCase):
     }
     self.assertEqual(result, expected)
 
+  def test_cache_key(self):
+    """Test _cache_key joins the domain and ids under the jenkins prefix"""
+    self.assertEqual(
+      _cache_key("build_log", "my-job", 12, 0, 50), "jenkins:build_log:my-job:12:0:50"
+    )
+    self.assertEqual(_cache_key("jobs", "all"), "jenkins:jobs:all")
+
+  @patch("devops_mcps.utils.jenkins.jenkins_helpers.jenkins_session")
+  @patch("devops_mcps.utils.jenkins.jenkins_helpers._get_cache")
+  @patch("devops_mcps.utils.jenkins.jenkins_helpers._get_jenkins_constants")
+  def test_jenkins_api_json_revalidates_with_etag(
+    self, mock_get_constants, mock_get_cache, mock_session
+  ):
+    """Test _jenkins_api_json sends If-None-Match and reuses the body on 304"""
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "user",
+      "JENKINS_TOKEN": "token",
+    }
+    mock_get_cache.return_value = CacheManager()
+    fresh = MagicMock(status_code=200, headers={"ETag": '"abc"'})
+    fresh.json.return_value = {"views": [{"name": "all"}]}
+    not_modified = MagicMock(status_code=304)
+    mock_session.get.side_effect = [fresh, not_modified]
+
+    first = _jenkins_api_json("http://jenkins.example.com/", "views[name]")
+    second = _jenkins_api_json("http://jenkins.example.com/", "views[name]")
+
+    self.assertEqual(first, {"views": [{"name": "all"}]})
+    self.assertEqual(second, first)
+    first_call, second_call = mock_session.get.call_args_list
+    self.assertEqual(first_call.args[0], "http://jenkins.example.com/api/json")
+    self.assertEqual(first_call.kwargs["params"], {"tree": "views[name]", "depth": 0})
+    self.assertEqual(first_call.kwargs["headers"], {})
+    self.assertEqual(second_call.kwargs["headers"], {"If-None-Match": '"abc"'})
+    not_modified.raise_for_status.assert_not_called()
+
 
 if __name__ == "__main__":
   unittest.main()
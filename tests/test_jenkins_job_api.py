@@ -1,9 +1,13 @@
 """Tests for jenkins_job_api module."""
 
 from unittest.mock import Mock, MagicMock, patch
-from jenkinsapi.jenkins import JenkinsAPIException
 
+import requests
+from jenkinsapi.jenkins import Jenkins
+
+from devops_mcps.cache import CacheManager
 from devops_mcps.utils.jenkins.jenkins_job_api import (
+  JOBS_TREE,
   _get_jenkins_client,
   _get_jenkins_constants,
   _get_to_dict,
@@ -194,9 +198,9 @@ class TestJenkinsGetJobs:
   @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_cache")
   @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_jenkins_client")
   @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_jenkins_constants")
-  @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_to_dict")
+  @patch("devops_mcps.utils.jenkins.jenkins_job_api._jenkins_api_json")
   def test_jenkins_get_jobs_success(
-    self, mock_get_to_dict, mock_get_constants, mock_get_client, mock_get_cache
+    self, mock_api_json, mock_get_constants, mock_get_client, mock_get_cache
   ):
     """Test successful jenkins_get_jobs."""
     # Setup mocks
@@ -204,13 +208,7 @@ class TestJenkinsGetJobs:
     mock_cache.get.return_value = None
     mock_get_cache.return_value = mock_cache
 
-    mock_client = Mock()
-    mock_job1 = Mock()
-    mock_job1.name = "job1"
-    mock_job2 = Mock()
-    mock_job2.name = "job2"
-    mock_client.values.return_value = [mock_job1, mock_job2]
-    mock_get_client.return_value = mock_client
+    mock_get_client.return_value = MagicMock(spec=Jenkins)
 
     mock_get_constants.return_value = {
       "JENKINS_URL": "http://test-jenkins.com",
@@ -218,18 +216,68 @@ class TestJenkinsGetJobs:
       "JENKINS_TOKEN": "test_token",
     }
 
-    mock_to_dict = Mock(side_effect=lambda x: f"dict_{x.name}")
-    mock_get_to_dict.return_value = mock_to_dict
+    mock_api_json.return_value = {
+      "jobs": [
+        {
+          "name": "job1",
+          "url": "http://test-jenkins.com/job/job1/",
+          "color": "red",
+          "inQueue": False,
+          "lastBuild": {"number": 3, "url": "http://test-jenkins.com/job/job1/3/"},
+        }
+      ]
+    }
 
     # Execute
     result = jenkins_get_jobs()
 
     # Verify
-    assert result == ["dict_job1", "dict_job2"]
-    mock_cache.set.assert_called_once_with(
-      "jenkins:jobs:all", ["dict_job1", "dict_job2"], ttl=300
+    expected = [
+      {
+        "name": "job1",
+        "url": "http://test-jenkins.com/job/job1",
+        "is_enabled": True,
+        "is_queued": False,
+        "in_queue": False,
+        "last_build_number": 3,
+        "last_build_url": "http://test-jenkins.com/job/job1/3/",
+      }
+    ]
+    assert result == expected
+    mock_api_json.assert_called_once_with("http://test-jenkins.com", JOBS_TREE)
+    mock_cache.set_adaptive.assert_called_once_with(
+      "jenkins:jobs:all", expected, changed=True, min_ttl=30, max_ttl=600
     )
 
+  @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_cache")
+  @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_jenkins_client")
+  @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_jenkins_constants")
+  @patch("devops_mcps.utils.jenkins.jenkins_job_api._jenkins_api_json")
+  def test_jenkins_get_jobs_unchanged_list_extends_ttl(
+    self, mock_api_json, mock_get_constants, mock_get_client, mock_get_cache
+  ):
+    """Test that refetching an unchanged job list lets its TTL grow."""
+    cache = CacheManager()
+    mock_get_cache.return_value = cache
+    mock_get_client.return_value = MagicMock(spec=Jenkins)
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://test-jenkins.com",
+      "JENKINS_USER": "test_user",
+      "JENKINS_TOKEN": "test_token",
+    }
+    mock_api_json.return_value = {
+      "jobs": [
+        {"name": "job1", "url": "http://test-jenkins.com/job/job1/", "color": "blue"}
+      ]
+    }
+
+    with patch.object(cache, "set_adaptive", wraps=cache.set_adaptive) as spy:
+      jenkins_get_jobs()
+      cache.delete("jenkins:jobs:all")
+      jenkins_get_jobs()
+
+    assert [c.kwargs["changed"] for c in spy.call_args_list] == [True, False]
+
   @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_cache")
   @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_jenkins_client")
   def test_jenkins_get_jobs_client_none(self, mock_get_client, mock_get_cache):
@@ -282,19 +330,18 @@ class TestJenkinsGetJobs:
   @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_cache")
   @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_jenkins_client")
   @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_jenkins_constants")
-  @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_to_dict")
-  def test_jenkins_get_jobs_jenkins_api_exception(
-    self, mock_get_to_dict, mock_get_constants, mock_get_client, mock_get_cache
+  @patch("devops_mcps.utils.jenkins.jenkins_job_api._jenkins_api_json")
+  def test_jenkins_get_jobs_request_exception(
+    self, mock_api_json, mock_get_constants, mock_get_client, mock_get_cache
   ):
-    """Test jenkins_get_jobs with JenkinsAPIException."""
+    """Test jenkins_get_jobs when the Jenkins request fails."""
     # Setup mocks
     mock_cache = Mock()
     mock_cache.get.return_value = None
     mock_get_cache.return_value = mock_cache
 
-    mock_client = Mock()
-    mock_client.values.side_effect = JenkinsAPIException("API error")
-    mock_get_client.return_value = mock_client
+    mock_get_client.return_value = MagicMock(spec=Jenkins)
+    mock_api_json.side_effect = requests.exceptions.ConnectionError("refused")
 
     mock_get_constants.return_value = {
       "JENKINS_URL": "http://test-jenkins.com",
@@ -302,22 +349,18 @@ class TestJenkinsGetJobs:
       "JENKINS_TOKEN": "test_token",
     }
 
-    mock_to_dict = Mock()
-    mock_get_to_dict.return_value = mock_to_dict
-
     # Execute
     result = jenkins_get_jobs()
 
     # Verify
-    assert "error" in result
-    assert "Jenkins API Error" in result["error"]
+    assert result == {"error": "Jenkins API Request Error"}
 
   @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_cache")
   @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_jenkins_client")
   @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_jenkins_constants")
-  @patch("devops_mcps.utils.jenkins.jenkins_job_api._get_to_dict")
+  @patch("devops_mcps.utils.jenkins.jenkins_job_api._jenkins_api_json")
   def test_jenkins_get_jobs_general_exception(
-    self, mock_get_to_dict, mock_get_constants, mock_get_client, mock_get_cache
+    self, mock_api_json, mock_get_constants, mock_get_client, mock_get_cache
   ):
     """Test jenkins_get_jobs with general exception."""
     # Setup mocks
@@ -325,9 +368,8 @@ class TestJenkinsGetJobs:
     mock_cache.get.return_value = None
     mock_get_cache.return_value = mock_cache
 
-    mock_client = Mock()
-    mock_client.values.side_effect = ValueError("Unexpected error")
-    mock_get_client.return_value = mock_client
+    mock_get_client.return_value = MagicMock(spec=Jenkins)
+    mock_api_json.side_effect = ValueError("Unexpected error")
 
     mock_get_constants.return_value = {
       "JENKINS_URL": "http://test-jenkins.com",
@@ -335,9 +377,6 @@ class TestJenkinsGetJobs:
       "JENKINS_TOKEN": "test_token",
     }
 
-    mock_to_dict = Mock()
-    mock_get_to_dict.return_value = mock_to_dict
-
     # Execute
     result = jenkins_get_jobs()
 
@@ -359,4 +398,4 @@ class TestJenkinsGetJobs:
 
     # Verify
     assert result == cached_data
-    mock_cache.get.assert_called_once_with("jenkins:jobs:all")
\ No newline at end of file
+    mock_cache.get.assert_called_once_with("jenkins:jobs:all")
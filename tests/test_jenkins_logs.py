@@ -2,7 +2,10 @@
 
 from unittest.mock import Mock, patch
 import requests
-from src.devops_mcps.utils.jenkins.jenkins_logs import jenkins_get_build_log
+from src.devops_mcps.utils.jenkins.jenkins_logs import (
+  jenkins_get_build_log,
+  jenkins_get_build_log_tail,
+)
 
 
 class TestJenkinsBuildLogs:
@@ -43,7 +46,7 @@ class TestJenkinsBuildLogs:
     # Verify
     assert result == {"error": "Jenkins credentials not configured"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
@@ -63,7 +66,9 @@ class TestJenkinsBuildLogs:
     }
 
     mock_response = Mock()
-    mock_response.text = "Line 1\nLine 2\nLine 3\nLine 4\nLine 5"
+    mock_response.iter_content.return_value = [
+      b"Line 1\nLine 2\nLine 3\nLine 4\nLine 5"
+    ]
     mock_response.raise_for_status.return_value = None
     mock_requests_get.return_value = mock_response
 
@@ -73,15 +78,16 @@ class TestJenkinsBuildLogs:
     # Verify
     assert result == "Line 2\nLine 3"
     mock_requests_get.assert_called_once_with(
-      "http://jenkins.example.com/job/test-job/123/consoleText",
+      "http://jenkins.example.com/job/test-job/123/logText/progressiveText?start=0",
       auth=("testuser", "testtoken"),
       timeout=30,
+      stream=True,
     )
     mock_cache.set.assert_called_once_with(
-      "jenkins:build_log:test-job:123:1:2", "Line 2\nLine 3", ttl=300
+      "jenkins:build_log:test-job:123:1:2", "Line 2\nLine 3", ttl=7 * 86400
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
@@ -107,7 +113,9 @@ class TestJenkinsBuildLogs:
 
     # Mock console output response
     console_response = Mock()
-    console_response.text = "Latest build log content\nSecond line"
+    console_response.iter_content.return_value = [
+      b"Latest build log content\nSecond line"
+    ]
     console_response.raise_for_status.return_value = None
 
     mock_requests_get.side_effect = [job_response, console_response]
@@ -124,12 +132,18 @@ class TestJenkinsBuildLogs:
       timeout=30,
     )
     mock_requests_get.assert_any_call(
-      "http://jenkins.example.com/job/test-job/456/consoleText",
+      "http://jenkins.example.com/job/test-job/456/logText/progressiveText?start=0",
       auth=("testuser", "testtoken"),
       timeout=30,
+      stream=True,
+    )
+    mock_cache.set.assert_called_once_with(
+      "jenkins:build_log:test-job:0:0:50",
+      "Latest build log content\nSecond line",
+      ttl=300,
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
@@ -159,7 +173,7 @@ class TestJenkinsBuildLogs:
     # Verify
     assert result == {"error": "No builds found for job test-job"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
@@ -179,7 +193,7 @@ class TestJenkinsBuildLogs:
     }
 
     mock_response = Mock()
-    mock_response.text = ""
+    mock_response.iter_content.return_value = [b""]
     mock_response.raise_for_status.return_value = None
     mock_requests_get.return_value = mock_response
 
@@ -189,7 +203,7 @@ class TestJenkinsBuildLogs:
     # Verify
     assert result == {"error": "No console output found for build 123"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
@@ -219,7 +233,7 @@ class TestJenkinsBuildLogs:
     # Verify
     assert result == {"error": "Job 'nonexistent-job' or build 999 not found."}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
@@ -249,7 +263,7 @@ class TestJenkinsBuildLogs:
     # Verify
     assert result == {"error": "Jenkins API HTTP Error: 500"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
@@ -278,7 +292,7 @@ class TestJenkinsBuildLogs:
     # Verify
     assert result == {"error": "Could not connect to Jenkins API"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
@@ -305,7 +319,7 @@ class TestJenkinsBuildLogs:
     # Verify
     assert result == {"error": "Timeout connecting to Jenkins API"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
@@ -334,7 +348,7 @@ class TestJenkinsBuildLogs:
     # Verify
     assert result == {"error": "Jenkins API Request Error"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
@@ -361,7 +375,7 @@ class TestJenkinsBuildLogs:
     # Verify
     assert result == {"error": "An unexpected error occurred: Unexpected error"}
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
@@ -381,7 +395,9 @@ class TestJenkinsBuildLogs:
     }
 
     mock_response = Mock()
-    mock_response.text = "Line 0\nLine 1\nLine 2\nLine 3\nLine 4\nLine 5"
+    mock_response.iter_content.return_value = [
+      b"Line 0\nLine 1\nLine 2\nLine 3\nLine 4\nLine 5"
+    ]
     mock_response.raise_for_status.return_value = None
     mock_requests_get.return_value = mock_response
 
@@ -390,3 +406,194 @@ class TestJenkinsBuildLogs:
 
     # Verify - should return from line 3 to end
     assert result == "Line 3\nLine 4\nLine 5"
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
+  def test_jenkins_get_build_log_stops_reading_after_requested_lines(
+    self, mock_get_cache, mock_check_credentials, mock_get_constants, mock_requests_get
+  ):
+    """Test that the console stream is not read past the requested lines."""
+    # Setup
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_get_cache.return_value = mock_cache
+    mock_check_credentials.return_value = None
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    }
+
+    chunks = iter([b"Line 0\nLine 1\n", b"Line 2\nLine 3\n", b"Line 4\n"])
+    mock_response = Mock()
+    mock_response.iter_content.return_value = chunks
+    mock_response.raise_for_status.return_value = None
+    mock_requests_get.return_value = mock_response
+
+    # Execute
+    result = jenkins_get_build_log("test-job", 123, 1, 2)
+
+    # Verify - the last chunk was never consumed and the stream was closed
+    assert result == "Line 1\nLine 2"
+    assert next(chunks) == b"Line 4\n"
+    mock_response.close.assert_called_once()
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
+  def test_jenkins_get_build_log_decodes_utf8_split_across_chunks(
+    self, mock_get_cache, mock_check_credentials, mock_get_constants, mock_requests_get
+  ):
+    """Test that a multi-byte character split between chunks is decoded intact."""
+    # Setup
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_get_cache.return_value = mock_cache
+    mock_check_credentials.return_value = None
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    }
+
+    encoded = "Caf\u00e9 ready\n".encode("utf-8")
+    mock_response = Mock()
+    mock_response.iter_content.return_value = [encoded[:4], encoded[4:]]
+    mock_response.raise_for_status.return_value = None
+    mock_requests_get.return_value = mock_response
+
+    # Execute
+    result = jenkins_get_build_log("test-job", 123, 0, 1)
+
+    # Verify
+    assert result == "Caf\u00e9 ready"
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
+  def test_jenkins_get_build_log_running_build_cached_briefly(
+    self, mock_get_cache, mock_check_credentials, mock_get_constants, mock_requests_get
+  ):
+    """Test that the log of a build that is still running gets a short TTL."""
+    # Setup
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_get_cache.return_value = mock_cache
+    mock_check_credentials.return_value = None
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    }
+
+    mock_response = Mock()
+    mock_response.headers = {"X-More-Data": "true"}
+    mock_response.iter_content.return_value = [b"Building...\n"]
+    mock_response.raise_for_status.return_value = None
+    mock_requests_get.return_value = mock_response
+
+    # Execute
+    result = jenkins_get_build_log("test-job", 123, 0, 1)
+
+    # Verify
+    assert result == "Building..."
+    mock_cache.set.assert_called_once_with(
+      "jenkins:build_log:test-job:123:0:1", "Building...", ttl=15
+    )
+
+
+class TestJenkinsBuildLogTail:
+  """Test class for jenkins_get_build_log_tail function."""
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.LOG_TAIL_BYTES_PER_LINE", 8)
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
+  def test_returns_last_lines_read_from_end_of_log(
+    self, mock_get_cache, mock_check_credentials, mock_get_constants, mock_requests_get
+  ):
+    """Test that the tail is requested from near the end and the last lines returned."""
+    # Setup
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_get_cache.return_value = mock_cache
+    mock_check_credentials.return_value = None
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    }
+
+    log = b"".join(b"Line %d\n" % number for number in range(100))
+    size_response = Mock(headers={"X-Text-Size": str(len(log))})
+    tail_response = Mock(headers={})
+    # The read starts one byte before the 16-byte window (2 lines x 8 bytes),
+    # inside "Line 97", and that partial line is dropped
+    tail_response.content = log[len(log) - 17 :]
+    mock_requests_get.side_effect = [size_response, tail_response]
+
+    # Execute
+    result = jenkins_get_build_log_tail("test-job", 123, 2)
+
+    # Verify
+    assert result == "Line 98\nLine 99"
+    size_response.close.assert_called_once()
+    size_response.iter_content.assert_not_called()
+    assert mock_requests_get.call_args_list[1][0][0] == (
+      "http://jenkins.example.com/job/test-job/123/logText/progressiveText"
+      f"?start={len(log) - 17}"
+    )
+    mock_cache.set.assert_called_once_with(
+      "jenkins:build_log_tail:test-job:123:2", "Line 98\nLine 99", ttl=7 * 86400
+    )
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.LOG_TAIL_BYTES_PER_LINE", 4)
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.jenkins_session.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_jenkins_constants")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
+  def test_widens_window_until_enough_lines(
+    self, mock_get_cache, mock_check_credentials, mock_get_constants, mock_requests_get
+  ):
+    """Test that a window holding too few lines is widened and re-read."""
+    # Setup
+    mock_cache = Mock()
+    mock_cache.get.return_value = None
+    mock_get_cache.return_value = mock_cache
+    mock_check_credentials.return_value = None
+    mock_get_constants.return_value = {
+      "JENKINS_URL": "http://jenkins.example.com",
+      "JENKINS_USER": "testuser",
+      "JENKINS_TOKEN": "testtoken",
+    }
+
+    log = b"first\nsecond line\nthird line\n"
+    size_response = Mock(headers={"X-Text-Size": str(len(log))})
+    narrow_response = Mock(headers={}, content=log[len(log) - 9 :])
+    full_response = Mock(headers={}, content=log)
+    mock_requests_get.side_effect = [size_response, narrow_response, full_response]
+
+    # Execute
+    result = jenkins_get_build_log_tail("test-job", 123, 2)
+
+    # Verify - the second window (32 bytes) covers the whole log
+    assert result == "second line\nthird line"
+    assert mock_requests_get.call_args_list[2][0][0].endswith("?start=0")
+
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs.check_jenkins_credentials")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_logs._get_cache")
+  def test_cached_result(self, mock_get_cache, mock_check_credentials):
+    """Test that a cached tail is returned without any request."""
+    mock_cache = Mock()
+    mock_cache.get.return_value = "cached tail"
+    mock_get_cache.return_value = mock_cache
+
+    result = jenkins_get_build_log_tail("test-job", 123, 2)
+
+    assert result == "cached tail"
+    mock_check_credentials.assert_not_called()
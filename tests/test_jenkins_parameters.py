@@ -3,6 +3,8 @@
 from unittest.mock import Mock, patch
 import requests
 from src.devops_mcps.utils.jenkins.jenkins_parameters import (
+  BUILD_PARAMETERS_FIXED_TTL,
+  BUILD_PARAMETERS_LATEST_TTL,
   jenkins_get_build_parameters,
 )
 
@@ -50,7 +52,7 @@ class TestJenkinsBuildParameters:
       ttl=300,
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_cache")
@@ -90,16 +92,17 @@ class TestJenkinsBuildParameters:
     assert result == {"BRANCH": "main", "VERSION": "1.0.0"}
     mock_requests_get.assert_called_once_with(
       "http://jenkins.example.com/job/test-job/123/api/json",
+      params={"tree": "number,actions[parameters[name,value]]"},
       auth=("user", "token"),
       timeout=30,
     )
     mock_cache.set.assert_called_once_with(
       "jenkins:build_parameters:test-job:123",
       {"BRANCH": "main", "VERSION": "1.0.0"},
-      ttl=300,
+      ttl=BUILD_PARAMETERS_FIXED_TTL,
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_cache")
@@ -118,41 +121,39 @@ class TestJenkinsBuildParameters:
       "JENKINS_TOKEN": "token",
     }
 
-    # Mock job response (first call)
+    # The job response carries the latest build with its parameters
     job_response = Mock()
-    job_response.json.return_value = {"lastBuild": {"number": 456}}
-
-    # Mock build response (second call)
-    build_response = Mock()
-    build_response.json.return_value = {
-      "actions": [
-        {
-          "_class": "hudson.model.ParametersAction",
-          "parameters": [{"name": "ENV", "value": "production"}],
-        }
-      ]
+    job_response.json.return_value = {
+      "lastBuild": {
+        "number": 456,
+        "actions": [
+          {
+            "_class": "hudson.model.ParametersAction",
+            "parameters": [{"name": "ENV", "value": "production"}],
+          }
+        ],
+      }
     }
-
-    mock_requests_get.side_effect = [job_response, build_response]
+    mock_requests_get.return_value = job_response
 
     # Execute
     result = jenkins_get_build_parameters("test-job", 0)
 
     # Assert
     assert result == {"ENV": "production"}
-    assert mock_requests_get.call_count == 2
-    mock_requests_get.assert_any_call(
+    mock_requests_get.assert_called_once_with(
       "http://jenkins.example.com/job/test-job/api/json",
+      params={"tree": "lastBuild[number,actions[parameters[name,value]]]"},
       auth=("user", "token"),
       timeout=30,
     )
-    mock_requests_get.assert_any_call(
-      "http://jenkins.example.com/job/test-job/456/api/json",
-      auth=("user", "token"),
-      timeout=30,
+    mock_cache.set.assert_called_once_with(
+      "jenkins:build_parameters:test-job:0",
+      {"ENV": "production"},
+      ttl=BUILD_PARAMETERS_LATEST_TTL,
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_cache")
@@ -186,7 +187,7 @@ class TestJenkinsBuildParameters:
       ttl=300,
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_cache")
@@ -215,10 +216,10 @@ class TestJenkinsBuildParameters:
     # Assert
     assert result == {}
     mock_cache.set.assert_called_once_with(
-      "jenkins:build_parameters:test-job:123", {}, ttl=300
+      "jenkins:build_parameters:test-job:123", {}, ttl=BUILD_PARAMETERS_FIXED_TTL
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_cache")
@@ -253,7 +254,7 @@ class TestJenkinsBuildParameters:
       ttl=300,
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_cache")
@@ -288,7 +289,7 @@ class TestJenkinsBuildParameters:
       ttl=300,
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_cache")
@@ -322,7 +323,7 @@ class TestJenkinsBuildParameters:
       ttl=300,
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_cache")
@@ -354,7 +355,7 @@ class TestJenkinsBuildParameters:
       ttl=300,
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_cache")
@@ -388,7 +389,7 @@ class TestJenkinsBuildParameters:
       ttl=300,
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_cache")
@@ -420,7 +421,7 @@ class TestJenkinsBuildParameters:
       ttl=300,
     )
 
-  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.requests.get")
+  @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.jenkins_session.get")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_jenkins_constants")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters.check_jenkins_credentials")
   @patch("src.devops_mcps.utils.jenkins.jenkins_parameters._get_cache")
@@ -463,5 +464,5 @@ class TestJenkinsBuildParameters:
     mock_cache.set.assert_called_once_with(
       "jenkins:build_parameters:test-job:123",
       {"VALID_PARAM": "valid_value", "ANOTHER_VALID": "another_value"},
-      ttl=300,
+      ttl=BUILD_PARAMETERS_FIXED_TTL,
     )
@@ -8,6 +8,7 @@ from devops_mcps.utils.jenkins.jenkins_view_api import (
   _get_to_dict,
   _get_cache,
   jenkins_get_all_views,
+  VIEWS_TREE,
 )
 
 
@@ -229,8 +230,14 @@ class TestJenkinsGetAllViews:
   @patch("devops_mcps.utils.jenkins.jenkins_view_api._get_to_dict")
   @patch("devops_mcps.utils.jenkins.jenkins_view_api._get_jenkins_constants")
   @patch("devops_mcps.utils.jenkins.jenkins_view_api._get_jenkins_client")
+  @patch("devops_mcps.utils.jenkins.jenkins_view_api._jenkins_api_json")
   def test_jenkins_get_all_views_success(
-    self, mock_get_client, mock_get_constants, mock_get_to_dict, mock_get_cache
+    self,
+    mock_api_json,
+    mock_get_client,
+    mock_get_constants,
+    mock_get_to_dict,
+    mock_get_cache,
   ):
     """Test jenkins_get_all_views with successful execution."""
     # Setup mocks
@@ -243,18 +250,19 @@ class TestJenkinsGetAllViews:
     mock_cache.get.return_value = None  # No cached result
     mock_get_cache.return_value = mock_cache
 
-    # Mock Jenkins client views
-    mock_view1 = MagicMock()
-    mock_view2 = MagicMock()
-    mock_client.views.keys.return_value = [mock_view1, mock_view2]
-    mock_to_dict.return_value = {"name": "view1", "url": "http://test.com/view/view1"}
+    # Mock the views tree response
+    mock_api_json.return_value = {"views": [{"name": "all"}, {"name": "nightly"}]}
+    mock_to_dict.side_effect = lambda name: name
 
     result = jenkins_get_all_views()
 
     # Verify the result
-    assert result is not None
-    mock_client.views.keys.assert_called_once()
-    mock_cache.set.assert_called_once()
+    assert result == ["all", "nightly"]
+    mock_api_json.assert_called_once_with("http://test.com", VIEWS_TREE)
+    mock_client.views.keys.assert_not_called()
+    mock_cache.set.assert_called_once_with(
+      "jenkins:views:all", ["all", "nightly"], ttl=600
+    )
 
   @patch("devops_mcps.utils.jenkins.jenkins_view_api._get_cache")
   @patch("devops_mcps.utils.jenkins.jenkins_view_api._get_to_dict")
@@ -283,8 +291,14 @@ class TestJenkinsGetAllViews:
   @patch("devops_mcps.utils.jenkins.jenkins_view_api._get_to_dict")
   @patch("devops_mcps.utils.jenkins.jenkins_view_api._get_jenkins_constants")
   @patch("devops_mcps.utils.jenkins.jenkins_view_api._get_jenkins_client")
+  @patch("devops_mcps.utils.jenkins.jenkins_view_api._jenkins_api_json")
   def test_jenkins_get_all_views_exception(
-    self, mock_get_client, mock_get_constants, mock_get_to_dict, mock_get_cache
+    self,
+    mock_api_json,
+    mock_get_client,
+    mock_get_constants,
+    mock_get_to_dict,
+    mock_get_cache,
   ):
     """Test jenkins_get_all_views when an exception occurs."""
     mock_cache = MagicMock()
@@ -292,7 +306,7 @@ class TestJenkinsGetAllViews:
     mock_get_cache.return_value = mock_cache
     mock_client = MagicMock()
     mock_get_client.return_value = mock_client
-    mock_client.views.keys.side_effect = Exception("Test exception")
+    mock_api_json.side_effect = Exception("Test exception")
 
     result = jenkins_get_all_views()
 
@@ -316,13 +330,19 @@ class TestJenkinsGetAllViews:
   @patch("devops_mcps.utils.jenkins.jenkins_view_api._get_to_dict")
   @patch("devops_mcps.utils.jenkins.jenkins_view_api._get_jenkins_constants")
   @patch("devops_mcps.utils.jenkins.jenkins_view_api._get_jenkins_client")
+  @patch("devops_mcps.utils.jenkins.jenkins_view_api._jenkins_api_json")
   def test_jenkins_get_all_views_jenkins_api_exception(
-    self, mock_get_client, mock_get_constants, mock_get_to_dict, mock_get_cache
+    self,
+    mock_api_json,
+    mock_get_client,
+    mock_get_constants,
+    mock_get_to_dict,
+    mock_get_cache,
   ):
     """Test jenkins_get_all_views when Jenkins API raises an exception."""
     # Setup mocks
     mock_client = MagicMock()
-    mock_client.views.keys.side_effect = Exception("Jenkins API error")
+    mock_api_json.side_effect = Exception("Jenkins API error")
     mock_get_client.return_value = mock_client
     mock_get_constants.return_value = {
       "JENKINS_URL": "http://test-jenkins.com",
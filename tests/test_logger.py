@@ -21,26 +21,16 @@ def reset_logging_and_env():
   logging.shutdown()  # Shut down existing handlers (might be redundant now but safe)
   logging.root.handlers.clear()  # Explicitly clear root handlers
 
-  # Clear relevant env vars before each test
-  env_vars_to_clear = ["LOG_LEVEL"]
-  original_values = {var: os.environ.get(var) for var in env_vars_to_clear}
-  for var in env_vars_to_clear:
-    if var in os.environ:
-      del os.environ[var]
-
-  # --- Crucial: Reload logger module here to reset its initial state ---
-  # This ensures the default LOG_LEVEL is re-evaluated based on the clean env
-  importlib.reload(logger)
+  # Clear relevant env vars for the duration of the test; patch.dict restores
+  # the original environment on exit.
+  with mock.patch.dict(os.environ):
+    os.environ.pop("LOG_LEVEL", None)
 
-  yield  # Run the test
+    # --- Crucial: Reload logger module here to reset its initial state ---
+    # This ensures the default LOG_LEVEL is re-evaluated based on the clean env
+    importlib.reload(logger)
 
-  # Restore original env vars
-  for var, value in original_values.items():
-    if value is None:
-      if var in os.environ:
-        del os.environ[var]
-    else:
-      os.environ[var] = value
+    yield  # Run the test
 
   # --- Reload logger module again after test to reflect restored env (optional but good practice) ---
   importlib.reload(logger)